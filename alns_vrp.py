@@ -0,0 +1,600 @@
+"""
+alns_vrp.py
+
+Adaptive Large Neighborhood Search (ruin & recreate) untuk CVRP.
+
+Setiap iterasi: sebagian customer dilepas dari solusi (destroy), lalu
+disisipkan kembali (repair). Operator dipilih dengan roulette wheel yang
+bobotnya diadaptasi per segmen (Ropke & Pisinger 2006); solusi kandidat
+diterima dengan kriteria simulated annealing.
+
+- destroy : random, worst (saving terbesar), shaw (related: jarak + demand)
+- repair  : greedy (cheapest insertion), regret-2, regret-3
+
+Solusi disimpan sebagai list rute [0, ..., 0] dengan load & cost per rute
+di-cache; biaya insertion terbaik per (rute, customer) di-cache selama repair
+dan hanya dihitung ulang untuk rute yang berubah. Insertion & shaw removal
+memakai neighbor list (k customer terdekat) supaya tetap murah untuk ribuan
+customer. Semua rute selalu feasible (customer yang tidak muat di rute mana
+pun membuka rute baru).
+
+    python alns_vrp.py 1_FaridFajar.vrp 5
+    python alns_vrp.py big.vrp 3 greedy,savings     # solusi awal konstruktif terbaik
+"""
+
+import random
+import sys
+import os
+import time
+import math
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable
+
+import matplotlib.pyplot as plt
+
+from parser import load_cvrp_instance
+from constructive import ROUTE_BUILDERS, greedy_routes, routes_to_chromosome, parse_seed_with
+from convergence import append_trace_csv
+import results_store
+import instrument
+import profiling
+import timing
+
+# --------------------------------------------------------------------
+# Konfigurasi & Load Instance
+# --------------------------------------------------------------------
+# argumen posisi; flag "--..." (mis. --profile) diabaikan
+ARGS = [a for a in sys.argv if not a.startswith("--")]
+INSTANCE_FILE = ARGS[1] if len(ARGS) > 1 else "output_cvrp.vrp"
+with timing.phase("setup"):
+    N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
+DEPOT = 0
+CUSTOMERS = list(range(1, N))
+
+# satu eval = satu solusi kandidat (destroy + repair) yang dievaluasi
+FITNESS_EVALS = 0
+
+DESTROY_OPS = ("random", "worst", "shaw")
+REPAIR_OPS = ("greedy", "regret2", "regret3")
+
+# skor operator per iterasi (Ropke & Pisinger 2006)
+SCORE_BEST = 33.0      # menghasilkan best global baru
+SCORE_BETTER = 9.0     # lebih baik dari current
+SCORE_ACCEPTED = 13.0  # lebih buruk tapi diterima
+
+WORST_P = 3.0          # randomisasi worst removal (makin besar makin deterministik)
+SHAW_P = 6.0           # randomisasi shaw removal
+SHAW_DIST = 9.0        # bobot jarak pada relatedness
+SHAW_DEMAND = 2.0      # bobot selisih demand pada relatedness
+
+# neighbor list: dihitung sekali per instance (lihat neighbor_lists)
+_NEIGHBORS: Dict[int, List[List[int]]] = {}
+
+
+# --------------------------------------------------------------------
+# Representasi solusi: rute + load & cost per rute (di-cache)
+# --------------------------------------------------------------------
+def route_cost(route: List[int]) -> float:
+    cost = 0.0
+    for i in range(len(route) - 1):
+        cost += DIST[route[i]][route[i + 1]]
+    return cost
+
+
+def solution_cost(routes: List[List[int]]) -> float:
+    return sum(route_cost(r) for r in routes)
+
+
+def make_solution(routes: List[List[int]]) -> Dict[str, Any]:
+    """{"routes", "loads", "costs"} dari list rute [0, ..., 0] (rute kosong dibuang)."""
+    routes = [r[:] for r in routes if len(r) > 2]
+    return {
+        "routes": routes,
+        "loads": [sum(DEMAND[c] for c in r) for r in routes],
+        "costs": [route_cost(r) for r in routes],
+    }
+
+
+def copy_solution(sol: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "routes": [r[:] for r in sol["routes"]],
+        "loads": sol["loads"][:],
+        "costs": sol["costs"][:],
+    }
+
+
+def total_cost(sol: Dict[str, Any]) -> float:
+    return sum(sol["costs"])
+
+
+def decode_routes(chromosome: List[int]) -> List[List[int]]:
+    """Split greedy kromosom → rute (untuk initial_chrom dari solver lain)."""
+    routes = []
+    route = [DEPOT]
+    load = 0.0
+    for cust in chromosome:
+        demand = DEMAND[cust]
+        if load + demand > CAPACITY and route != [DEPOT]:
+            route.append(DEPOT)
+            routes.append(route)
+            route = [DEPOT, cust]
+            load = demand
+        else:
+            route.append(cust)
+            load += demand
+    route.append(DEPOT)
+    routes.append(route)
+    return routes
+
+
+def neighbor_lists(k: int) -> List[List[int]]:
+    """k customer terdekat (jarak keluar DIST[i][j]) untuk setiap node."""
+    if k not in _NEIGHBORS:
+        lists = [[] for _ in range(N)]
+        for i in CUSTOMERS:
+            row = DIST[i]
+            nearest = sorted(CUSTOMERS, key=row.__getitem__)[: k + 1]
+            lists[i] = [j for j in nearest if j != i][:k]
+        _NEIGHBORS[k] = lists
+    return _NEIGHBORS[k]
+
+
+# --------------------------------------------------------------------
+# Destroy
+# --------------------------------------------------------------------
+def remove_customers(sol: Dict[str, Any], removed: List[int]):
+    """Lepas customer dari solusi; load & cost hanya dihitung ulang untuk rute yang berubah."""
+    removed_set = set(removed)
+    routes, loads, costs = sol["routes"], sol["loads"], sol["costs"]
+    for ri, route in enumerate(routes):
+        if removed_set.isdisjoint(route):
+            continue
+        new_route = [c for c in route if c not in removed_set]
+        routes[ri] = new_route
+        loads[ri] = sum(DEMAND[c] for c in new_route)
+        costs[ri] = route_cost(new_route)
+    keep = [ri for ri, r in enumerate(routes) if len(r) > 2]
+    if len(keep) != len(routes):
+        sol["routes"] = [routes[ri] for ri in keep]
+        sol["loads"] = [loads[ri] for ri in keep]
+        sol["costs"] = [costs[ri] for ri in keep]
+
+
+def random_removal(sol: Dict[str, Any], q: int, neighbors: List[List[int]]) -> List[int]:
+    return random.sample(CUSTOMERS, q)
+
+
+def worst_removal(sol: Dict[str, Any], q: int, neighbors: List[List[int]]) -> List[int]:
+    """
+    Customer dengan saving terbesar d(prev,c) + d(c,next) - d(prev,next).
+    Saving dihitung sekali per iterasi, lalu q customer dipilih dengan bias
+    ke atas (indeks y^WORST_P × sisa).
+    """
+    savings = []
+    for route in sol["routes"]:
+        for idx in range(1, len(route) - 1):
+            a, c, b = route[idx - 1], route[idx], route[idx + 1]
+            savings.append((DIST[a][c] + DIST[c][b] - DIST[a][b], c))
+    savings.sort(reverse=True)
+    candidates = [c for _, c in savings]
+
+    removed = []
+    for _ in range(q):
+        idx = int(random.random() ** WORST_P * len(candidates))
+        removed.append(candidates.pop(idx))
+    return removed
+
+
+def shaw_removal(sol: Dict[str, Any], q: int, neighbors: List[List[int]]) -> List[int]:
+    """
+    Related removal: mulai dari customer acak, lalu berulang pilih customer
+    yang sudah dilepas dan lepas tetangganya yang paling related
+    (jarak + selisih demand; kandidat dari neighbor list).
+    """
+    max_dist = max(max(DIST[0]), 1)
+    max_demand = max(max(DEMAND), 1)
+
+    removed = [random.choice(CUSTOMERS)]
+    removed_set = set(removed)
+    while len(removed) < q:
+        ref = random.choice(removed)
+        candidates = [j for j in neighbors[ref] if j not in removed_set]
+        if not candidates:
+            # neighbor list habis → lompat ke customer acak lain
+            candidates = [c for c in random.sample(CUSTOMERS, min(len(CUSTOMERS), q + len(removed)))
+                          if c not in removed_set]
+            if not candidates:
+                break
+            pick = candidates[0]
+        else:
+            candidates.sort(key=lambda j: (
+                SHAW_DIST * (DIST[ref][j] + DIST[j][ref]) / (2 * max_dist)
+                + SHAW_DEMAND * abs(DEMAND[ref] - DEMAND[j]) / max_demand
+            ))
+            pick = candidates[int(random.random() ** SHAW_P * len(candidates))]
+        removed.append(pick)
+        removed_set.add(pick)
+    return removed
+
+
+DESTROY = {"random": random_removal, "worst": worst_removal, "shaw": shaw_removal}
+
+
+# --------------------------------------------------------------------
+# Repair
+# --------------------------------------------------------------------
+def best_insertion(route: List[int], cust: int):
+    """(delta cost, posisi) insertion termurah cust ke route [0, ..., 0]."""
+    best_delta = float("inf")
+    best_pos = 1
+    row_c = DIST[cust]
+    for pos in range(1, len(route)):
+        a, b = route[pos - 1], route[pos]
+        delta = DIST[a][cust] + row_c[b] - DIST[a][b]
+        if delta < best_delta:
+            best_delta = delta
+            best_pos = pos
+    return best_delta, best_pos
+
+
+def repair(
+    sol: Dict[str, Any],
+    removed: List[int],
+    regret_k: int,
+    neighbors: Optional[List[List[int]]],
+):
+    """
+    Sisipkan kembali semua customer di removed. regret_k = 1 → greedy
+    (insertion termurah dulu); regret_k >= 2 → customer dengan regret
+    terbesar (selisih k opsi terbaik vs terbaik) dulu. Kandidat rute per
+    customer: rute yang memuat salah satu neighbor-nya (semua rute kalau
+    neighbors None), plus satu rute baru. Cache insertion per rute hanya
+    dibuang untuk rute yang baru disisipi.
+    """
+    routes, loads, costs = sol["routes"], sol["loads"], sol["costs"]
+    route_of = {c: ri for ri, r in enumerate(routes) for c in r[1:-1]}
+    cache: List[Dict[int, tuple]] = [{} for _ in routes]
+    pending = list(removed)
+
+    while pending:
+        chosen = None
+        chosen_key = None
+        for cust in pending:
+            demand = DEMAND[cust]
+            candidates = None
+            if neighbors is not None:
+                candidates = {route_of[j] for j in neighbors[cust] if j in route_of}
+            if not candidates:
+                # semua neighbor ikut dilepas (mis. shaw removal) → coba semua rute
+                candidates = range(len(routes))
+
+            options = []
+            for ri in candidates:
+                if loads[ri] + demand > CAPACITY:
+                    continue
+                entry = cache[ri].get(cust)
+                if entry is None:
+                    entry = cache[ri][cust] = best_insertion(routes[ri], cust)
+                options.append((entry[0], ri, entry[1]))
+            # rute baru selalu jadi opsi (menjamin feasibility)
+            options.append((DIST[DEPOT][cust] + DIST[cust][DEPOT], -1, 1))
+
+            if regret_k > 1:
+                options.sort()
+                regret = sum(o[0] - options[0][0] for o in options[1:regret_k])
+                key = (-regret, options[0][0])
+                best = options[0]
+            else:
+                best = min(options)
+                key = (best[0],)
+
+            if chosen_key is None or key < chosen_key:
+                chosen_key = key
+                chosen = (cust, best)
+
+        cust, (delta, ri, pos) = chosen
+        if ri == -1:
+            routes.append([DEPOT, cust, DEPOT])
+            loads.append(DEMAND[cust])
+            costs.append(delta)
+            cache.append({})
+            ri = len(routes) - 1
+        else:
+            routes[ri].insert(pos, cust)
+            loads[ri] += DEMAND[cust]
+            costs[ri] += delta
+            cache[ri] = {}
+        route_of[cust] = ri
+        pending.remove(cust)
+
+
+REPAIR = {"greedy": 1, "regret2": 2, "regret3": 3}
+
+
+# --------------------------------------------------------------------
+# Visualisasi rute (layout lingkaran sederhana)
+# --------------------------------------------------------------------
+def plot_routes(routes: List[List[int]], title: str, filename: str):
+    xs, ys = [], []
+    for i in range(N):
+        angle = 2 * math.pi * i / N
+        xs.append(math.cos(angle))
+        ys.append(math.sin(angle))
+
+    plt.figure(figsize=(6, 6))
+    plt.scatter(xs, ys)
+    for i, (x, y) in enumerate(zip(xs, ys)):
+        plt.text(x, y, str(i), fontsize=8, ha="center", va="center")
+    for r in routes:
+        rx = [xs[node] for node in r]
+        ry = [ys[node] for node in r]
+        plt.plot(rx, ry, marker="o")
+
+    plt.title(title)
+    plt.axis("equal")
+    plt.tight_layout()
+    plt.savefig(filename, dpi=150)
+    plt.close()
+
+
+# --------------------------------------------------------------------
+# Algoritma Utama: ALNS
+# --------------------------------------------------------------------
+def _roulette(weights: Dict[str, float]) -> str:
+    total = sum(weights.values())
+    pick = random.random() * total
+    for name, w in weights.items():
+        pick -= w
+        if pick <= 0:
+            return name
+    return name
+
+
+def initial_solution(seed_with: Optional[List[str]], initial_chrom: Optional[List[int]]) -> Dict[str, Any]:
+    if initial_chrom is not None:
+        return make_solution(decode_routes(initial_chrom))
+    if seed_with:
+        for method in seed_with:
+            if method not in ROUTE_BUILDERS:
+                raise ValueError(f"Metode seed '{method}' tidak dikenal (pilihan: {', '.join(ROUTE_BUILDERS)})")
+        candidates = [make_solution(ROUTE_BUILDERS[m](DIST, DEMAND, CAPACITY)) for m in seed_with]
+        return min(candidates, key=total_cost)
+    return make_solution(greedy_routes(DIST, DEMAND, CAPACITY))
+
+
+def alns(
+    iterations: int = 20000,
+    time_limit_sec: Optional[float] = None,
+    min_remove: int = 4,
+    max_remove: int = 60,
+    max_remove_frac: float = 0.3,
+    segment: int = 100,
+    reaction: float = 0.1,
+    start_temp_ratio: float = 0.05,
+    cooling_rate: float = 0.9995,
+    neighbors_k: Optional[int] = 40,
+    seed_with: Optional[List[str]] = None,
+    initial_chrom: Optional[List[int]] = None,
+    on_improve: Optional[Callable[[List[int], float], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+):
+    """
+    ALNS dengan bobot operator adaptif dan acceptance simulated annealing.
+
+    - q customer dilepas per iterasi, q acak di [min_remove,
+      min(max_remove, max_remove_frac × jumlah customer)]
+    - bobot operator diperbarui setiap `segment` iterasi:
+      w = (1 - reaction) × w + reaction × skor_rata2
+    - suhu awal: solusi start_temp_ratio lebih buruk dari solusi awal
+      diterima dengan peluang 50%; turun geometris × cooling_rate per iterasi
+    - neighbors_k: ukuran neighbor list untuk insertion & shaw removal
+      (None → semua rute dicoba untuk setiap insertion)
+
+    on_improve(chrom, cost) / should_stop(): seperti solver lain (chrom =
+    gabungan rute). Return dict: "routes", "chrom", "fitness", "iters",
+    "trace" (time_sec, evals, best_cost), dan "weights" akhir.
+    """
+    global FITNESS_EVALS
+    start_time = time.perf_counter()
+    evals_start = FITNESS_EVALS
+
+    num_customers = len(CUSTOMERS)
+    # shaw removal selalu memakai neighbor list; insertion hanya kalau
+    # neighbor list lebih kecil dari jumlah customer (granular)
+    neighbors = neighbor_lists(min(neighbors_k or num_customers, max(num_customers - 1, 1)))
+    insert_neighbors = neighbors if neighbors_k and num_customers > neighbors_k + 1 else None
+    q_max = max(1, min(max_remove, int(max_remove_frac * num_customers), num_customers))
+    q_min = max(1, min(min_remove, q_max))
+
+    current = initial_solution(seed_with, initial_chrom)
+    current_cost = total_cost(current)
+    best = copy_solution(current)
+    best_cost = current_cost
+    trace = [(time.perf_counter() - start_time, FITNESS_EVALS - evals_start, best_cost)]
+    if on_improve is not None:
+        on_improve(routes_to_chromosome(best["routes"]), best_cost)
+
+    temp = start_temp_ratio * current_cost / math.log(2) if current_cost > 0 else 1.0
+    d_weights = {op: 1.0 for op in DESTROY_OPS}
+    r_weights = {op: 1.0 for op in REPAIR_OPS}
+    d_scores = {op: 0.0 for op in DESTROY_OPS}
+    r_scores = {op: 0.0 for op in REPAIR_OPS}
+    d_uses = {op: 0 for op in DESTROY_OPS}
+    r_uses = {op: 0 for op in REPAIR_OPS}
+
+    it = 0
+    while it < iterations:
+        if time_limit_sec is not None and time.perf_counter() - start_time >= time_limit_sec:
+            break
+        if should_stop is not None and should_stop():
+            break
+        it += 1
+
+        d_op = _roulette(d_weights)
+        r_op = _roulette(r_weights)
+        q = random.randint(q_min, q_max)
+
+        candidate = copy_solution(current)
+        removed = DESTROY[d_op](candidate, q, neighbors)
+        remove_customers(candidate, removed)
+        repair(candidate, removed, REPAIR[r_op], insert_neighbors)
+        FITNESS_EVALS += 1
+        cand_cost = total_cost(candidate)
+
+        score = 0.0
+        delta = cand_cost - current_cost
+        if delta < 0 or random.random() < math.exp(-delta / max(temp, 1e-12)):
+            if cand_cost < best_cost:
+                score = SCORE_BEST
+            elif delta < 0:
+                score = SCORE_BETTER
+            else:
+                score = SCORE_ACCEPTED
+            current = candidate
+            current_cost = cand_cost
+            if cand_cost < best_cost:
+                best = copy_solution(candidate)
+                best_cost = cand_cost
+                trace.append((time.perf_counter() - start_time, FITNESS_EVALS - evals_start, best_cost))
+                if on_improve is not None:
+                    on_improve(routes_to_chromosome(best["routes"]), best_cost)
+
+        d_scores[d_op] += score
+        r_scores[r_op] += score
+        d_uses[d_op] += 1
+        r_uses[r_op] += 1
+
+        if it % segment == 0:
+            for weights, scores, uses in ((d_weights, d_scores, d_uses), (r_weights, r_scores, r_uses)):
+                for op in weights:
+                    if uses[op]:
+                        weights[op] = (1 - reaction) * weights[op] + reaction * scores[op] / uses[op]
+                        # bobot minimum supaya operator tidak pernah mati total
+                        weights[op] = max(weights[op], 0.01)
+                    scores[op] = 0.0
+                    uses[op] = 0
+
+        temp *= cooling_rate
+
+    return {
+        "routes": best["routes"],
+        "chrom": routes_to_chromosome(best["routes"]),
+        "fitness": best_cost,
+        "iters": it,
+        "trace": trace,
+        "weights": {**d_weights, **r_weights},
+    }
+
+
+# --------------------------------------------------------------------
+# Main Execution (Untuk dijalankan via terminal / benchmark)
+# --------------------------------------------------------------------
+if __name__ == "__main__":
+    profiling.maybe_start(INSTANCE_FILE, "alns")
+    timing.pin_cpus()
+    # Ambil parameter jumlah run dari command line
+    NUM_RUNS = int(ARGS[2]) if len(ARGS) > 2 else 5
+    TIME_LIMIT = 10.0  # Detik per run (biar adil dengan algo lain)
+    # Solusi awal opsional: python alns_vrp.py <file> <runs> greedy,savings
+    SEED_WITH = parse_seed_with(ARGS[3] if len(ARGS) > 3 else None)
+
+    print(f"Running ALNS on {INSTANCE_FILE} for {NUM_RUNS} runs...")
+
+    ALNS_PARAMS = {
+        "iterations": 20000,
+        "time_limit_sec": TIME_LIMIT,
+        "seed_with": SEED_WITH,
+    }
+
+    best_overall = None
+    fitnesses = []
+    run_traces = []
+    total_iters = 0
+
+    STARTED_AT = datetime.now().isoformat(timespec="seconds")
+    evals_before = FITNESS_EVALS
+    start_total = time.perf_counter()
+    timing.start("solve")
+
+    for r in range(NUM_RUNS):
+        seed = 400 + r
+        random.seed(seed)  # Set seed biar reproducible
+
+        res = alns(**ALNS_PARAMS)
+        fitnesses.append(res["fitness"])
+        run_traces.append({"run": r + 1, "seed": seed, "trace": res["trace"]})
+        total_iters += res["iters"]
+        weights_str = ", ".join(f"{op}={w:.2f}" for op, w in res["weights"].items())
+        print(f"[ALNS] Run {r + 1}: cost = {res['fitness']:.2f}, iters = {res['iters']}, weights: {weights_str}")
+
+        if best_overall is None or res["fitness"] < best_overall["fitness"]:
+            best_overall = {
+                "routes": res["routes"],
+                "chrom": res["chrom"],
+                "fitness": res["fitness"],
+                "run": r + 1,
+                "seed": seed,
+            }
+
+    end_total = time.perf_counter()
+    timing.stop("solve")
+    timing.start("report")
+    total_time = end_total - start_total
+
+    # Instrumentasi: evals, evals/s, iterasi, time split (lihat instrument.py)
+    instr_fields = instrument.summary_fields(FITNESS_EVALS - evals_before, total_iters, total_time)
+
+    # --- Output Summary ---
+    # rute diambil langsung dari solusi ALNS (bukan split ulang kromosom)
+    routes = best_overall["routes"]
+    route_str = "/".join(["-".join(map(str, r)) for r in routes])
+    chrom_str = "-".join(map(str, best_overall["chrom"]))
+
+    avg_cost = sum(fitnesses) / len(fitnesses)
+    worst_cost = max(fitnesses)
+
+    # Format output satu baris untuk ditangkap benchmark_all.py
+    # Format: ALNS_SUMMARY|file|best|avg|worst|runs|best_run|seed|n_routes|n_nodes|n_cust|cap|total_dem|route|chrom|total_time|avg_time|<instrument.SUMMARY_HEADER>
+    summary_line = (
+        f"ALNS_SUMMARY|{INSTANCE_FILE}|{best_overall['fitness']:.2f}|"
+        f"{avg_cost:.2f}|{worst_cost:.2f}|{NUM_RUNS}|"
+        f"{best_overall['run']}|{best_overall['seed']}|{len(routes)}|{N}|{N-1}|"
+        f"{CAPACITY}|{sum(DEMAND):.2f}|{route_str}|{chrom_str}|"
+        f"{total_time:.4f}|{total_time/NUM_RUNS:.4f}|"
+        + "|".join(instr_fields)
+    )
+    print("\n" + summary_line)
+
+    # Simpan ke results store + CSV khusus ALNS (header = field ALNS_SUMMARY tanpa tag)
+    base_name = os.path.splitext(os.path.basename(INSTANCE_FILE))[0]
+    header = [
+        "instance_file",
+        "best_cost",
+        "avg_cost",
+        "worst_cost",
+        "num_runs",
+        "best_run",
+        "best_seed",
+        "num_routes",
+        "num_nodes",
+        "num_customers",
+        "capacity",
+        "total_demand",
+        "best_route",
+        "chromosome",
+        "total_time_sec",
+        "avg_time_per_run_sec",
+    ] + instrument.SUMMARY_HEADER
+    results_store.save_result(
+        INSTANCE_FILE, "alns", {**ALNS_PARAMS, "num_runs": NUM_RUNS}, header, summary_line.split("|")[1:],
+        run_traces, STARTED_AT, f"{base_name}_alns_summary.csv",
+    )
+
+    # Simpan convergence trace semua run
+    append_trace_csv(f"{base_name}_alns_trace.csv", INSTANCE_FILE, "ALNS", STARTED_AT, run_traces)
+
+    # Simpan Gambar Rute
+    plot_routes(routes, f"ALNS Best Route - {INSTANCE_FILE}", f"{base_name}_alns_route.png")
+
+    timing.stop("report")
+    print(timing.timing_line("ALNS", INSTANCE_FILE))
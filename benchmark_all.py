@@ -2,17 +2,42 @@
 """
 benchmark_all.py
 
-Jalankan Greedy, GA, Tabu Search, OR-Tools, dan Simulated Annealing (SA)
-untuk semua instance .vrp, lalu gabungkan hasilnya
+Jalankan Greedy, GA, Tabu Search, OR-Tools, Simulated Annealing (SA), ALNS,
+dan HGS untuk semua instance .vrp, lalu gabungkan hasilnya
 ke dalam satu file CSV: benchmark_summary.csv
+
+Setelah itu, convergence trace (*_trace.csv) dari setiap solver dianalisis
+menjadi distribusi time-to-target (benchmark_ttt.csv) dan performance
+profile (benchmark_profile.csv).
+
+    python benchmark_all.py              # jalankan semua + analisis TTT
+    python benchmark_all.py --ttt-only   # analisis TTT dari trace yang ada
+    python benchmark_all.py --profile    # setiap run solver diprofil (profiles/)
+    python benchmark_all.py --no-cache   # paksa jalankan ulang semua solver
+
+Hasil setiap eksekusi solver di-cache di results.db (lihat results_store.py)
+dengan key: hash isi instance, versi kode solver (hash source solver + modul
+lokal yang di-import; seed & time limit ada di kode), argumen command
+(jumlah run, opsi), flag instrumentasi/pinning, dan versi Python. Key sama →
+stdout solver dipakai ulang tanpa menjalankan solver lagi.
 """
 
 import csv
+import hashlib
+import json
 import os
+import platform
+import re
 import subprocess
 import sys
+import time
 
 from parser import load_cvrp_instance
+from convergence import write_ttt_report
+import instrument
+import profiling
+import results_store
+import timing
 
 # ----------------------------------------------------------------------
 # Konfigurasi eksperimen
@@ -27,22 +52,135 @@ INSTANCE_FILES = [
 GA_RUNS = 5          # jumlah run GA per instance
 TABU_RUNS = 5        # jumlah run Tabu per instance
 ORTOOLS_RUNS = 1     # OR-Tools deterministik → cukup 1
+ORTOOLS_PORTFOLIO = False  # True → beberapa konfigurasi OR-Tools paralel, ambil terbaik
 SA_RUNS = 5          # jumlah run Simulated Annealing per instance
+ALNS_RUNS = 5        # jumlah run ALNS per instance
+HGS_RUNS = 5         # jumlah run HGS per instance
+
+TTT_GAPS = (0.0, 0.01, 0.05)  # target = best cost per instance × (1 + gap)
+
+# True → solver dijalankan dengan CVRP_INSTRUMENT=1 (time split per komponen);
+# evals, evals/sec, dan iterasi selalu tercatat.
+INSTRUMENT = False
+
+# Mode profiling untuk setiap run solver: None, "both", "cprofile", atau
+# "sample" (lihat profiling.py). Bisa juga lewat CLI: --profile[=mode]
+PROFILE = None
+
+# CPU untuk pinning solver (mis. "0" atau "2,3"; worker paralel round-robin).
+# None → tidak di-pin.
+PIN_CPUS = None
+
+# True → pakai ulang hasil solver dari cache kalau key sama (CLI: --no-cache).
+# Run dengan PROFILE selalu dijalankan ulang (butuh file profil baru).
+USE_CACHE = True
+
+# wall & CPU time proses solver terakhir (termasuk start interpreter & import);
+# cached=True kalau hasilnya diambil dari cache
+LAST_PROCESS_TIMES = {"wall": 0.0, "cpu": 0.0, "cached": False}
+
+_IMPORT_RE = re.compile(r"^\s*(?:from\s+([\w.]+)\s+import|import\s+([\w., ]+))", re.MULTILINE)
+
+
+# ----------------------------------------------------------------------
+# Cache hasil solver
+# ----------------------------------------------------------------------
+def local_imports(script: str) -> list:
+    """Modul lokal (file .py di folder yang sama) yang di-import script, rekursif."""
+    base_dir = os.path.dirname(os.path.abspath(script))
+    seen, stack = set(), [os.path.abspath(script)]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        with open(path) as f:
+            source = f.read()
+        for from_mod, import_mods in _IMPORT_RE.findall(source):
+            names = [from_mod] if from_mod else [m.split(" as ")[0] for m in import_mods.split(",")]
+            for name in names:
+                candidate = os.path.join(base_dir, name.strip().split(".")[0] + ".py")
+                if os.path.exists(candidate):
+                    stack.append(candidate)
+    return sorted(seen)
+
+
+def code_version(script: str) -> str:
+    """SHA-256 source script solver + semua modul lokal yang di-import."""
+    h = hashlib.sha256()
+    for path in local_imports(script):
+        h.update(os.path.basename(path).encode() + b"\0")
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def cache_key(cmd) -> tuple:
+    """(key, key_parts) untuk command [python, solver.py, instance, args...]."""
+    key_parts = {
+        "solver": os.path.basename(cmd[1]),
+        "instance_hash": results_store.file_hash(cmd[2]),
+        "code_version": code_version(cmd[1]),
+        "args": list(cmd[3:]),
+        "instrument": bool(INSTRUMENT),
+        "pin_cpus": PIN_CPUS,
+        "python": platform.python_version(),
+    }
+    blob = json.dumps(key_parts, sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest(), key_parts
+
 
 # ----------------------------------------------------------------------
 # Helper untuk menjalankan command dan menangkap stdout
 # ----------------------------------------------------------------------
 def run_and_capture(cmd):
+    if PROFILE:
+        cmd = cmd + ["--profile" if PROFILE == "both" else f"--profile={PROFILE}"]
     print("\n" + "=" * 80)
     print("Running:", " ".join(cmd))
     print("=" * 80)
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    key = key_parts = None
+    if not PROFILE:
+        key, key_parts = cache_key(cmd)
+        cached = results_store.cache_get(key) if USE_CACHE else None
+        if cached is not None:
+            print(f"[Cache] Hit {key[:12]} (dari {cached['created_at']}), solver tidak dijalankan ulang")
+            LAST_PROCESS_TIMES.update(
+                wall=cached["process_wall_sec"] or 0.0,
+                cpu=cached["process_cpu_sec"] or 0.0,
+                cached=True,
+            )
+            print(cached["stdout"])
+            return cached["stdout"]
+
+    env = dict(os.environ)
+    if INSTRUMENT:
+        env["CVRP_INSTRUMENT"] = "1"
+    if PIN_CPUS:
+        env["CVRP_PIN_CPUS"] = PIN_CPUS
+    wall0, cpu0 = time.perf_counter(), timing.cpu_time()
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    LAST_PROCESS_TIMES["wall"] = time.perf_counter() - wall0
+    LAST_PROCESS_TIMES["cpu"] = timing.cpu_time() - cpu0
+    LAST_PROCESS_TIMES["cached"] = False
     print(result.stdout)
 
     if result.stderr:
         print("[stderr]\n" + result.stderr, file=sys.stderr)
 
+    # hanya eksekusi sukses (ada baris *_SUMMARY) yang disimpan ke cache
+    if key is not None and result.returncode == 0 and "_SUMMARY|" in result.stdout:
+        results_store.cache_put(
+            key,
+            key_parts,
+            cmd[2],
+            key_parts["solver"],
+            result.stdout,
+            LAST_PROCESS_TIMES["wall"],
+            LAST_PROCESS_TIMES["cpu"],
+        )
+
     return result.stdout
 
 
@@ -53,6 +191,31 @@ def find_line_with_prefix(stdout: str, prefix: str):
     return None
 
 
+def timing_columns(stdout: str):
+    """
+    Kolom fase dari baris TIMING|solver|instance|... (setup/solve/report,
+    wall & CPU) + wall & CPU seluruh proses solver dari run_and_capture
+    + flag from_cache (1 = hasil diambil dari cache).
+    """
+    line = find_line_with_prefix(stdout, "TIMING|")
+    fields = line.split("|")[3:] if line else []
+    if len(fields) != len(timing.TIMING_HEADER):
+        fields = ["-"] * len(timing.TIMING_HEADER)
+    return fields + [
+        f"{LAST_PROCESS_TIMES['wall']:.6f}",
+        f"{LAST_PROCESS_TIMES['cpu']:.6f}",
+        int(LAST_PROCESS_TIMES["cached"]),
+    ]
+
+
+def instrument_columns(parts, num_base_fields: int):
+    """Kolom instrumentasi di akhir baris *_SUMMARY (atau '-' jika tidak ada)."""
+    extra = parts[num_base_fields:]
+    if len(extra) != len(instrument.SUMMARY_HEADER):
+        return ["-"] * len(instrument.SUMMARY_HEADER)
+    return extra
+
+
 # ----------------------------------------------------------------------
 # Main benchmark
 # ----------------------------------------------------------------------
@@ -77,7 +240,7 @@ def main():
         "chromosome_or_na",
         "total_time_sec",
         "avg_time_sec",
-    ]
+    ] + instrument.SUMMARY_HEADER + timing.TIMING_HEADER + ["process_wall_sec", "process_cpu_sec", "from_cache"]
 
     with open(output_csv, "w", newline="") as f:
         writer = csv.writer(f)
@@ -96,7 +259,7 @@ def main():
             if line is None:
                 print(f"[WARN] GREEDY_SUMMARY tidak ditemukan untuk {inst}", file=sys.stderr)
             else:
-                # GREEDY_SUMMARY|instance|cost|num_routes|capacity|route|time_sec
+                # GREEDY_SUMMARY|instance|cost|num_routes|capacity|route|time_sec|<instrumentasi>
                 parts = line.split("|")
                 (
                     _tag,
@@ -106,7 +269,7 @@ def main():
                     capacity_str,
                     route_str,
                     time_sec,
-                ) = parts
+                ) = parts[:7]
 
                 writer.writerow([
                     instance_file,           # instance
@@ -126,7 +289,7 @@ def main():
                     "-",                     # chromosome_or_na
                     float(time_sec),         # total_time_sec
                     float(time_sec),         # avg_time_sec
-                ])
+                ] + instrument_columns(parts, 7) + timing_columns(out))
 
             # ------------------ GA ------------------
             out = run_and_capture([sys.executable, "ga_vrp.py", inst, str(GA_RUNS)])
@@ -153,7 +316,7 @@ def main():
                     chrom_str,
                     total_time_str,
                     avg_time_str,
-                ) = parts
+                ) = parts[:17]
 
                 writer.writerow([
                     instance_file,
@@ -173,7 +336,7 @@ def main():
                     chrom_str,
                     float(total_time_str),
                     float(avg_time_str),
-                ])
+                ] + instrument_columns(parts, 17) + timing_columns(out))
 
             # ------------------ TABU ------------------
             out = run_and_capture([sys.executable, "tabu_vrp.py", inst, str(TABU_RUNS)])
@@ -200,7 +363,7 @@ def main():
                     chrom_str,
                     total_time_str,
                     avg_time_str,
-                ) = parts
+                ) = parts[:17]
 
                 writer.writerow([
                     instance_file,
@@ -220,7 +383,7 @@ def main():
                     chrom_str,
                     float(total_time_str),
                     float(avg_time_str),
-                ])
+                ] + instrument_columns(parts, 17) + timing_columns(out))
 
             # ------------------ SA (Simulated Annealing) ------------------
             out = run_and_capture([sys.executable, "sa_vrp.py", inst, str(SA_RUNS)])
@@ -247,7 +410,7 @@ def main():
                     chrom_str,
                     total_time_str,
                     avg_time_str,
-                ) = parts
+                ) = parts[:17]
 
                 writer.writerow([
                     instance_file,
@@ -267,10 +430,107 @@ def main():
                     chrom_str,
                     float(total_time_str),
                     float(avg_time_str),
-                ])
+                ] + instrument_columns(parts, 17) + timing_columns(out))
+
+            # ------------------ ALNS (Adaptive Large Neighborhood Search) ------------------
+            out = run_and_capture([sys.executable, "alns_vrp.py", inst, str(ALNS_RUNS)])
+            line = find_line_with_prefix(out, "ALNS_SUMMARY|")
+            if line is None:
+                print(f"[WARN] ALNS_SUMMARY tidak ditemukan untuk {inst}", file=sys.stderr)
+            else:
+                parts = line.split("|")
+                (
+                    _tag,
+                    instance_file,
+                    best_cost,
+                    avg_cost,
+                    worst_cost,
+                    num_runs,
+                    best_run,
+                    best_seed,
+                    num_routes,
+                    num_nodes,
+                    num_customers,
+                    capacity_str,
+                    total_dem_str,
+                    best_route_str,
+                    chrom_str,
+                    total_time_str,
+                    avg_time_str,
+                ) = parts[:17]
+
+                writer.writerow([
+                    instance_file,
+                    "ALNS",
+                    float(best_cost),
+                    float(avg_cost),
+                    float(worst_cost),
+                    int(num_runs),
+                    int(best_run),
+                    best_seed,
+                    int(num_routes),
+                    int(num_nodes),
+                    int(num_customers),
+                    float(capacity_str),
+                    float(total_dem_str),
+                    best_route_str,
+                    chrom_str,
+                    float(total_time_str),
+                    float(avg_time_str),
+                ] + instrument_columns(parts, 17) + timing_columns(out))
+
+            # ------------------ HGS (Hybrid Genetic Search) ------------------
+            out = run_and_capture([sys.executable, "hgs_vrp.py", inst, str(HGS_RUNS)])
+            line = find_line_with_prefix(out, "HGS_SUMMARY|")
+            if line is None:
+                print(f"[WARN] HGS_SUMMARY tidak ditemukan untuk {inst}", file=sys.stderr)
+            else:
+                parts = line.split("|")
+                (
+                    _tag,
+                    instance_file,
+                    best_cost,
+                    avg_cost,
+                    worst_cost,
+                    num_runs,
+                    best_run,
+                    best_seed,
+                    num_routes,
+                    num_nodes,
+                    num_customers,
+                    capacity_str,
+                    total_dem_str,
+                    best_route_str,
+                    chrom_str,
+                    total_time_str,
+                    avg_time_str,
+                ) = parts[:17]
+
+                writer.writerow([
+                    instance_file,
+                    "HGS",
+                    float(best_cost),
+                    float(avg_cost),
+                    float(worst_cost),
+                    int(num_runs),
+                    int(best_run),
+                    best_seed,
+                    int(num_routes),
+                    int(num_nodes),
+                    int(num_customers),
+                    float(capacity_str),
+                    float(total_dem_str),
+                    best_route_str,
+                    chrom_str,
+                    float(total_time_str),
+                    float(avg_time_str),
+                ] + instrument_columns(parts[:-1], 17) + timing_columns(out))
 
             # ------------------ OR-TOOLS ------------------
-            out = run_and_capture([sys.executable, "ortools_solver.py", inst, str(ORTOOLS_RUNS)])
+            cmd = [sys.executable, "ortools_solver.py", inst, str(ORTOOLS_RUNS)]
+            if ORTOOLS_PORTFOLIO:
+                cmd.append("--portfolio")
+            out = run_and_capture(cmd)
             line = find_line_with_prefix(out, "ORTOOLS_SUMMARY|")
             if line is None:
                 print(f"[WARN] ORTOOLS_SUMMARY tidak ditemukan untuk {inst}", file=sys.stderr)
@@ -292,11 +552,11 @@ def main():
                     route_str,
                     best_time_str,
                     avg_time_str,
-                ) = parts
+                ) = parts[:15]
 
                 writer.writerow([
                     instance_file,
-                    "OR-Tools",
+                    "OR-Tools (portfolio)" if ORTOOLS_PORTFOLIO else "OR-Tools",
                     float(best_cost),
                     float(avg_cost),
                     float(worst_cost),
@@ -312,10 +572,18 @@ def main():
                     "-",                     # chromosome_or_na
                     float(best_time_str),
                     float(avg_time_str),
-                ])
+                ] + instrument_columns(parts, 15) + timing_columns(out))
 
     print(f"\n✅ Ringkasan benchmarking tersimpan di: {output_csv}")
 
+    write_ttt_report(gaps=TTT_GAPS)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    PROFILE = profiling.profile_mode() or PROFILE
+    if "--no-cache" in sys.argv:
+        USE_CACHE = False
+    if "--ttt-only" in sys.argv:
+        write_ttt_report(gaps=TTT_GAPS)
+    else:
+        main()
\ No newline at end of file
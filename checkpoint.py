@@ -0,0 +1,139 @@
+"""
+checkpoint.py
+
+Checkpoint & resume untuk run panjang GA / Tabu:
+
+    python ga_vrp.py big.vrp 5 --checkpoint                    # checkpoints/big_ga.ckpt
+    python ga_vrp.py big.vrp 5 --checkpoint=run1.ckpt --checkpoint-every=300
+    python ga_vrp.py big.vrp 5 --resume                        # lanjut dari checkpoint
+    python tabu_vrp.py big.vrp 5 --resume=run1.ckpt
+
+Checkpoint ditulis di batas generasi / iterasi setiap CHECKPOINT_EVERY_SEC
+detik, setiap run selesai, dan saat proses menerima SIGTERM/SIGINT (lalu
+proses keluar dengan EXIT_PREEMPTED). Isinya seluruh state yang dibutuhkan
+untuk melanjutkan persis sama: populasi / solusi current + tabu list,
+best-so-far, trace, counter iterasi & evals, waktu yang sudah terpakai
+(budget time limit), state RNG modul random, dan hasil run yang sudah selesai.
+
+Format: MAGIC + pickle (protocol tertinggi) terkompresi zlib, ditulis atomik
+(file sementara + os.replace). Checkpoint hanya untuk file buatan sendiri
+(pickle tidak aman untuk file dari pihak lain). Instance (hash isi) dan
+parameter solver divalidasi saat resume. Checkpoint dihapus setelah semua
+run selesai.
+"""
+
+import os
+import pickle
+import signal
+import sys
+import time
+import zlib
+from typing import Dict, Optional
+
+CHECKPOINT_DIR = "checkpoints"
+CHECKPOINT_EVERY_SEC = 60.0
+MAGIC = b"CVRPCKPT\x02"  # \x02: state Tabu reactive (array tabu, frekuensi)
+EXIT_PREEMPTED = 75  # EX_TEMPFAIL: dihentikan, bisa dilanjutkan dengan --resume
+
+# True setelah SIGTERM/SIGINT: solver menulis checkpoint di batas
+# generasi/iterasi berikutnya lalu keluar
+STOP_REQUESTED = False
+
+
+def checkpoint_path(instance_file: str, solver: str) -> str:
+    base = os.path.splitext(os.path.basename(instance_file))[0]
+    return os.path.join(CHECKPOINT_DIR, f"{base}_{solver}.ckpt")
+
+
+def checkpoint_options(instance_file: str, solver: str, argv=None) -> Dict:
+    """
+    Opsi CLI: --checkpoint[=path], --resume[=path], --checkpoint-every=detik.
+    Return {"path": path atau None, "resume": bool, "every_sec": float}.
+    --resume otomatis mengaktifkan checkpoint ke file yang sama.
+    """
+    opts = {"path": None, "resume": False, "every_sec": CHECKPOINT_EVERY_SEC}
+    for arg in (argv if argv is not None else sys.argv)[1:]:
+        name, _, value = arg.partition("=")
+        if name in ("--checkpoint", "--resume"):
+            opts["path"] = value or opts["path"] or checkpoint_path(instance_file, solver)
+            if name == "--resume":
+                opts["resume"] = True
+        elif name == "--checkpoint-every":
+            opts["every_sec"] = float(value)
+    return opts
+
+
+# --------------------------------------------------------------------
+# Tulis / baca
+# --------------------------------------------------------------------
+def save(path: str, state: Dict):
+    """Tulis state ke path secara atomik (tidak pernah setengah tertulis)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    blob = MAGIC + zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), 6)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load(path: str) -> Dict:
+    with open(path, "rb") as f:
+        blob = f.read()
+    if not blob.startswith(MAGIC):
+        raise ValueError(f"{path} bukan file checkpoint (atau versi format berbeda)")
+    return pickle.loads(zlib.decompress(blob[len(MAGIC):]))
+
+
+def load_for_resume(path: str, solver: str, instance_hash: str, params_hash: str) -> Optional[Dict]:
+    """
+    Baca checkpoint untuk resume (None kalau file belum ada → mulai dari awal).
+    ValueError kalau checkpoint milik solver / instance / parameter lain.
+    """
+    if not os.path.exists(path):
+        return None
+    state = load(path)
+    expected = {"solver": solver, "instance_hash": instance_hash, "params_hash": params_hash}
+    for key, value in expected.items():
+        if state.get(key) != value:
+            raise ValueError(
+                f"Checkpoint {path} tidak cocok ({key}: {state.get(key)} != {value}); "
+                "hapus file atau pakai --checkpoint=<path lain>"
+            )
+    return state
+
+
+def remove(path: str):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+# --------------------------------------------------------------------
+# Jadwal & preemption
+# --------------------------------------------------------------------
+def due(last_time: float, every_sec: float) -> bool:
+    """True kalau sudah waktunya checkpoint periodik (atau ada permintaan stop)."""
+    return STOP_REQUESTED or time.perf_counter() - last_time >= every_sec
+
+
+def _request_stop(signum, _frame):
+    global STOP_REQUESTED
+    if STOP_REQUESTED:
+        # sinyal kedua: berhenti sekarang juga
+        raise KeyboardInterrupt
+    STOP_REQUESTED = True
+    print(f"\n[Checkpoint] Sinyal {signal.Signals(signum).name}: checkpoint lalu berhenti", flush=True)
+
+
+def install_stop_handler():
+    """SIGTERM/SIGINT → checkpoint di batas generasi/iterasi berikutnya lalu keluar."""
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+
+
+def exit_preempted(path: str):
+    print(f"[Checkpoint] Tersimpan di {path}; lanjutkan dengan --resume={path}", flush=True)
+    sys.exit(EXIT_PREEMPTED)
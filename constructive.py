@@ -0,0 +1,215 @@
+"""
+constructive.py
+
+Heuristik konstruktif untuk warm-start GA, Tabu Search, dan SA.
+Semua fungsi di sini murni (tidak membaca global instance), sehingga bisa
+dipakai dari modul solver mana pun dengan (dist, demands, capacity) sendiri.
+"""
+
+import random
+from typing import List, Optional, Sequence
+
+DEPOT = 0
+
+# nama metode yang bisa dipakai di opsi seed_with=
+SEED_METHODS = ("greedy", "savings")
+
+
+# --------------------------------------------------------------------
+# Konstruksi rute
+# --------------------------------------------------------------------
+def greedy_routes(dist, demands, capacity) -> List[List[int]]:
+    """
+    Nearest neighbor + capacity check (sama dengan greedy_vrp.py).
+    Return: list of route, masing-masing route = [0, ..., 0]
+    """
+    n = len(demands)
+    unvisited = set(range(1, n))
+    routes: List[List[int]] = []
+
+    while unvisited:
+        route = [DEPOT]
+        load = 0.0
+        current = DEPOT
+
+        while True:
+            nearest = None
+            best_dist = float("inf")
+            for cust in unvisited:
+                if load + demands[cust] > capacity:
+                    continue
+                d = dist[current][cust]
+                if d < best_dist:
+                    best_dist = d
+                    nearest = cust
+
+            if nearest is None:
+                break
+
+            route.append(nearest)
+            load += demands[nearest]
+            unvisited.remove(nearest)
+            current = nearest
+
+        if len(route) == 1:
+            # customer dengan demand > capacity: layani sendirian
+            cust = min(unvisited)
+            route.append(cust)
+            unvisited.remove(cust)
+
+        route.append(DEPOT)
+        routes.append(route)
+
+    return routes
+
+
+def savings_routes(dist, demands, capacity) -> List[List[int]]:
+    """
+    Clarke-Wright savings (versi paralel, mendukung matriks asimetris).
+    saving(i, j) = d(i,0) + d(0,j) - d(i,j): gabung rute yang berakhir di i
+    dengan rute yang diawali j selama kapasitas tidak dilanggar.
+    """
+    n = len(demands)
+    if n <= 1:
+        return [[DEPOT, DEPOT]]
+
+    # awalnya setiap customer punya rute sendiri
+    route_of = list(range(n))  # customer → id rute
+    members = {c: [c] for c in range(1, n)}
+    loads = {c: demands[c] for c in range(1, n)}
+
+    savings = []
+    for i in range(1, n):
+        di0 = dist[i][DEPOT]
+        for j in range(1, n):
+            if i == j:
+                continue
+            s = di0 + dist[DEPOT][j] - dist[i][j]
+            if s > 0:
+                savings.append((s, i, j))
+    savings.sort(reverse=True)
+
+    for _, i, j in savings:
+        ri = route_of[i]
+        rj = route_of[j]
+        if ri == rj:
+            continue
+        route_i = members[ri]
+        route_j = members[rj]
+        # i harus customer terakhir dan j customer pertama di rutenya
+        if route_i[-1] != i or route_j[0] != j:
+            continue
+        if loads[ri] + loads[rj] > capacity:
+            continue
+
+        route_i.extend(route_j)
+        loads[ri] += loads[rj]
+        for c in route_j:
+            route_of[c] = ri
+        del members[rj]
+        del loads[rj]
+
+    return [[DEPOT] + r + [DEPOT] for r in members.values()]
+
+
+# nama metode seed_with → fungsi konstruksi rute
+ROUTE_BUILDERS = {"greedy": greedy_routes, "savings": savings_routes}
+
+
+# --------------------------------------------------------------------
+# Konversi & perturbasi kromosom
+# --------------------------------------------------------------------
+def routes_to_chromosome(
+    routes: List[List[int]],
+    demands: Optional[Sequence[float]] = None,
+    capacity: Optional[float] = None,
+) -> List[int]:
+    """
+    Gabungkan rute (tanpa depot) menjadi permutasi customer.
+
+    Kalau demands dan capacity diberikan, urutan rute dipilih untuk solver
+    yang men-decode secara greedy (rute ditutup saat customer berikut tidak
+    muat), supaya decode sebisa mungkin mengembalikan rute yang sama: mulai
+    dari load terbesar, lalu rute berikutnya diutamakan yang customer
+    pertamanya tidak muat di sisa kapasitas rute sebelumnya.
+    """
+    if demands is None or capacity is None:
+        return [node for r in routes for node in r if node != DEPOT]
+
+    remaining = sorted(
+        (r for r in routes if len(r) > 2),
+        key=lambda r: -sum(demands[c] for c in r[1:-1]),
+    )
+    chrom: List[int] = []
+    prev_load = None
+    while remaining:
+        pick = 0
+        if prev_load is not None:
+            for idx, r in enumerate(remaining):
+                if prev_load + demands[r[1]] > capacity:
+                    pick = idx
+                    break
+        route = remaining.pop(pick)
+        chrom.extend(route[1:-1])
+        prev_load = sum(demands[c] for c in route[1:-1])
+    return chrom
+
+
+def perturb_chromosome(chromosome: List[int], strength: int = 3, rng=None) -> List[int]:
+    """
+    Salinan kromosom dengan `strength` swap acak + satu segment reversal,
+    supaya populasi hasil warm-start tetap beragam.
+    """
+    rng = rng or random
+    chrom = chromosome[:]
+    n = len(chrom)
+    if n < 2:
+        return chrom
+
+    for _ in range(strength):
+        i, j = rng.sample(range(n), 2)
+        chrom[i], chrom[j] = chrom[j], chrom[i]
+
+    a, b = sorted(rng.sample(range(n), 2))
+    chrom[a:b + 1] = reversed(chrom[a:b + 1])
+    return chrom
+
+
+def seed_chromosomes(
+    dist,
+    demands,
+    capacity,
+    seed_with: Sequence[str],
+    count: int,
+    strength: int = 3,
+    rng=None,
+) -> List[List[int]]:
+    """
+    Bangun `count` kromosom warm-start dari metode di `seed_with`
+    ("greedy", "savings"). Solusi asli diletakkan di depan, sisanya
+    salinan terperturbasi (round-robin dari setiap solusi asli).
+    """
+    bases: List[List[int]] = []
+    for method in seed_with:
+        if method not in ROUTE_BUILDERS:
+            raise ValueError(
+                f"Metode seed '{method}' tidak dikenal (pilihan: {', '.join(SEED_METHODS)})"
+            )
+        chrom = routes_to_chromosome(ROUTE_BUILDERS[method](dist, demands, capacity), demands, capacity)
+        if chrom not in bases:
+            bases.append(chrom)
+
+    seeds = [b[:] for b in bases[:count]]
+    k = 0
+    while len(seeds) < count and bases:
+        seeds.append(perturb_chromosome(bases[k % len(bases)], strength, rng))
+        k += 1
+
+    return seeds
+
+
+def parse_seed_with(value: Optional[str]) -> Optional[List[str]]:
+    """'greedy,savings' → ['greedy', 'savings']; kosong/None → None."""
+    if not value:
+        return None
+    return [m.strip() for m in value.split(",") if m.strip()]
@@ -0,0 +1,219 @@
+"""
+convergence.py
+
+Anytime convergence trace: setiap solver mencatat titik
+(time_sec, evals, best_cost) setiap kali incumbent membaik. Modul ini
+menyimpan trace ke <basename>_<algo>_trace.csv dan menghitung distribusi
+time-to-target serta performance profile lintas solver & instance.
+"""
+
+import csv
+import glob
+import math
+import os
+import statistics
+from typing import Dict, List, Optional, Sequence, Tuple
+
+TRACE_HEADER = [
+    "instance_file",
+    "algorithm",
+    "started_at",
+    "run",
+    "seed",
+    "time_sec",
+    "evals",
+    "best_cost",
+]
+
+TTT_HEADER = [
+    "instance_file",
+    "algorithm",
+    "target_gap",
+    "target_cost",
+    "num_runs",
+    "runs_hit",
+    "ttt_min_sec",
+    "ttt_median_sec",
+    "ttt_max_sec",
+]
+
+PROFILE_HEADER = ["target_gap", "algorithm", "tau", "fraction"]
+
+DEFAULT_GAPS = (0.0, 0.01, 0.05)
+DEFAULT_TAUS = (1.0, 1.5, 2.0, 5.0, 10.0, 100.0)
+
+
+# --------------------------------------------------------------------
+# Simpan trace
+# --------------------------------------------------------------------
+def append_trace_csv(
+    filename: str,
+    instance_file: str,
+    algorithm: str,
+    started_at: str,
+    run_traces: Sequence[dict],
+):
+    """
+    run_traces: list of {"run", "seed", "trace"}, trace = list of
+    (time_sec, evals, best_cost). Append ke CSV (header hanya kalau file baru).
+    """
+    file_exists = os.path.exists(filename)
+    with open(filename, "a", newline="") as f:
+        writer = csv.writer(f)
+        if not file_exists:
+            writer.writerow(TRACE_HEADER)
+        for rt in run_traces:
+            for t, evals, cost in rt["trace"]:
+                writer.writerow([
+                    instance_file,
+                    algorithm,
+                    started_at,
+                    rt["run"],
+                    rt["seed"],
+                    f"{t:.6f}",
+                    evals,
+                    f"{cost:.2f}",
+                ])
+
+
+def load_latest_traces(pattern: str = "*_trace.csv") -> Dict[Tuple[str, str], Dict[int, list]]:
+    """
+    Baca semua file trace, ambil batch terbaru (started_at terbesar) per
+    (instance, algorithm). Return: {(instance, algo): {run: [(t, evals, cost), ...]}}
+    """
+    batches: Dict[Tuple[str, str], Dict[str, Dict[int, list]]] = {}
+    for path in sorted(glob.glob(pattern)):
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                key = (os.path.basename(row["instance_file"]), row["algorithm"])
+                runs = batches.setdefault(key, {}).setdefault(row["started_at"], {})
+                runs.setdefault(int(row["run"]), []).append((
+                    float(row["time_sec"]),
+                    int(row["evals"]),
+                    float(row["best_cost"]),
+                ))
+
+    latest = {}
+    for key, by_batch in batches.items():
+        runs = by_batch[max(by_batch)]
+        latest[key] = {r: sorted(points) for r, points in runs.items()}
+    return latest
+
+
+# --------------------------------------------------------------------
+# Time-to-target & performance profile
+# --------------------------------------------------------------------
+def time_to_target(trace: Sequence[tuple], target: float) -> float:
+    """Waktu pertama best_cost <= target (inf kalau tidak pernah tercapai)."""
+    for t, _evals, cost in trace:
+        if cost <= target + 1e-9:
+            return t
+    return math.inf
+
+
+def ttt_table(traces, gaps: Sequence[float] = DEFAULT_GAPS) -> List[dict]:
+    """
+    Target per instance = best cost terbaik semua solver × (1 + gap).
+    Return baris TTT per (instance, algorithm, gap).
+    """
+    best_per_instance: Dict[str, float] = {}
+    for (inst, _algo), runs in traces.items():
+        for points in runs.values():
+            final = points[-1][2]
+            best_per_instance[inst] = min(best_per_instance.get(inst, math.inf), final)
+
+    rows = []
+    for (inst, algo), runs in sorted(traces.items()):
+        for gap in gaps:
+            target = best_per_instance[inst] * (1.0 + gap)
+            ttts = [time_to_target(points, target) for points in runs.values()]
+            hit = [t for t in ttts if t != math.inf]
+            rows.append({
+                "instance_file": inst,
+                "algorithm": algo,
+                "target_gap": gap,
+                "target_cost": target,
+                "num_runs": len(ttts),
+                "runs_hit": len(hit),
+                "ttt_min_sec": min(ttts),
+                "ttt_median_sec": statistics.median(ttts),
+                "ttt_max_sec": max(ttts),
+            })
+    return rows
+
+
+def performance_profile(ttt_rows: Sequence[dict], taus: Sequence[float] = DEFAULT_TAUS) -> List[dict]:
+    """
+    Performance profile (Dolan-Moré) atas median time-to-target:
+    fraction(algo, tau) = bagian instance dengan ttt_algo <= tau × ttt terbaik.
+    """
+    by_gap: Dict[float, Dict[str, Dict[str, float]]] = {}
+    for row in ttt_rows:
+        by_gap.setdefault(row["target_gap"], {}).setdefault(
+            row["instance_file"], {}
+        )[row["algorithm"]] = row["ttt_median_sec"]
+
+    profile = []
+    for gap, per_instance in sorted(by_gap.items()):
+        algos = sorted({a for times in per_instance.values() for a in times})
+        for algo in algos:
+            for tau in taus:
+                solved = 0
+                for times in per_instance.values():
+                    best = min(times.values())
+                    t = times.get(algo, math.inf)
+                    if best == math.inf or t == math.inf:
+                        continue
+                    # best bisa 0 (target tercapai di titik pertama)
+                    if t <= tau * max(best, 1e-6):
+                        solved += 1
+                profile.append({
+                    "target_gap": gap,
+                    "algorithm": algo,
+                    "tau": tau,
+                    "fraction": solved / len(per_instance),
+                })
+    return profile
+
+
+def write_ttt_report(
+    trace_pattern: str = "*_trace.csv",
+    ttt_csv: str = "benchmark_ttt.csv",
+    profile_csv: str = "benchmark_profile.csv",
+    gaps: Sequence[float] = DEFAULT_GAPS,
+    taus: Sequence[float] = DEFAULT_TAUS,
+) -> Optional[Tuple[List[dict], List[dict]]]:
+    """Hitung TTT + performance profile dari file trace dan simpan ke CSV."""
+    traces = load_latest_traces(trace_pattern)
+    if not traces:
+        print(f"[TTT] Tidak ada file trace yang cocok dengan {trace_pattern}")
+        return None
+
+    rows = ttt_table(traces, gaps)
+    profile = performance_profile(rows, taus)
+
+    with open(ttt_csv, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(TTT_HEADER)
+        for row in rows:
+            writer.writerow([
+                row["instance_file"],
+                row["algorithm"],
+                row["target_gap"],
+                f"{row['target_cost']:.2f}",
+                row["num_runs"],
+                row["runs_hit"],
+                f"{row['ttt_min_sec']:.6f}",
+                f"{row['ttt_median_sec']:.6f}",
+                f"{row['ttt_max_sec']:.6f}",
+            ])
+
+    with open(profile_csv, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(PROFILE_HEADER)
+        for row in profile:
+            writer.writerow([row["target_gap"], row["algorithm"], row["tau"], f"{row['fraction']:.4f}"])
+
+    print(f"[TTT] Time-to-target tersimpan di: {ttt_csv}")
+    print(f"[TTT] Performance profile tersimpan di: {profile_csv}")
+    return rows, profile
@@ -0,0 +1,403 @@
+"""
+decomp_vrp.py
+
+Solver dekomposisi untuk instance besar (ribuan customer):
+
+1. Embedding 2D: koordinat dari file (NODE_COORD_SECTION /
+   DISPLAY_DATA_SECTION) kalau ada, selain itu FastMap dari matriks jarak
+   (disimetriskan).
+2. Partisi sweep: customer diurutkan berdasarkan sudut terhadap depot
+   (mulai dari celah sudut terbesar) lalu dipotong jadi cluster berurutan
+   berukuran maks. cluster_size.
+3. Setiap cluster = sub-instance CVRP (depot + customer cluster) yang
+   diselesaikan paralel (ProcessPoolExecutor) dengan solver yang sudah ada
+   (hgs / alns / ga / tabu / sa), memakai global modul solver yang di-bind
+   ulang ke sub-instance. Solusi sub-solver yang tidak feasible diganti
+   greedy nearest neighbor cluster itu.
+4. Rute semua cluster digabung (selalu feasible), lalu diperbaiki global
+   dengan route_ls.RouteLS (relocate / swap / 2-opt* / 2-opt antar cluster,
+   mode strict) sampai local optimum atau sisa time limit habis.
+
+    python decomp_vrp.py big.vrp [num_runs] [sub_solver]
+    python decomp_vrp.py big.vrp 1 hgs --workers=4
+"""
+
+import contextlib
+import importlib
+import io
+import math
+import multiprocessing as mp
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, List, Dict, Any, Optional, Sequence, Tuple
+
+import matplotlib.pyplot as plt
+
+from parser import load_coordinates
+from constructive import greedy_routes
+from convergence import append_trace_csv
+from route_ls import RouteLS, neighbor_lists
+from instance_binding import bind_instance
+import results_store
+import instrument
+import profiling
+import timing
+
+# --------------------------------------------------------------------
+# Konfigurasi & Load Instance
+# --------------------------------------------------------------------
+# argumen posisi; flag "--..." (mis. --profile, --workers=4) diabaikan
+ARGS = [a for a in sys.argv if not a.startswith("--")]
+INSTANCE_FILE = ARGS[1] if len(ARGS) > 1 else "output_cvrp.vrp"
+SUBSOLVER = ARGS[3] if len(ARGS) > 3 else "hgs"
+
+# sub-solver → modul solver yang dipakai untuk setiap cluster
+SUBSOLVER_MODULES = {
+    "hgs": "hgs_vrp",
+    "alns": "alns_vrp",
+    "ga": "ga_vrp",
+    "tabu": "tabu_vrp",
+    "sa": "sa_vrp",
+}
+if SUBSOLVER not in SUBSOLVER_MODULES:
+    raise ValueError(f"Sub-solver tidak dikenal: {SUBSOLVER} ({', '.join(SUBSOLVER_MODULES)})")
+
+# instance dibaca sekali lewat modul sub-solver (fase setup dicatat modul
+# tersebut); worker mewarisinya via fork
+SOLVER = importlib.import_module(SUBSOLVER_MODULES[SUBSOLVER])
+with timing.phase("setup"):
+    COORDS = load_coordinates(INSTANCE_FILE)
+N, CAPACITY, DIST, DEMAND = SOLVER.N, SOLVER.CAPACITY, SOLVER.DIST, SOLVER.DEMAND
+DEPOT = 0
+CUSTOMERS = list(range(1, N))
+
+# satu eval = satu eval sub-solver (dijumlah dari semua cluster)
+FITNESS_EVALS = 0
+
+
+# --------------------------------------------------------------------
+# Embedding & partisi sweep
+# --------------------------------------------------------------------
+def fastmap(dims: int = 2) -> List[Tuple[float, ...]]:
+    """
+    FastMap (Faloutsos & Lin): embedding node ke ruang dims dimensi hanya
+    dari jarak (d(i, j) = rata-rata dua arah). O(n × dims²).
+    """
+    coords = [[0.0] * dims for _ in range(N)]
+
+    def d2(a: int, b: int, k: int) -> float:
+        d = 0.5 * (DIST[a][b] + DIST[b][a])
+        res = d * d - sum((coords[a][t] - coords[b][t]) ** 2 for t in range(k))
+        return max(0.0, res)
+
+    for k in range(dims):
+        # pivot: node terjauh dari depot, lalu node terjauh dari pivot itu
+        a = max(range(N), key=lambda x: d2(DEPOT, x, k))
+        b = max(range(N), key=lambda x: d2(a, x, k))
+        dab = d2(a, b, k)
+        if dab <= 0.0:
+            break
+        root = math.sqrt(dab)
+        for i in range(N):
+            coords[i][k] = (d2(a, i, k) + dab - d2(b, i, k)) / (2.0 * root)
+    return [tuple(c) for c in coords]
+
+
+def sweep_clusters(coords: Sequence[Tuple[float, ...]], cluster_size: int) -> List[List[int]]:
+    """
+    Urutkan customer menurut sudut terhadap depot, mulai setelah celah sudut
+    terbesar, lalu potong jadi ceil(n / cluster_size) cluster berurutan
+    dengan ukuran hampir sama.
+    """
+    dx, dy = coords[DEPOT][0], coords[DEPOT][1]
+    angle = {c: math.atan2(coords[c][1] - dy, coords[c][0] - dx) for c in CUSTOMERS}
+    order = sorted(CUSTOMERS, key=angle.__getitem__)
+    if len(order) > 1:
+        gaps = [
+            (angle[order[(t + 1) % len(order)]] - angle[order[t]]) % (2 * math.pi)
+            for t in range(len(order))
+        ]
+        start = (max(range(len(order)), key=gaps.__getitem__) + 1) % len(order)
+        order = order[start:] + order[:start]
+
+    k = max(1, math.ceil(len(order) / cluster_size))
+    size = len(order) / k
+    return [order[round(t * size):round((t + 1) * size)] for t in range(k)]
+
+
+# --------------------------------------------------------------------
+# Sub-instance & worker
+# --------------------------------------------------------------------
+def sub_instance(cluster: List[int]):
+    """Matriks jarak & demand sub-instance (node 0 = depot, 1.. = cluster)."""
+    nodes = [DEPOT] + cluster
+    dist = [[DIST[a][b] for b in nodes] for a in nodes]
+    demand = [DEMAND[a] for a in nodes]
+    return dist, demand
+
+
+def run_subsolver(time_limit_sec: float, should_stop: Callable[[], bool]) -> List[List[int]]:
+    """
+    Jalankan SOLVER pada instance yang sedang di-bind. Return rute (index
+    lokal). should_stop menegakkan deadline cluster (time limit sub-solver
+    sendiri ada yang hanya dicek per generasi / iterasi).
+    """
+    if SUBSOLVER == "hgs":
+        res = SOLVER.hybrid_genetic_search(time_limit_sec=time_limit_sec, should_stop=should_stop)
+        return res["routes"]
+    if SUBSOLVER == "alns":
+        return SOLVER.alns(time_limit_sec=time_limit_sec, should_stop=should_stop)["routes"]
+    if SUBSOLVER == "ga":
+        res = SOLVER.genetic_algorithm(
+            time_limit_sec=time_limit_sec, local_search="route", log_every=0, should_stop=should_stop
+        )
+        return res["routes"]
+    if SUBSOLVER == "tabu":
+        res = SOLVER.tabu_search(time_limit_sec=time_limit_sec, log_every=0, should_stop=should_stop)
+    else:
+        res = SOLVER.simulated_annealing(time_limit_sec=time_limit_sec, should_stop=should_stop)
+    return SOLVER.decode_routes(res["chrom"])
+
+
+def routes_feasible(routes: List[List[int]], demand: Sequence[float], num_customers: int) -> bool:
+    served = sorted(c for r in routes for c in r[1:-1])
+    if served != list(range(1, num_customers + 1)):
+        return False
+    return all(sum(demand[c] for c in r[1:-1]) <= CAPACITY + 1e-9 for r in routes)
+
+
+def solve_cluster(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker: selesaikan satu cluster, return rute dengan index node global.
+    Budget = time_limit_sec sejak cluster dimulai, dipotong di deadline fase
+    cluster (time.time(), sama untuk semua worker); cluster yang baru mulai
+    setelah deadline langsung memakai greedy.
+    """
+    cluster = task["cluster"]
+    deadline = min(task["deadline"], time.time() + task["time_limit_sec"])
+    dist, demand = sub_instance(cluster)
+    bind_instance(SOLVER, len(cluster) + 1, CAPACITY, dist, demand)
+    random.seed(task["seed"])
+    evals_before = SOLVER.FITNESS_EVALS
+
+    if len(cluster) < 3:
+        local_routes = greedy_routes(dist, demand, CAPACITY)
+        fallback = False
+    elif time.time() >= deadline:
+        local_routes = greedy_routes(dist, demand, CAPACITY)
+        fallback = True
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            local_routes = run_subsolver(deadline - time.time(), lambda: time.time() >= deadline)
+        fallback = not routes_feasible(local_routes, demand, len(cluster))
+        if fallback:
+            local_routes = greedy_routes(dist, demand, CAPACITY)
+
+    nodes = [DEPOT] + cluster
+    routes = [[nodes[v] for v in r] for r in local_routes if len(r) > 2]
+    return {
+        "index": task["index"],
+        "routes": routes,
+        "evals": SOLVER.FITNESS_EVALS - evals_before,
+        "fallback": fallback,
+    }
+
+
+# --------------------------------------------------------------------
+# Solver utama: partisi → solve paralel → gabung → perbaikan global
+# --------------------------------------------------------------------
+def solution_cost(routes: List[List[int]]) -> float:
+    return sum(DIST[r[t]][r[t + 1]] for r in routes for t in range(len(r) - 1))
+
+
+def decompose_and_solve(
+    time_limit_sec: float = 60.0,
+    cluster_size: int = 150,
+    workers: Optional[int] = None,
+    improve_frac: float = 0.25,
+    neighbors_k: int = 20,
+    seed: int = 600,
+) -> Dict[str, Any]:
+    """
+    Dekomposisi: (1 - improve_frac) × time_limit_sec untuk fase cluster
+    (cluster dibagi ke `workers` proses; time limit per cluster diatur supaya
+    semua gelombang selesai dalam budget, min. 1 detik, dan tidak pernah
+    melewati akhir fase cluster), sisanya untuk perbaikan global RouteLS. Return dict: "routes", "fitness", "clusters",
+    "fallbacks", "trace" (time_sec, evals, cost), "ls_moves".
+    """
+    global FITNESS_EVALS
+    start = time.perf_counter()
+    evals_start = FITNESS_EVALS
+    workers = workers or os.cpu_count() or 1
+    trace = []
+
+    coords = COORDS if COORDS is not None else fastmap()
+    clusters = sweep_clusters(coords, cluster_size)
+
+    waves = math.ceil(len(clusters) / workers)
+    cluster_budget = (1.0 - improve_frac) * time_limit_sec - (time.perf_counter() - start)
+    per_cluster = max(1.0, cluster_budget / waves)
+    cluster_deadline = time.time() + max(0.0, cluster_budget)
+    tasks = [
+        {"index": idx, "cluster": cluster, "time_limit_sec": per_cluster,
+         "deadline": cluster_deadline, "seed": seed + idx}
+        for idx, cluster in enumerate(clusters)
+    ]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("fork")) as pool:
+        results = sorted(pool.map(solve_cluster, tasks), key=lambda res: res["index"])
+
+    routes = [r for res in results for r in res["routes"]]
+    FITNESS_EVALS += sum(res["evals"] for res in results)
+    fallbacks = sum(res["fallback"] for res in results)
+    trace.append((time.perf_counter() - start, FITNESS_EVALS - evals_start, solution_cost(routes)))
+
+    # perbaikan global: move antar cluster (batas cluster sering suboptimal)
+    k = min(neighbors_k, max(1, len(CUSTOMERS) - 1))
+    ls = RouteLS(DIST, DEMAND, CAPACITY, neighbor_lists(DIST, k))
+    ls.load_routes(routes)
+    with instrument.timer("local_search"):
+        ls.run(deadline=start + time_limit_sec)
+    routes = ls.solution()
+    FITNESS_EVALS += ls.evals
+    cost = solution_cost(routes)
+    if cost < trace[-1][2]:
+        trace.append((time.perf_counter() - start, FITNESS_EVALS - evals_start, cost))
+
+    return {
+        "routes": routes,
+        "fitness": cost,
+        "clusters": len(clusters),
+        "fallbacks": fallbacks,
+        "ls_moves": ls.moves,
+        "trace": trace,
+    }
+
+
+# --------------------------------------------------------------------
+# Visualisasi rute (koordinat embedding)
+# --------------------------------------------------------------------
+def plot_routes(routes: List[List[int]], title: str, filename: str):
+    coords = COORDS if COORDS is not None else fastmap()
+    xs = [c[0] for c in coords]
+    ys = [c[1] for c in coords]
+
+    plt.figure(figsize=(8, 8))
+    plt.scatter(xs, ys, s=4)
+    for r in routes:
+        plt.plot([xs[node] for node in r], [ys[node] for node in r], linewidth=0.6)
+
+    plt.title(title)
+    plt.axis("equal")
+    plt.tight_layout()
+    plt.savefig(filename, dpi=150)
+    plt.close()
+
+
+# --------------------------------------------------------------------
+# Main Execution
+# --------------------------------------------------------------------
+if __name__ == "__main__":
+    profiling.maybe_start(INSTANCE_FILE, "decomp")
+    timing.pin_cpus()
+    NUM_RUNS = int(ARGS[2]) if len(ARGS) > 2 else 1
+    TIME_LIMIT = 60.0  # detik per run (wall time, termasuk perbaikan global)
+
+    WORKERS = None  # default: jumlah CPU
+    for arg in sys.argv[1:]:
+        name, _, value = arg.partition("=")
+        if name == "--workers" and value:
+            WORKERS = int(value)
+
+    DECOMP_PARAMS = {
+        "time_limit_sec": TIME_LIMIT,
+        "cluster_size": 150,
+        "workers": WORKERS,
+        "improve_frac": 0.25,
+        "neighbors_k": 20,
+    }
+    print(
+        f"Running decomposition ({SUBSOLVER}) on {INSTANCE_FILE} for {NUM_RUNS} runs, "
+        f"embedding: {'coordinates' if COORDS is not None else 'FastMap'}"
+    )
+
+    best_overall = None
+    fitnesses = []
+    run_traces = []
+
+    STARTED_AT = datetime.now().isoformat(timespec="seconds")
+    evals_before = FITNESS_EVALS
+    start_total = time.perf_counter()
+    timing.start("solve")
+
+    for r in range(NUM_RUNS):
+        seed = 600 + 1000 * r
+        res = decompose_and_solve(seed=seed, **DECOMP_PARAMS)
+        fitnesses.append(res["fitness"])
+        run_traces.append({"run": r + 1, "seed": seed, "trace": res["trace"]})
+        print(
+            f"[Decomp] Run {r + 1}: cost = {res['fitness']:.2f} (stitched {res['trace'][0][2]:.2f}), "
+            f"clusters = {res['clusters']}, fallbacks = {res['fallbacks']}, ls moves = {res['ls_moves']}"
+        )
+        if best_overall is None or res["fitness"] < best_overall["fitness"]:
+            best_overall = {"routes": res["routes"], "fitness": res["fitness"], "run": r + 1, "seed": seed}
+
+    end_total = time.perf_counter()
+    timing.stop("solve")
+    timing.start("report")
+    total_time = end_total - start_total
+
+    # Instrumentasi: evals, evals/s, iterasi (= jumlah run), time split
+    instr_fields = instrument.summary_fields(FITNESS_EVALS - evals_before, NUM_RUNS, total_time)
+
+    routes = best_overall["routes"]
+    route_str = "/".join(["-".join(map(str, r)) for r in routes])
+    chrom_str = "-".join(str(c) for r in routes for c in r[1:-1])
+
+    avg_cost = sum(fitnesses) / len(fitnesses)
+    worst_cost = max(fitnesses)
+
+    # Format: DECOMP_SUMMARY|file|best|avg|worst|runs|best_run|seed|n_routes|n_nodes|n_cust|cap|total_dem|route|chrom|total_time|avg_time|<instrument.SUMMARY_HEADER>
+    summary_line = (
+        f"DECOMP_SUMMARY|{INSTANCE_FILE}|{best_overall['fitness']:.2f}|"
+        f"{avg_cost:.2f}|{worst_cost:.2f}|{NUM_RUNS}|"
+        f"{best_overall['run']}|{best_overall['seed']}|{len(routes)}|{N}|{N-1}|"
+        f"{CAPACITY}|{sum(DEMAND):.2f}|{route_str}|{chrom_str}|"
+        f"{total_time:.4f}|{total_time/NUM_RUNS:.4f}|"
+        + "|".join(instr_fields)
+    )
+    print("\n" + summary_line)
+
+    base_name = os.path.splitext(os.path.basename(INSTANCE_FILE))[0]
+    header = [
+        "instance_file",
+        "best_cost",
+        "avg_cost",
+        "worst_cost",
+        "num_runs",
+        "best_run",
+        "best_seed",
+        "num_routes",
+        "num_nodes",
+        "num_customers",
+        "capacity",
+        "total_demand",
+        "best_route",
+        "chromosome",
+        "total_time_sec",
+        "avg_time_per_run_sec",
+    ] + instrument.SUMMARY_HEADER
+    results_store.save_result(
+        INSTANCE_FILE, "decomp", {**DECOMP_PARAMS, "sub_solver": SUBSOLVER, "num_runs": NUM_RUNS},
+        header, summary_line.split("|")[1:], run_traces, STARTED_AT, f"{base_name}_decomp_summary.csv",
+    )
+
+    append_trace_csv(f"{base_name}_decomp_trace.csv", INSTANCE_FILE, "Decomp", STARTED_AT, run_traces)
+
+    plot_routes(routes, f"Decomposition ({SUBSOLVER}) Best Route - {INSTANCE_FILE}", f"{base_name}_decomp_route.png")
+
+    timing.stop("report")
+    print(timing.timing_line("Decomp", INSTANCE_FILE))
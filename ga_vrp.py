@@ -1,32 +1,53 @@
 import random
 import sys
-import csv
 import os
 import time
 import math
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable, Generator
 
 import matplotlib.pyplot as plt
 
 from parser import load_cvrp_instance
+from constructive import routes_to_chromosome, seed_chromosomes, parse_seed_with
+from route_ls import RouteLS, neighbor_lists
+from convergence import append_trace_csv
+import results_store
+import checkpoint
+import incumbents
+import instrument
+import profiling
+import timing
+from instrument import timed
 
 # --------------------------------------------------------------------
 # Pilih instance file dari argumen CLI
 # --------------------------------------------------------------------
-INSTANCE_FILE = sys.argv[1] if len(sys.argv) > 1 else "output_cvrp.vrp"
+# argumen posisi; flag "--..." (mis. --profile) diabaikan
+ARGS = [a for a in sys.argv if not a.startswith("--")]
+INSTANCE_FILE = ARGS[1] if len(ARGS) > 1 else "output_cvrp.vrp"
 
 # --------------------------------------------------------------------
 # Load instance dari file .vrp
 # --------------------------------------------------------------------
-N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
+with timing.phase("setup"):
+    N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
 
 DEPOT = 0
 CUSTOMERS = list(range(1, N))  # node 1..N-1
 
+# jumlah pemanggilan fitness() (dipakai untuk convergence trace)
+FITNESS_EVALS = 0
+
+# neighbor list local search berbasis rute: (DIST yang dipakai, lists)
+ROUTE_LS_NEIGHBORS_K = 20
+_ROUTE_LS_NEIGHBORS = None
+
 
 # --------------------------------------------------------------------
 # Representasi solusi & fungsi bantu
 # --------------------------------------------------------------------
+@timed("decode")
 def decode_routes(chromosome: List[int]) -> List[List[int]]:
     """
     chromosome: permutasi customer [1..N-1] (index node, 0=depot)
@@ -67,10 +88,13 @@ def solution_cost(routes: List[List[int]]) -> float:
     return sum(route_cost(r) for r in routes)
 
 
+@timed("fitness")
 def fitness(chromosome: List[int], penalty_factor: float = 1000.0) -> float:
     """
     Nilai fitness = total cost + penalti overload kapasitas (kalau ada).
     """
+    global FITNESS_EVALS
+    FITNESS_EVALS += 1
     routes = decode_routes(chromosome)
     base_cost = solution_cost(routes)
 
@@ -83,6 +107,34 @@ def fitness(chromosome: List[int], penalty_factor: float = 1000.0) -> float:
     return base_cost + penalty_factor * overload
 
 
+def routes_fitness(routes: List[List[int]], penalty_factor: float = 1000.0) -> float:
+    """Seperti fitness(), tapi untuk rute yang sudah jadi (tanpa decode)."""
+    global FITNESS_EVALS
+    FITNESS_EVALS += 1
+    overload = 0.0
+    for r in routes:
+        load = sum(DEMAND[node] for node in r)
+        if load > CAPACITY:
+            overload += (load - CAPACITY)
+    return solution_cost(routes) + penalty_factor * overload
+
+
+def individual_routes(ind: Dict[str, Any]) -> List[List[int]]:
+    """
+    Rute individu GA: "routes" kalau individu hasil route_local_search
+    (struktur rutenya disimpan), selain itu decode greedy kromosom.
+    """
+    routes = ind.get("routes")
+    return routes if routes is not None else decode_routes(ind["chrom"])
+
+
+def copy_individual(ind: Dict[str, Any]) -> Dict[str, Any]:
+    copy = {"chrom": ind["chrom"][:], "fitness": ind["fitness"]}
+    if ind.get("routes") is not None:
+        copy["routes"] = [r[:] for r in ind["routes"]]
+    return copy
+
+
 # --------------------------------------------------------------------
 # Inisialisasi populasi
 # --------------------------------------------------------------------
@@ -100,8 +152,32 @@ def make_individual() -> Dict[str, Any]:
     }
 
 
-def init_population(pop_size: int):
-    return [make_individual() for _ in range(pop_size)]
+def init_population(
+    pop_size: int,
+    seed_with: Optional[List[str]] = None,
+    seed_ratio: float = 0.2,
+    initial_chroms: Optional[List[List[int]]] = None,
+):
+    """
+    Populasi awal random. Jika seed_with diisi (mis. ["greedy", "savings"]),
+    sebagian populasi (seed_ratio) diisi solusi konstruktif + salinan
+    terperturbasinya (warm-start), sisanya tetap random untuk diversitas.
+    initial_chroms: kromosom yang dimasukkan apa adanya di depan populasi
+    (mis. incumbent dari solver lain).
+    """
+    population = []
+    for chrom in (initial_chroms or [])[:pop_size]:
+        population.append({"chrom": chrom[:], "fitness": fitness(chrom)})
+
+    if seed_with:
+        num_seeds = max(1, min(pop_size, int(round(pop_size * seed_ratio))))
+        num_seeds = min(num_seeds, pop_size - len(population))
+        for chrom in seed_chromosomes(DIST, DEMAND, CAPACITY, seed_with, num_seeds):
+            population.append({"chrom": chrom, "fitness": fitness(chrom)})
+
+    while len(population) < pop_size:
+        population.append(make_individual())
+    return population
 
 
 # --------------------------------------------------------------------
@@ -119,6 +195,7 @@ def tournament_selection(population, k: int = 3):
     return best
 
 
+@timed("crossover")
 def ox_crossover(p1: List[int], p2: List[int]) -> List[int]:
     """
     Order Crossover (OX) untuk permutasi.
@@ -143,6 +220,7 @@ def ox_crossover(p1: List[int], p2: List[int]) -> List[int]:
     return child  # type: ignore
 
 
+@timed("mutation")
 def mutate_swap(chromosome: List[int], mutation_prob: float = 0.2) -> List[int]:
     chrom = chromosome[:]
     if random.random() < mutation_prob:
@@ -154,10 +232,17 @@ def mutate_swap(chromosome: List[int], mutation_prob: float = 0.2) -> List[int]:
 # --------------------------------------------------------------------
 # Local search 2-opt (opsional, untuk intensifikasi)
 # --------------------------------------------------------------------
-def two_opt(chromosome: List[int]) -> List[int]:
+@timed("local_search")
+def two_opt(
+    chromosome: List[int],
+    deadline: Optional[float] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> List[int]:
     """
     2-opt di level kromosom (anggap semua customer dalam satu tour besar).
     decode_routes + fitness akan tetap memastikan kapasitas terjaga.
+    Berhenti lebih awal (best sejauh ini dikembalikan) kalau
+    time.perf_counter() >= deadline atau should_stop() True, dicek setiap i.
     """
     best = chromosome[:]
     best_cost = fitness(best)
@@ -166,6 +251,10 @@ def two_opt(chromosome: List[int]) -> List[int]:
     while improved:
         improved = False
         for i in range(len(best) - 1):
+            if (deadline is not None and time.perf_counter() >= deadline) or (
+                should_stop is not None and should_stop()
+            ):
+                return best
             for j in range(i + 1, len(best)):
                 new = best[:]
                 new[i:j + 1] = reversed(new[i:j + 1])
@@ -178,6 +267,44 @@ def two_opt(chromosome: List[int]) -> List[int]:
     return best
 
 
+@timed("local_search")
+def route_local_search(
+    chromosome: List[int],
+    deadline: Optional[float] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> List[List[int]]:
+    """
+    Local search berbasis rute (route_ls.RouteLS, mode strict): rute hasil
+    decode diperbaiki dengan relocate / swap / 2-opt* antar rute dan 2-opt
+    intra rute, delta cost & cek kapasitas O(1) per move (tanpa decode ulang).
+    Return rute hasil local search. Rute ini disimpan di individu GA apa
+    adanya: decode greedy dari kromosom gabungannya umumnya tidak
+    menghasilkan rute yang sama. deadline / should_stop diteruskan ke
+    RouteLS.run.
+    """
+    global _ROUTE_LS_NEIGHBORS
+    if _ROUTE_LS_NEIGHBORS is None or _ROUTE_LS_NEIGHBORS[0] is not DIST:
+        k = min(ROUTE_LS_NEIGHBORS_K, max(1, len(CUSTOMERS) - 1))
+        _ROUTE_LS_NEIGHBORS = (DIST, neighbor_lists(DIST, k))
+
+    ls = RouteLS(DIST, DEMAND, CAPACITY, _ROUTE_LS_NEIGHBORS[1])
+    ls.load_routes(decode_routes(chromosome))
+    ls.run(deadline=deadline, should_stop=should_stop)
+    return ls.solution()
+
+
+def route_individual(routes: List[List[int]]) -> Dict[str, Any]:
+    """
+    Individu dari rute jadi: fitness = cost rute itu sendiri. Kromosom
+    (untuk crossover) = gabungan rute dengan urutan yang ramah decode greedy.
+    """
+    return {
+        "chrom": routes_to_chromosome(routes, DEMAND, CAPACITY),
+        "fitness": routes_fitness(routes),
+        "routes": routes,
+    }
+
+
 # --------------------------------------------------------------------
 # Visualisasi rute (layout lingkaran sederhana)
 # --------------------------------------------------------------------
@@ -223,20 +350,65 @@ def genetic_algorithm(
     elitism: int = 1,
     use_two_opt: bool = True,
     two_opt_prob: float = 0.3,
+    local_search: str = "two_opt",
     log_every: int = 50,
     time_limit_sec: Optional[float] = None,
+    seed_with: Optional[List[str]] = None,
+    seed_ratio: float = 0.2,
+    initial_chroms: Optional[List[List[int]]] = None,
+    on_improve: Optional[Callable[[List[int], float], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    resume_state: Optional[Dict[str, Any]] = None,
+    on_checkpoint: Optional[Callable[[Dict[str, Any]], None]] = None,
+    checkpoint_every_sec: float = checkpoint.CHECKPOINT_EVERY_SEC,
 ):
     """
     Jalankan GA untuk instance CVRP/TSP dari file .vrp.
     Jika time_limit_sec tidak None, GA akan berhenti jika waktu per run
     melebihi time_limit_sec (fairness vs Tabu & OR-Tools).
+    seed_with / initial_chroms: warm-start populasi awal (lihat init_population).
+    local_search: "two_opt" (2-opt level kromosom) atau "route" (relocate /
+    swap / 2-opt* berbasis rute, lihat route_local_search); dijalankan
+    dengan peluang two_opt_prob kalau use_two_opt.
+    on_improve(chrom, fitness, routes): dipanggil setiap ada best global
+    baru (routes = individual_routes(best)).
+    should_stop(): dicek setiap generasi, setiap anak, dan di dalam local
+    search; True → berhenti lebih awal. Local search juga berhenti di
+    batas time_limit_sec.
+    on_checkpoint(state): dipanggil di akhir generasi setiap
+    checkpoint_every_sec (atau saat ada permintaan stop, lihat checkpoint.py)
+    dengan state lengkap run ini; resume_state: state tersebut → lanjut persis
+    dari generasi berikutnya (populasi, RNG, waktu & evals terpakai).
+
+    Return dict best juga berisi "routes" (lihat individual_routes), "trace":
+    list (time_sec, evals, best_fitness) yang dicatat setiap best global
+    membaik, dan "generations" (jumlah generasi yang selesai).
     """
-    start_time = time.perf_counter()
-
-    population = init_population(pop_size)
-    best = min(population, key=lambda ind: ind["fitness"])
-
-    for gen in range(generations):
+    if resume_state is not None:
+        start_time = time.perf_counter() - resume_state["elapsed"]
+        evals_start = FITNESS_EVALS - resume_state["evals"]
+        population = resume_state["population"]
+        best = resume_state["best"]
+        trace = resume_state["trace"]
+        first_gen = resume_state["generation"]
+        random.setstate(resume_state["rng"])
+    else:
+        start_time = time.perf_counter()
+        evals_start = FITNESS_EVALS
+
+        population = init_population(pop_size, seed_with, seed_ratio, initial_chroms)
+        best = min(population, key=lambda ind: ind["fitness"])
+        trace = [(time.perf_counter() - start_time, FITNESS_EVALS - evals_start, best["fitness"])]
+        if on_improve is not None:
+            on_improve(best["chrom"], best["fitness"], individual_routes(best))
+        first_gen = 0
+
+    # local search ikut berhenti di batas waktu run (satu panggilan bisa
+    # berjalan beberapa detik di instance besar)
+    ls_deadline = start_time + time_limit_sec if time_limit_sec is not None else None
+    last_checkpoint = time.perf_counter()
+    generations_done = first_gen
+    for gen in range(first_gen, generations):
         # cek batas waktu per run
         if time_limit_sec is not None:
             elapsed = time.perf_counter() - start_time
@@ -244,15 +416,24 @@ def genetic_algorithm(
                 print(f"[GA] Time limit reached at generation {gen}")
                 break
 
+        if should_stop is not None and should_stop():
+            print(f"[GA] Stopped at generation {gen}")
+            break
+
         new_population = []
 
         # Elitism: copy beberapa individu terbaik langsung ke generasi baru
         elites = sorted(population, key=lambda ind: ind["fitness"])[:elitism]
         for e in elites:
-            new_population.append({"chrom": e["chrom"][:], "fitness": e["fitness"]})
+            new_population.append(copy_individual(e))
 
         # Buat individu baru sampai populasi penuh
         while len(new_population) < pop_size:
+            # pembatalan kooperatif juga di tengah generasi (satu generasi
+            # dengan local search bisa makan ratusan ms); generasi parsial
+            # tetap dipakai untuk update best
+            if should_stop is not None and should_stop():
+                break
             parent1 = tournament_selection(population)
 
             # Crossover
@@ -265,9 +446,14 @@ def genetic_algorithm(
             # Mutasi
             child_chrom = mutate_swap(child_chrom, mut_prob)
 
-            # Optional: local search 2-opt
+            # Optional: local search (2-opt kromosom atau berbasis rute)
             if use_two_opt and random.random() < two_opt_prob:
-                child_chrom = two_opt(child_chrom)
+                if local_search == "route":
+                    new_population.append(route_individual(
+                        route_local_search(child_chrom, ls_deadline, should_stop)
+                    ))
+                    continue
+                child_chrom = two_opt(child_chrom, ls_deadline, should_stop)
 
             new_population.append({
                 "chrom": child_chrom,
@@ -279,23 +465,79 @@ def genetic_algorithm(
         # Update best global
         current_best = min(population, key=lambda ind: ind["fitness"])
         if current_best["fitness"] < best["fitness"]:
-            best = {
-                "chrom": current_best["chrom"][:],
-                "fitness": current_best["fitness"]
-            }
+            best = copy_individual(current_best)
+            trace.append((
+                time.perf_counter() - start_time,
+                FITNESS_EVALS - evals_start,
+                best["fitness"],
+            ))
+            if on_improve is not None:
+                on_improve(best["chrom"], best["fitness"], individual_routes(best))
+
+        generations_done = gen + 1
 
         # Log setiap beberapa generasi
         if log_every and (gen + 1) % log_every == 0:
             print(f"Gen {gen+1}: best fitness = {best['fitness']}")
 
+        if on_checkpoint is not None and checkpoint.due(last_checkpoint, checkpoint_every_sec):
+            on_checkpoint({
+                "generation": generations_done,
+                "population": population,
+                "best": best,
+                "trace": trace,
+                "elapsed": time.perf_counter() - start_time,
+                "evals": FITNESS_EVALS - evals_start,
+                "rng": random.getstate(),
+            })
+            last_checkpoint = time.perf_counter()
+
+    best["routes"] = individual_routes(best)
+    best["trace"] = trace
+    best["generations"] = generations_done
     return best
 
 
+# --------------------------------------------------------------------
+# Streaming incumbent (generator)
+# --------------------------------------------------------------------
+def iter_incumbents(
+    deadline: Optional[float] = None,
+    cancel=None,
+    **kwargs,
+) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
+    """
+    Versi generator genetic_algorithm(**kwargs): yield dict "routes",
+    "chrom", "cost", "elapsed", "evals" setiap ada best global baru.
+    Berhenti lebih awal kalau time.perf_counter() >= deadline,
+    cancel.is_set(), atau pemanggil berhenti mengiterasi. Return value
+    generator = hasil genetic_algorithm.
+    """
+    start = time.perf_counter()
+    evals_start = FITNESS_EVALS
+
+    def make_item(chrom, cost, routes):
+        return {
+            "routes": [r[:] for r in routes],
+            "chrom": chrom[:],
+            "cost": cost,
+            "elapsed": time.perf_counter() - start,
+            "evals": FITNESS_EVALS - evals_start,
+        }
+
+    def solve(on_improve, should_stop):
+        return genetic_algorithm(on_improve=on_improve, should_stop=should_stop, **kwargs)
+
+    return (yield from incumbents.stream(solve, make_item, deadline, cancel))
+
+
 # --------------------------------------------------------------------
 # Analisis solusi (buat laporan)
 # --------------------------------------------------------------------
-def analyze_solution(chromosome: List[int]):
-    routes = decode_routes(chromosome)
+def analyze_solution(chromosome: List[int], routes: Optional[List[List[int]]] = None):
+    """routes: rute solusi kalau sudah ada (mis. dari route local search); None → decode."""
+    if routes is None:
+        routes = decode_routes(chromosome)
     print("\n=== ANALYSIS ===")
     print(f"Instance file: {INSTANCE_FILE}")
     print(f"Number of routes (vehicles): {len(routes)}")
@@ -323,32 +565,108 @@ def analyze_solution(chromosome: List[int]):
 # --------------------------------------------------------------------
 # Multi-run untuk statistik GA
 # --------------------------------------------------------------------
-def multi_run(num_runs: int = 10, time_limit_sec: Optional[float] = None, **ga_kwargs):
+def multi_run(
+    num_runs: int = 10,
+    time_limit_sec: Optional[float] = None,
+    checkpoint_file: Optional[str] = None,
+    resume: bool = False,
+    checkpoint_every_sec: float = checkpoint.CHECKPOINT_EVERY_SEC,
+    **ga_kwargs,
+):
     """
     Jalankan GA berkali-kali (dengan seed berbeda) untuk lihat:
     - best fitness per run
     - best overall
 
     time_limit_sec: batas waktu per run, diteruskan ke genetic_algorithm
+    checkpoint_file: state ditulis berkala ke file ini (lihat checkpoint.py)
+    dan dihapus setelah semua run selesai; resume=True → lanjut dari
+    checkpoint_file kalau ada. best_overall["resumed_sec"] = waktu yang sudah
+    terpakai oleh proses sebelumnya.
     """
+    global FITNESS_EVALS
     best_overall = None
     fitnesses = []
-
-    for r in range(num_runs):
+    run_traces = []
+    total_generations = 0
+    first_run = 0
+    resumed_sec = 0.0
+    evals_start = FITNESS_EVALS
+
+    inst_hash = results_store.file_hash(INSTANCE_FILE)
+    p_hash = results_store.params_hash({
+        "num_runs": num_runs,
+        "time_limit_sec": time_limit_sec,
+        **{k: v for k, v in ga_kwargs.items() if k != "log_every"},
+    })
+    state = None
+    if checkpoint_file and resume:
+        state = checkpoint.load_for_resume(checkpoint_file, "ga", inst_hash, p_hash)
+    if state is not None:
+        print(f"[GA] Resume dari {checkpoint_file}: run {state['next_run'] + 1}/{num_runs}")
+        best_overall = state["best_overall"]
+        fitnesses = state["fitnesses"]
+        run_traces = state["run_traces"]
+        total_generations = state["total_generations"]
+        first_run = state["next_run"]
+        resumed_sec = state["elapsed"]
+        FITNESS_EVALS += state["evals"]
+    run_start = time.perf_counter() - resumed_sec
+
+    def write_checkpoint(next_run: int, run_state: Optional[Dict[str, Any]]):
+        checkpoint.save(checkpoint_file, {
+            "solver": "ga",
+            "instance_hash": inst_hash,
+            "params_hash": p_hash,
+            "next_run": next_run,
+            "run_state": run_state,
+            "best_overall": best_overall,
+            "fitnesses": fitnesses,
+            "run_traces": run_traces,
+            "total_generations": total_generations,
+            "evals": FITNESS_EVALS - evals_start,
+            "elapsed": time.perf_counter() - run_start,
+        })
+        if checkpoint.STOP_REQUESTED:
+            checkpoint.exit_preempted(checkpoint_file)
+
+    for r in range(first_run, num_runs):
         seed = 100 + r
-        random.seed(seed)
+        run_state = state["run_state"] if state is not None and r == first_run else None
+        if run_state is None:
+            random.seed(seed)
         print(f"\n=== RUN {r+1}/{num_runs} (seed={seed}) ===")
-        best = genetic_algorithm(time_limit_sec=time_limit_sec, **ga_kwargs)
+        best = genetic_algorithm(
+            time_limit_sec=time_limit_sec,
+            resume_state=run_state,
+            on_checkpoint=(lambda s, r=r: write_checkpoint(r, s)) if checkpoint_file else None,
+            checkpoint_every_sec=checkpoint_every_sec,
+            **ga_kwargs,
+        )
         fitnesses.append(best["fitness"])
+        run_traces.append({"run": r + 1, "seed": seed, "trace": best["trace"]})
+        total_generations += best["generations"]
 
         if best_overall is None or best["fitness"] < best_overall["fitness"]:
             best_overall = {
                 "chrom": best["chrom"][:],
                 "fitness": best["fitness"],
+                "routes": best["routes"],
                 "seed": seed,
                 "run": r + 1,
             }
 
+        if checkpoint_file:
+            write_checkpoint(r + 1, None)
+
+    if checkpoint_file:
+        checkpoint.remove(checkpoint_file)
+
+    # convergence trace semua run (untuk <basename>_ga_trace.csv)
+    best_overall["traces"] = run_traces
+    best_overall["iterations"] = total_generations
+    best_overall["resumed_sec"] = resumed_sec
+
     print("\n=== SUMMARY ===")
     print("Instance:", INSTANCE_FILE)
     print("Best fitness per run:", fitnesses)
@@ -364,47 +682,80 @@ def multi_run(num_runs: int = 10, time_limit_sec: Optional[float] = None, **ga_k
 # Entry point
 # --------------------------------------------------------------------
 if __name__ == "__main__":
+    profiling.maybe_start(INSTANCE_FILE, "ga")
+    timing.pin_cpus()
     print(f"Using instance file: {INSTANCE_FILE}")
 
     # --- berapa kali mau di-run (num_runs) dari CLI ---
     # Contoh: python ga_vrp.py 1_FaridFajar.vrp 10
-    NUM_RUNS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    NUM_RUNS = int(ARGS[2]) if len(ARGS) > 2 else 5
     print(f"Number of GA runs: {NUM_RUNS}")
 
+    # --- warm-start opsional: python ga_vrp.py <file> <runs> greedy,savings ---
+    SEED_WITH = parse_seed_with(ARGS[3] if len(ARGS) > 3 else None)
+    print(f"Warm-start seeds: {SEED_WITH or 'none (random)'}")
+
     # --- batas waktu per run (fairness vs Tabu & OR-Tools) ---
     TIME_LIMIT_PER_RUN = 10.0  # detik; silakan ubah kalau perlu
     print(f"Time limit per GA run: {TIME_LIMIT_PER_RUN} seconds")
 
+    # --- checkpoint / resume opsional: --checkpoint[=path], --resume[=path] ---
+    CHECKPOINT = checkpoint.checkpoint_options(INSTANCE_FILE, "ga")
+    if CHECKPOINT["path"]:
+        checkpoint.install_stop_handler()
+        print(f"Checkpoint: {CHECKPOINT['path']} (setiap {CHECKPOINT['every_sec']:g} s)")
+
     # --- ukur waktu eksekusi multi_run ---
+    STARTED_AT = datetime.now().isoformat(timespec="seconds")
+    evals_before = FITNESS_EVALS
     start_time = time.perf_counter()
 
-    best_overall, fitnesses = multi_run(
-        num_runs=NUM_RUNS,
-        generations=300,
-        pop_size=150,
-        cx_prob=0.8,
-        mut_prob=0.2,
-        elitism=1,
-        use_two_opt=True,
-        two_opt_prob=0.3,
-        log_every=50,
-        time_limit_sec=TIME_LIMIT_PER_RUN,
-    )
+    # parameter GA (juga disimpan di results store sebagai params)
+    GA_PARAMS = {
+        "generations": 300,
+        "pop_size": 150,
+        "cx_prob": 0.8,
+        "mut_prob": 0.2,
+        "elitism": 1,
+        "use_two_opt": True,
+        "two_opt_prob": 0.3,
+        "local_search": "route",
+        "time_limit_sec": TIME_LIMIT_PER_RUN,
+        "seed_with": SEED_WITH,
+    }
+
+    with timing.phase("solve"):
+        best_overall, fitnesses = multi_run(
+            num_runs=NUM_RUNS,
+            log_every=50,
+            checkpoint_file=CHECKPOINT["path"],
+            resume=CHECKPOINT["resume"],
+            checkpoint_every_sec=CHECKPOINT["every_sec"],
+            **GA_PARAMS,
+        )
 
     end_time = time.perf_counter()
-    total_time_sec = end_time - start_time
+    timing.start("report")
+    # termasuk waktu proses sebelumnya kalau di-resume dari checkpoint
+    total_time_sec = end_time - start_time + best_overall["resumed_sec"]
     avg_time_per_run_sec = total_time_sec / NUM_RUNS
 
     print(f"\nTotal execution time (multi_run): {total_time_sec:.4f} s")
     print(f"Average time per run            : {avg_time_per_run_sec:.4f} s")
 
+    # --- instrumentasi: evals, throughput, generasi, time split ---
+    instr_fields = instrument.summary_fields(
+        FITNESS_EVALS - evals_before, best_overall["iterations"], total_time_sec
+    )
+    print(f"Fitness evals: {instr_fields[0]} ({instr_fields[1]} evals/s), generations: {instr_fields[2]}")
+
     print("\n=== BEST OVERALL SOLUTION ===")
     print("Instance:", INSTANCE_FILE)
     print("Best fitness:", best_overall["fitness"])
     print("Chromosome (customer order):")
     print(best_overall["chrom"])
 
-    stats = analyze_solution(best_overall["chrom"])
+    stats = analyze_solution(best_overall["chrom"], best_overall.get("routes"))
 
     # ---------- RINGKASAN SATU BARIS (GA_SUMMARY) ----------
     best_cost = best_overall["fitness"]
@@ -442,7 +793,8 @@ if __name__ == "__main__":
         f"{best_route_str}|"
         f"{chrom_str}|"
         f"{total_time_sec:.4f}|"
-        f"{avg_time_per_run_sec:.4f}"
+        f"{avg_time_per_run_sec:.4f}|"
+        + "|".join(instr_fields)
     )
 
     print("\n" + line_text)
@@ -450,7 +802,6 @@ if __name__ == "__main__":
     # ---------- SIMPAN KE FILE <basename>_ga_summary.csv ----------
     base_name = os.path.splitext(os.path.basename(INSTANCE_FILE))[0]
     summary_file = f"{base_name}_ga_summary.csv"
-    file_exists = os.path.exists(summary_file)
 
     header = [
         "instance_file",
@@ -469,7 +820,7 @@ if __name__ == "__main__":
         "chromosome",
         "total_time_sec",
         "avg_time_per_run_sec",
-    ]
+    ] + instrument.SUMMARY_HEADER
 
     row = [
         INSTANCE_FILE,
@@ -488,14 +839,21 @@ if __name__ == "__main__":
         chrom_str,
         f"{total_time_sec:.4f}",
         f"{avg_time_per_run_sec:.4f}",
-    ]
+    ] + instr_fields
 
-    with open(summary_file, "a", newline="") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(header)
-        writer.writerow(row)
+    results_store.save_result(
+        INSTANCE_FILE, "ga", dict(GA_PARAMS, num_runs=NUM_RUNS), header, row,
+        best_overall["traces"], STARTED_AT, summary_file,
+    )
+
+    # ---------- CONVERGENCE TRACE <basename>_ga_trace.csv ----------
+    append_trace_csv(
+        f"{base_name}_ga_trace.csv", INSTANCE_FILE, "GA", STARTED_AT, best_overall["traces"]
+    )
 
     # ---------- PLOT RUTE TERBAIK ----------
     plot_filename = f"{base_name}_ga_route.png"
     plot_routes(routes, f"GA Best Route - {INSTANCE_FILE}", plot_filename)
+
+    timing.stop("report")
+    print(timing.timing_line("GA", INSTANCE_FILE))
@@ -1,22 +1,29 @@
 import sys
-import csv
 import os
-import time
 import math
+from datetime import datetime
 from typing import List
 
 import matplotlib.pyplot as plt
 from parser import load_cvrp_instance
+from convergence import append_trace_csv
+import results_store
+import instrument
+import profiling
+import timing
 
 # ---------------------------------------------------------
 # Instance file dari CLI
 # ---------------------------------------------------------
-INSTANCE_FILE = sys.argv[1] if len(sys.argv) > 1 else "output_cvrp.vrp"
+# argumen posisi; flag "--..." (mis. --profile) diabaikan
+ARGS = [a for a in sys.argv if not a.startswith("--")]
+INSTANCE_FILE = ARGS[1] if len(ARGS) > 1 else "output_cvrp.vrp"
 
 # ---------------------------------------------------------
 # Load instance
 # ---------------------------------------------------------
-N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
+with timing.phase("setup"):
+    N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
 DEPOT = 0
 
 
@@ -29,10 +36,12 @@ def greedy_vrp():
     Return:
       - routes: list of routes (list of node visit including depot)
       - cost  : total distance of all routes
+      - evals : jumlah kandidat customer yang dievaluasi (untuk instrumentasi)
     """
     unvisited = set(range(1, N))
     routes = []
     total_cost = 0.0
+    evals = 0
 
     while unvisited:
         route = [DEPOT]
@@ -42,6 +51,7 @@ def greedy_vrp():
         while True:
             nearest = None
             best_dist = float("inf")
+            evals += len(unvisited)
 
             for cust in unvisited:
                 if load + DEMAND[cust] > CAPACITY:
@@ -69,7 +79,7 @@ def greedy_vrp():
             route_cost += DIST[route[i]][route[i+1]]
         total_cost += route_cost
 
-    return {"routes": routes, "cost": total_cost}
+    return {"routes": routes, "cost": total_cost, "evals": evals}
 
 
 # ---------------------------------------------------------
@@ -105,13 +115,17 @@ def plot_routes(routes: List[List[int]], filename: str, title: str):
 # Main Execution
 # ---------------------------------------------------------
 if __name__ == "__main__":
+    profiling.maybe_start(INSTANCE_FILE, "greedy")
+    timing.pin_cpus()
     print(f"Using instance file: {INSTANCE_FILE}")
 
-    # --- run greedy once (deterministic) ---
-    start = time.perf_counter()
-    result = greedy_vrp()
-    end = time.perf_counter()
-    elapsed = end - start
+    # --- greedy deterministik; diulang sampai >= timing.MIN_SOLVE_SEC supaya
+    # waktunya stabil (elapsed = rata-rata wall per eksekusi) ---
+    STARTED_AT = datetime.now().isoformat(timespec="seconds")
+    result = timing.repeat_solve(greedy_vrp)
+    elapsed = timing.WALL["solve"]
+    print(f"Greedy repeated {timing.SOLVE_REPEATS}x for timing")
+    timing.start("report")
 
     routes = result["routes"]
     total_cost = result["cost"]
@@ -121,6 +135,9 @@ if __name__ == "__main__":
     print(f"Num routes     : {len(routes)}")
     print(f"Time (sec)     : {elapsed:.6f}")
 
+    # instrumentasi: evals = kandidat customer yang dicek, 1 iterasi konstruksi
+    instr_fields = instrument.summary_fields(result["evals"], 1, elapsed)
+
         # ---------- RINGKASAN SATU BARIS (GREEDY_SUMMARY) ----------
     route_strings = ["-".join(str(n) for n in r) for r in routes]
     final_route_str = "/".join(route_strings)
@@ -132,7 +149,8 @@ if __name__ == "__main__":
         f"{len(routes)}|"
         f"{CAPACITY}|"
         f"{final_route_str}|"
-        f"{elapsed:.6f}"
+        f"{elapsed:.6f}|"
+        + "|".join(instr_fields)
     )
 
     print("\n" + line_text)
@@ -143,7 +161,6 @@ if __name__ == "__main__":
     # ---------------------------------------------------------
     base_name = os.path.splitext(os.path.basename(INSTANCE_FILE))[0]
     summary_file = f"{base_name}_greedy_summary.csv"
-    file_exists = os.path.exists(summary_file)
 
     header = [
         "instance_file",
@@ -152,7 +169,7 @@ if __name__ == "__main__":
         "capacity",
         "route",
         "time_sec",
-    ]
+    ] + instrument.SUMMARY_HEADER
 
     route_strings = ["-".join(str(n) for n in r) for r in routes]
     final_route_str = "/".join(route_strings)
@@ -164,16 +181,29 @@ if __name__ == "__main__":
         str(CAPACITY),
         final_route_str,
         f"{elapsed:.6f}",
-    ]
+    ] + instr_fields
+
+    results_store.save_result(
+        INSTANCE_FILE, "greedy", {}, header, row,
+        [{"run": 1, "seed": "-", "trace": [(elapsed, 1, total_cost)]}], STARTED_AT, summary_file,
+    )
 
-    with open(summary_file, "a", newline="") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(header)
-        writer.writerow(row)
+    # ---------------------------------------------------------
+    # SIMPAN CONVERGENCE TRACE (satu titik: solusi konstruktif)
+    # ---------------------------------------------------------
+    append_trace_csv(
+        f"{base_name}_greedy_trace.csv",
+        INSTANCE_FILE,
+        "Greedy",
+        STARTED_AT,
+        [{"run": 1, "seed": "-", "trace": [(elapsed, 1, total_cost)]}],
+    )
 
     # ---------------------------------------------------------
     # SIMPAN PLOT RUTE
     # ---------------------------------------------------------
     plot_filename = f"{base_name}_greedy_route.png"
     plot_routes(routes, plot_filename, f"Greedy Route - {INSTANCE_FILE}")
+
+    timing.stop("report")
+    print(timing.timing_line("Greedy", INSTANCE_FILE))
@@ -0,0 +1,557 @@
+"""
+hgs_vrp.py
+
+Hybrid Genetic Search (HGS, Vidal dkk.) untuk CVRP: mode GA hibrida yang
+jauh lebih kuat dari ga_vrp.genetic_algorithm.
+
+- Kromosom: giant tour (permutasi customer) tanpa delimiter rute.
+- Decoding: Split (shortest path optimal di DAG giant tour, kelebihan
+  kapasitas dipenalti, maks. SPLIT_LOAD_FACTOR × kapasitas per rute).
+- Education: granular local search berbasis rute (route_ls.py: relocate /
+  Or-opt, swap, 2-opt*, 2-opt; evaluasi move O(1)). Solusi infeasible
+  di-repair dengan penalti 10× (peluang REPAIR_PROB).
+- Populasi: dua subpopulasi (feasible / infeasible), masing-masing
+  mu..mu+lambda individu. Survivor selection memakai biased fitness = rank
+  cost + (1 - n_elite/ukuran) × rank kontribusi diversity, dengan diversity
+  = rata-rata broken-pairs distance ke n_close individu terdekat; klon
+  dibuang duluan.
+- Penalti kapasitas adaptif: target TARGET_FEASIBLE fraksi solusi hasil
+  local search yang feasible.
+- Restart populasi (best disimpan) kalau tidak ada perbaikan selama
+  max_no_improve iterasi.
+
+    python hgs_vrp.py 1_FaridFajar.vrp 5
+"""
+
+import bisect
+import random
+import sys
+import os
+import time
+import math
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable
+
+import matplotlib.pyplot as plt
+
+from parser import load_cvrp_instance
+from convergence import append_trace_csv
+from route_ls import RouteLS, neighbor_lists
+import results_store
+import instrument
+import profiling
+import timing
+from instrument import timed
+
+# --------------------------------------------------------------------
+# Konfigurasi & Load Instance
+# --------------------------------------------------------------------
+# argumen posisi; flag "--..." (mis. --profile) diabaikan
+ARGS = [a for a in sys.argv if not a.startswith("--")]
+INSTANCE_FILE = ARGS[1] if len(ARGS) > 1 else "output_cvrp.vrp"
+with timing.phase("setup"):
+    N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
+DEPOT = 0
+CUSTOMERS = list(range(1, N))
+
+# satu eval = satu individu (Split + local search) yang dievaluasi
+FITNESS_EVALS = 0
+
+SPLIT_LOAD_FACTOR = 1.5  # load maksimum satu rute saat Split (× kapasitas)
+TARGET_FEASIBLE = 0.2    # target fraksi hasil local search yang feasible
+REPAIR_PROB = 0.5        # peluang repair solusi infeasible (penalti × 10)
+PENALTY_MIN = 0.1
+PENALTY_MAX = 100000.0
+REPORT_PENALTY = 1000.0  # penalti fitness solusi infeasible (sama dengan fitness() GA/Tabu/SA)
+
+# neighbor list per ukuran k (dihitung sekali per instance)
+_NEIGHBORS: Dict[int, List[List[int]]] = {}
+_NEXT_ID = 0
+
+
+# --------------------------------------------------------------------
+# Split & individu
+# --------------------------------------------------------------------
+@timed("decode")
+def split(tour: List[int], penalty: float) -> List[List[int]]:
+    """
+    Split giant tour → rute [0, ..., 0] dengan cost minimum (jarak +
+    penalty × kelebihan kapasitas). Bellman di DAG: O(n × panjang rute).
+    """
+    n = len(tour)
+    max_load = SPLIT_LOAD_FACTOR * CAPACITY
+    potential = [math.inf] * (n + 1)
+    potential[0] = 0.0
+    pred = [0] * (n + 1)
+
+    for i in range(n):
+        base = potential[i]
+        if base == math.inf:
+            continue
+        first = tour[i]
+        load = 0.0
+        inner = 0.0
+        prev = first
+        d_start = DIST[DEPOT][first]
+        for j in range(i, n):
+            cust = tour[j]
+            load += DEMAND[cust]
+            if j > i:
+                if load > max_load:
+                    break
+                inner += DIST[prev][cust]
+            prev = cust
+            cost = base + d_start + inner + DIST[cust][DEPOT]
+            if load > CAPACITY:
+                cost += penalty * (load - CAPACITY)
+            if cost < potential[j + 1]:
+                potential[j + 1] = cost
+                pred[j + 1] = i
+
+    routes = []
+    j = n
+    while j > 0:
+        i = pred[j]
+        routes.append([DEPOT] + tour[i:j] + [DEPOT])
+        j = i
+    routes.reverse()
+    return routes
+
+
+def make_individual(routes: List[List[int]], penalty: float) -> Dict[str, Any]:
+    global _NEXT_ID
+    _NEXT_ID += 1
+    succ = [DEPOT] * N
+    pred = [DEPOT] * N
+    distance = 0.0
+    excess = 0.0
+    for r in routes:
+        load = 0.0
+        for t in range(1, len(r)):
+            distance += DIST[r[t - 1]][r[t]]
+        for t in range(1, len(r) - 1):
+            c = r[t]
+            load += DEMAND[c]
+            pred[c] = r[t - 1]
+            succ[c] = r[t + 1]
+        excess += max(0.0, load - CAPACITY)
+    return {
+        "id": _NEXT_ID,
+        "routes": routes,
+        "tour": [c for r in routes for c in r[1:-1]],
+        "distance": distance,
+        "excess": excess,
+        "feasible": excess <= 1e-9,
+        "cost": distance + penalty * excess,
+        "succ": succ,
+        "pred": pred,
+        "prox": [],  # [(broken-pairs distance, id)] terurut
+    }
+
+
+def broken_pairs_distance(a: Dict[str, Any], b: Dict[str, Any]) -> float:
+    """Fraksi customer yang pasangan tetangganya (succ/pred) berbeda di a dan b."""
+    sa, pa, sb, pb = a["succ"], a["pred"], b["succ"], b["pred"]
+    diff = 0
+    for c in CUSTOMERS:
+        if sa[c] != sb[c] and sa[c] != pb[c]:
+            diff += 1
+        if pa[c] == DEPOT and pb[c] != DEPOT and sb[c] != DEPOT:
+            diff += 1
+    return diff / max(1, len(CUSTOMERS))
+
+
+# --------------------------------------------------------------------
+# Education (local search) & crossover
+# --------------------------------------------------------------------
+def educate(tour: List[int], penalty: float, neighbors: List[List[int]]) -> List[Dict[str, Any]]:
+    """
+    Split + granular local search. Return individu hasil (1 atau 2: kalau
+    infeasible dan repair berhasil, versi repair ikut dikembalikan).
+    """
+    global FITNESS_EVALS
+    FITNESS_EVALS += 1
+    ls = RouteLS(DIST, DEMAND, CAPACITY, neighbors, penalty)
+    ls.load_routes(split(tour, penalty))
+    with instrument.timer("local_search"):
+        ls.run()
+    result = [make_individual(ls.solution(), penalty)]
+
+    if not result[0]["feasible"] and random.random() < REPAIR_PROB:
+        ls.penalty = penalty * 10.0
+        with instrument.timer("local_search"):
+            ls.run()
+        if ls.excess() <= 1e-9:
+            result.append(make_individual(ls.solution(), penalty))
+    return result
+
+
+@timed("crossover")
+def ox_crossover(parent1: List[int], parent2: List[int]) -> List[int]:
+    """Order crossover pada giant tour (segmen p1, sisanya urutan p2 setelah segmen)."""
+    size = len(parent1)
+    a, b = sorted(random.sample(range(size), 2)) if size > 1 else (0, 0)
+    child = [None] * size
+    child[a:b + 1] = parent1[a:b + 1]
+    used = set(parent1[a:b + 1])
+    idx = (b + 1) % size
+    for k in range(size):
+        gene = parent2[(b + 1 + k) % size]
+        if gene in used:
+            continue
+        child[idx] = gene
+        idx = (idx + 1) % size
+    return child
+
+
+# --------------------------------------------------------------------
+# Manajemen populasi (biased fitness + broken-pairs diversity)
+# --------------------------------------------------------------------
+def _add_to_subpop(subpop: List[Dict[str, Any]], ind: Dict[str, Any]):
+    for other in subpop:
+        d = broken_pairs_distance(ind, other)
+        bisect.insort(ind["prox"], (d, other["id"]))
+        bisect.insort(other["prox"], (d, ind["id"]))
+    subpop.append(ind)
+
+
+def _remove_from_subpop(subpop: List[Dict[str, Any]], ind: Dict[str, Any]):
+    subpop.remove(ind)
+    for other in subpop:
+        other["prox"] = [p for p in other["prox"] if p[1] != ind["id"]]
+
+
+def biased_fitness(subpop: List[Dict[str, Any]], n_elite: int, n_close: int) -> Dict[int, float]:
+    """id → biased fitness (kecil = lebih baik) untuk satu subpopulasi."""
+    m = len(subpop)
+    if m == 1:
+        return {subpop[0]["id"]: 0.0}
+    by_cost = sorted(subpop, key=lambda ind: ind["cost"])
+    # kontribusi diversity: rata-rata jarak ke n_close terdekat (besar = beragam)
+    diversity = {
+        ind["id"]: sum(d for d, _ in ind["prox"][:n_close]) / max(1, min(n_close, len(ind["prox"])))
+        for ind in subpop
+    }
+    by_div = sorted(subpop, key=lambda ind: -diversity[ind["id"]])
+    div_rank = {ind["id"]: r / (m - 1) for r, ind in enumerate(by_div)}
+    weight = 1.0 - min(n_elite, m) / m
+    return {ind["id"]: r / (m - 1) + weight * div_rank[ind["id"]] for r, ind in enumerate(by_cost)}
+
+
+def survivor_selection(subpop: List[Dict[str, Any]], mu: int, n_elite: int, n_close: int):
+    """Kurangi subpopulasi ke mu individu: klon dulu, lalu biased fitness terburuk."""
+    while len(subpop) > mu:
+        bf = biased_fitness(subpop, n_elite, n_close)
+        clones = [ind for ind in subpop if ind["prox"] and ind["prox"][0][0] == 0.0]
+        pool = clones or subpop
+        worst = max(pool, key=lambda ind: bf[ind["id"]])
+        _remove_from_subpop(subpop, worst)
+
+
+def select_parent(feasible, infeasible, n_elite: int, n_close: int) -> Dict[str, Any]:
+    """Binary tournament berdasarkan biased fitness (gabungan dua subpopulasi)."""
+    bf = {}
+    for subpop in (feasible, infeasible):
+        if subpop:
+            bf.update(biased_fitness(subpop, n_elite, n_close))
+    union = feasible + infeasible
+    a, b = random.choice(union), random.choice(union)
+    return a if bf[a["id"]] <= bf[b["id"]] else b
+
+
+# --------------------------------------------------------------------
+# Visualisasi rute (layout lingkaran sederhana)
+# --------------------------------------------------------------------
+def plot_routes(routes: List[List[int]], title: str, filename: str):
+    xs, ys = [], []
+    for i in range(N):
+        angle = 2 * math.pi * i / N
+        xs.append(math.cos(angle))
+        ys.append(math.sin(angle))
+
+    plt.figure(figsize=(6, 6))
+    plt.scatter(xs, ys)
+    for i, (x, y) in enumerate(zip(xs, ys)):
+        plt.text(x, y, str(i), fontsize=8, ha="center", va="center")
+    for r in routes:
+        rx = [xs[node] for node in r]
+        ry = [ys[node] for node in r]
+        plt.plot(rx, ry, marker="o")
+
+    plt.title(title)
+    plt.axis("equal")
+    plt.tight_layout()
+    plt.savefig(filename, dpi=150)
+    plt.close()
+
+
+# --------------------------------------------------------------------
+# Algoritma Utama: HGS
+# --------------------------------------------------------------------
+def hybrid_genetic_search(
+    iterations: int = 100000,
+    time_limit_sec: Optional[float] = None,
+    mu: int = 25,
+    lam: int = 40,
+    n_elite: int = 4,
+    n_close: int = 5,
+    neighbors_k: int = 20,
+    max_no_improve: int = 2000,
+    penalty_every: int = 100,
+    init_time_frac: float = 0.3,
+    initial_chroms: Optional[List[List[int]]] = None,
+    on_improve: Optional[Callable[[List[int], float], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+):
+    """
+    HGS: populasi awal 4 × mu giant tour acak (plus initial_chroms kalau
+    ada; dengan time limit dibatasi init_time_frac dari budget supaya
+    instance besar tetap sempat masuk fase evolusi), lalu setiap iterasi:
+    2 parent (binary tournament biased fitness) → OX → Split + education →
+    masuk subpopulasi feasible/infeasible; subpopulasi yang mencapai
+    mu + lam dikurangi ke mu.
+
+    on_improve(tour, cost) / should_stop(): seperti solver lain (tour =
+    gabungan rute). Return dict: "routes", "chrom", "fitness" (cost best
+    feasible; kalau tidak ada yang feasible: jarak + REPORT_PENALTY ×
+    kelebihan kapasitas), "feasible", "iters", "trace" (time_sec, evals,
+    best_cost), "restarts".
+    """
+    start_time = time.perf_counter()
+    evals_start = FITNESS_EVALS
+
+    def out_of_time() -> bool:
+        if time_limit_sec is not None and time.perf_counter() - start_time >= time_limit_sec:
+            return True
+        return should_stop is not None and should_stop()
+
+    k = min(neighbors_k, max(1, len(CUSTOMERS) - 1))
+    if k not in _NEIGHBORS:
+        _NEIGHBORS[k] = neighbor_lists(DIST, k)
+    neighbors = _NEIGHBORS[k]
+
+    max_dist = max(max(row) for row in DIST)
+    max_demand = max(max(DEMAND), 1)
+    penalty = max(PENALTY_MIN, min(1000.0, max_dist / max_demand))
+
+    feasible: List[Dict[str, Any]] = []
+    infeasible: List[Dict[str, Any]] = []
+    best: Optional[Dict[str, Any]] = None
+    trace = []
+    recent_feasible: List[bool] = []
+
+    def insert(ind: Dict[str, Any]):
+        nonlocal best
+        subpop = feasible if ind["feasible"] else infeasible
+        _add_to_subpop(subpop, ind)
+        if len(subpop) >= mu + lam:
+            survivor_selection(subpop, mu, n_elite, n_close)
+        if ind["feasible"] and (best is None or ind["distance"] < best["distance"] - 1e-9):
+            best = ind
+            trace.append((time.perf_counter() - start_time, FITNESS_EVALS - evals_start, best["distance"]))
+            if on_improve is not None:
+                on_improve(best["tour"][:], best["distance"])
+            return True
+        return False
+
+    def initial_population():
+        seeds = [c[:] for c in (initial_chroms or [])]
+        init_start = time.perf_counter()
+        for n_init in range(4 * mu):
+            if n_init >= 2 and (
+                out_of_time()
+                or (time_limit_sec is not None
+                    and time.perf_counter() - init_start >= init_time_frac * time_limit_sec)
+            ):
+                break
+            tour = seeds.pop() if seeds else random.sample(CUSTOMERS, len(CUSTOMERS))
+            for ind in educate(tour, penalty, neighbors):
+                insert(ind)
+
+    initial_population()
+    it = 0
+    no_improve = 0
+    restarts = 0
+    while it < iterations and not out_of_time():
+        it += 1
+        union = feasible + infeasible
+        if len(union) < 2:
+            initial_population()
+            continue
+
+        p1 = select_parent(feasible, infeasible, n_elite, n_close)
+        p2 = select_parent(feasible, infeasible, n_elite, n_close)
+        child = ox_crossover(p1["tour"], p2["tour"])
+
+        improved = False
+        educated = educate(child, penalty, neighbors)
+        recent_feasible.append(educated[0]["feasible"])
+        for ind in educated:
+            improved = insert(ind) or improved
+        no_improve = 0 if improved else no_improve + 1
+
+        # penalti adaptif → fraksi feasible mendekati TARGET_FEASIBLE
+        if it % penalty_every == 0 and recent_feasible:
+            frac = sum(recent_feasible) / len(recent_feasible)
+            if frac < TARGET_FEASIBLE - 0.05:
+                penalty = min(PENALTY_MAX, penalty * 1.2)
+            elif frac > TARGET_FEASIBLE + 0.05:
+                penalty = max(PENALTY_MIN, penalty * 0.85)
+            recent_feasible.clear()
+            for ind in infeasible:
+                ind["cost"] = ind["distance"] + penalty * ind["excess"]
+
+        if no_improve >= max_no_improve:
+            # restart: populasi baru, best tetap disimpan
+            restarts += 1
+            no_improve = 0
+            feasible.clear()
+            infeasible.clear()
+            initial_population()
+
+    if best is None:
+        # belum ada individu feasible: repair paksa solusi infeasible terbaik
+        base = min(infeasible, key=lambda ind: ind["cost"])
+        ls = RouteLS(DIST, DEMAND, CAPACITY, neighbors, PENALTY_MAX)
+        ls.load_routes(base["routes"])
+        ls.run()
+        best = make_individual(ls.solution(), penalty)
+        trace.append((time.perf_counter() - start_time, FITNESS_EVALS - evals_start,
+                      best["distance"] + REPORT_PENALTY * best["excess"]))
+
+    return {
+        "routes": best["routes"],
+        "chrom": best["tour"],
+        "fitness": best["distance"] + REPORT_PENALTY * best["excess"],
+        "feasible": best["feasible"],
+        "iters": it,
+        "restarts": restarts,
+        "trace": trace,
+    }
+
+
+# --------------------------------------------------------------------
+# Main Execution (Untuk dijalankan via terminal / benchmark)
+# --------------------------------------------------------------------
+if __name__ == "__main__":
+    profiling.maybe_start(INSTANCE_FILE, "hgs")
+    timing.pin_cpus()
+    # Ambil parameter jumlah run dari command line
+    NUM_RUNS = int(ARGS[2]) if len(ARGS) > 2 else 5
+    TIME_LIMIT = 10.0  # Detik per run (biar adil dengan algo lain)
+
+    print(f"Running HGS on {INSTANCE_FILE} for {NUM_RUNS} runs...")
+
+    HGS_PARAMS = {
+        "time_limit_sec": TIME_LIMIT,
+        "mu": 25,
+        "lam": 40,
+        "n_elite": 4,
+        "n_close": 5,
+        "neighbors_k": 20,
+        "max_no_improve": 2000,
+    }
+
+    best_overall = None
+    fitnesses = []
+    run_traces = []
+    total_iters = 0
+    feasible_runs = 0
+
+    STARTED_AT = datetime.now().isoformat(timespec="seconds")
+    evals_before = FITNESS_EVALS
+    start_total = time.perf_counter()
+    timing.start("solve")
+
+    for r in range(NUM_RUNS):
+        seed = 500 + r
+        random.seed(seed)  # Set seed biar reproducible
+
+        res = hybrid_genetic_search(**HGS_PARAMS)
+        fitnesses.append(res["fitness"])
+        run_traces.append({"run": r + 1, "seed": seed, "trace": res["trace"]})
+        total_iters += res["iters"]
+        feasible_runs += res["feasible"]
+        print(
+            f"[HGS] Run {r + 1}: cost = {res['fitness']:.2f}, iters = {res['iters']}, "
+            f"restarts = {res['restarts']}, feasible = {res['feasible']}"
+        )
+
+        # run feasible selalu menang atas run infeasible
+        if best_overall is None or (not res["feasible"], res["fitness"]) < (
+            not best_overall["feasible"], best_overall["fitness"]
+        ):
+            best_overall = {
+                "routes": res["routes"],
+                "chrom": res["chrom"],
+                "fitness": res["fitness"],
+                "feasible": res["feasible"],
+                "run": r + 1,
+                "seed": seed,
+            }
+
+    end_total = time.perf_counter()
+    timing.stop("solve")
+    timing.start("report")
+    total_time = end_total - start_total
+
+    # Instrumentasi: evals, evals/s, iterasi, time split (lihat instrument.py)
+    instr_fields = instrument.summary_fields(FITNESS_EVALS - evals_before, total_iters, total_time)
+
+    # --- Output Summary ---
+    # rute diambil langsung dari solusi HGS (hasil Split + local search)
+    routes = best_overall["routes"]
+    route_str = "/".join(["-".join(map(str, r)) for r in routes])
+    chrom_str = "-".join(map(str, best_overall["chrom"]))
+
+    avg_cost = sum(fitnesses) / len(fitnesses)
+    worst_cost = max(fitnesses)
+    if not best_overall["feasible"]:
+        print(f"[HGS] WARNING: tidak ada run yang feasible; cost termasuk penalti {REPORT_PENALTY} × kelebihan kapasitas")
+
+    # Format output satu baris untuk ditangkap benchmark_all.py
+    # Format: HGS_SUMMARY|file|best|avg|worst|runs|best_run|seed|n_routes|n_nodes|n_cust|cap|total_dem|route|chrom|total_time|avg_time|<instrument.SUMMARY_HEADER>|feasible_runs
+    summary_line = (
+        f"HGS_SUMMARY|{INSTANCE_FILE}|{best_overall['fitness']:.2f}|"
+        f"{avg_cost:.2f}|{worst_cost:.2f}|{NUM_RUNS}|"
+        f"{best_overall['run']}|{best_overall['seed']}|{len(routes)}|{N}|{N-1}|"
+        f"{CAPACITY}|{sum(DEMAND):.2f}|{route_str}|{chrom_str}|"
+        f"{total_time:.4f}|{total_time/NUM_RUNS:.4f}|"
+        + "|".join(instr_fields)
+        + f"|{feasible_runs}"
+    )
+    print("\n" + summary_line)
+
+    # Simpan ke results store + CSV khusus HGS (header = field HGS_SUMMARY tanpa tag)
+    base_name = os.path.splitext(os.path.basename(INSTANCE_FILE))[0]
+    header = [
+        "instance_file",
+        "best_cost",
+        "avg_cost",
+        "worst_cost",
+        "num_runs",
+        "best_run",
+        "best_seed",
+        "num_routes",
+        "num_nodes",
+        "num_customers",
+        "capacity",
+        "total_demand",
+        "best_route",
+        "chromosome",
+        "total_time_sec",
+        "avg_time_per_run_sec",
+    ] + instrument.SUMMARY_HEADER + ["feasible_runs"]
+    results_store.save_result(
+        INSTANCE_FILE, "hgs", {**HGS_PARAMS, "num_runs": NUM_RUNS}, header, summary_line.split("|")[1:],
+        run_traces, STARTED_AT, f"{base_name}_hgs_summary.csv",
+    )
+
+    # Simpan convergence trace semua run
+    append_trace_csv(f"{base_name}_hgs_trace.csv", INSTANCE_FILE, "HGS", STARTED_AT, run_traces)
+
+    # Simpan Gambar Rute
+    plot_routes(routes, f"HGS Best Route - {INSTANCE_FILE}", f"{base_name}_hgs_route.png")
+
+    timing.stop("report")
+    print(timing.timing_line("HGS", INSTANCE_FILE))
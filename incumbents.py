@@ -0,0 +1,88 @@
+"""
+incumbents.py
+
+Streaming incumbent: ubah solver berbasis callback (on_improve /
+should_stop) jadi generator yang meng-yield setiap incumbent baru begitu
+ditemukan, dengan pembatalan kooperatif lewat deadline atau objek event.
+
+Solver dijalankan di thread latar; generator (thread pemanggil) hanya
+menunggu di queue, jadi tidak mengganggu hot path solver. Begitu pemanggil
+berhenti mengiterasi (break / close() / generator di-garbage-collect),
+should_stop solver jadi True dan thread ditunggu sampai solver berhenti di
+pengecekan berikutnya (GA: setiap anak dan di dalam local search, Tabu/SA:
+per iterasi, OR-Tools: per solusi yang dilaporkan search).
+
+    for inc in ga_vrp.iter_incumbents(time_limit_sec=10, deadline=time.perf_counter() + 3):
+        if inc["cost"] <= target:
+            break   # GA dihentikan, hasil ini langsung dipakai
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Generator, Optional
+
+# event pembatalan: apa pun dengan is_set() (threading.Event,
+# multiprocessing.Event, ...)
+Cancel = Any
+
+
+def make_should_stop(
+    deadline: Optional[float] = None,
+    cancel: Optional[Cancel] = None,
+    extra: Optional[Callable[[], bool]] = None,
+) -> Callable[[], bool]:
+    """
+    should_stop() untuk hook solver: True kalau time.perf_counter() >=
+    deadline, cancel.is_set(), atau extra() (semua opsional).
+    """
+    def should_stop() -> bool:
+        return (
+            (deadline is not None and time.perf_counter() >= deadline)
+            or (cancel is not None and cancel.is_set())
+            or (extra is not None and extra())
+        )
+
+    return should_stop
+
+
+def stream(
+    solve: Callable[[Callable, Callable[[], bool]], Any],
+    make_item: Callable[..., Dict[str, Any]],
+    deadline: Optional[float] = None,
+    cancel: Optional[Cancel] = None,
+) -> Generator[Dict[str, Any], None, Any]:
+    """
+    Generator incumbent untuk solve(on_improve, should_stop) (blocking).
+    make_item(*args on_improve) → dict incumbent, dipanggil di thread solver
+    saat incumbent ditemukan (salin data yang masih akan diubah solver).
+    Return value generator (StopIteration.value / `yield from`) = hasil solve.
+    Exception dari solver diteruskan ke pemanggil.
+    """
+    items: "queue.Queue" = queue.Queue()
+    stop = threading.Event()
+    should_stop = make_should_stop(deadline, cancel, stop.is_set)
+
+    def on_improve(*args):
+        items.put(("incumbent", make_item(*args)))
+
+    def run():
+        try:
+            items.put(("done", solve(on_improve, should_stop)))
+        except BaseException as exc:  # diteruskan ke thread pemanggil
+            items.put(("error", exc))
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    try:
+        while True:
+            kind, value = items.get()
+            if kind == "incumbent":
+                yield value
+            elif kind == "error":
+                raise value
+            else:
+                return value
+    finally:
+        stop.set()
+        worker.join()
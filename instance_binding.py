@@ -0,0 +1,30 @@
+"""
+instance_binding.py
+
+Ganti instance global modul solver (N, CAPACITY, DIST, DEMAND, CUSTOMERS)
+tanpa import ulang. Modul solver membaca instance dari sys.argv[1] saat
+di-import; decomp_vrp.py (sub-instance per cluster), solve_service.py
+(instance per job), dan microbench.py (instance sintetis) memakai helper ini
+untuk menjalankan modul yang sama pada instance lain.
+"""
+
+from typing import Sequence
+
+
+def bind_instance(module, n: int, capacity: float, dist, demand: Sequence[float]):
+    """
+    Bind instance ke global modul solver, termasuk cache turunannya:
+    _NEIGHBORS (ALNS/HGS) dikosongkan, dan versi integer untuk callback
+    OR-Tools (modul dengan DEMAND_SCALE) dihitung ulang.
+    """
+    module.N = n
+    module.CAPACITY = capacity
+    module.DIST = dist
+    module.DEMAND = demand
+    module.CUSTOMERS = list(range(1, n))
+    if hasattr(module, "_NEIGHBORS"):
+        module._NEIGHBORS.clear()
+    if hasattr(module, "DEMAND_SCALE"):
+        module.DEMAND_INT = [int(round(d * module.DEMAND_SCALE)) for d in demand]
+        module.CAPACITY_INT = int(round(capacity * module.DEMAND_SCALE))
+        module.DIST_INT = [[int(round(d * module.DIST_SCALE)) for d in row] for row in dist]
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+instance_gen.py
+
+Generator instance CVRP sintetis dalam format .vrp yang dibaca
+parser.load_cvrp_instance:
+
+- EXPLICIT FULL_MATRIX (default, sama seperti instance yang ada; bisa asimetris)
+- EUC_2D (NODE_COORD_SECTION; file jauh lebih kecil untuk ribuan node,
+  matriks dihitung parser saat load; selalu simetris)
+
+Parameter yang bisa diatur (semua seeded → reproducible):
+- n              : jumlah node (depot + customer)
+- clustering     : fraksi customer yang dikelompokkan (0 = uniform, 1 = semua cluster)
+- num_clusters   : jumlah pusat cluster
+- cluster_spread : standar deviasi posisi customer di sekitar pusat cluster
+- asymmetry      : 0 = simetris; a > 0 → d[i][j] = e[i][j] × (1 + a·U(-1, 1))
+- demand         : distribusi demand (unit / uniform / small_large / exponential)
+- route_size     : rata-rata customer per rute → kapasitas (kecil = ketat)
+- depot          : posisi depot (center / corner / random)
+
+    python instance_gen.py 500                               # → synthetic_n500_s1.vrp
+    python instance_gen.py 2000 big.vrp --seed 7 --clustering 0.7 --num-clusters 8
+    python instance_gen.py 1000 asym.vrp --asymmetry 0.2 --demand small_large --route-size 6
+    python instance_gen.py 5000 --format euc2d
+"""
+
+import math
+import random
+import sys
+from typing import Dict, List, Optional, Tuple
+
+GRID = 1000.0
+DEMAND_TYPES = ("unit", "uniform", "small_large", "exponential")
+DEPOT_TYPES = ("center", "corner", "random")
+FORMATS = ("explicit", "euc2d")
+
+
+# ----------------------------------------------------------------------
+# Generator
+# ----------------------------------------------------------------------
+def _coords(
+    rng: random.Random,
+    n: int,
+    clustering: float,
+    num_clusters: int,
+    cluster_spread: float,
+    depot: str,
+) -> List[Tuple[float, float]]:
+    if depot == "center":
+        coords = [(GRID / 2, GRID / 2)]
+    elif depot == "corner":
+        coords = [(0.0, 0.0)]
+    elif depot == "random":
+        coords = [(rng.uniform(0, GRID), rng.uniform(0, GRID))]
+    else:
+        raise ValueError(f"Posisi depot tidak dikenal: {depot} ({', '.join(DEPOT_TYPES)})")
+
+    centers = [(rng.uniform(0, GRID), rng.uniform(0, GRID)) for _ in range(max(1, num_clusters))]
+    num_clustered = int(round((n - 1) * clustering))
+
+    for k in range(n - 1):
+        if k < num_clustered:
+            cx, cy = rng.choice(centers)
+            x = min(GRID, max(0.0, rng.gauss(cx, cluster_spread)))
+            y = min(GRID, max(0.0, rng.gauss(cy, cluster_spread)))
+        else:
+            x, y = rng.uniform(0, GRID), rng.uniform(0, GRID)
+        coords.append((round(x, 2), round(y, 2)))
+    return coords
+
+
+def _demands(rng: random.Random, n: int, demand: str) -> List[int]:
+    if demand == "unit":
+        customers = [1] * (n - 1)
+    elif demand == "uniform":
+        customers = [rng.randint(1, 10) for _ in range(n - 1)]
+    elif demand == "small_large":
+        # kebanyakan kecil, sebagian besar (pola instance X Uchoa dkk.)
+        customers = [
+            rng.randint(1, 10) if rng.random() < 0.7 else rng.randint(50, 100)
+            for _ in range(n - 1)
+        ]
+    elif demand == "exponential":
+        customers = [max(1, int(math.ceil(rng.expovariate(1 / 5.0)))) for _ in range(n - 1)]
+    else:
+        raise ValueError(f"Distribusi demand tidak dikenal: {demand} ({', '.join(DEMAND_TYPES)})")
+    return [0] + customers
+
+
+def generate_instance(
+    n: int,
+    seed: int = 1,
+    clustering: float = 0.0,
+    num_clusters: int = 5,
+    cluster_spread: float = 50.0,
+    asymmetry: float = 0.0,
+    demand: str = "uniform",
+    route_size: float = 10.0,
+    depot: str = "center",
+) -> Dict:
+    """
+    Buat instance sintetis. Return dict: name, n, capacity, coords, demands,
+    asymmetry, seed. Kapasitas = ceil(route_size × rata-rata demand customer),
+    minimal demand terbesar (supaya setiap customer feasible).
+    """
+    if n < 2:
+        raise ValueError("n minimal 2 (depot + 1 customer)")
+    if not 0.0 <= clustering <= 1.0:
+        raise ValueError("clustering harus di [0, 1]")
+    if asymmetry < 0.0:
+        raise ValueError("asymmetry harus >= 0")
+
+    rng = random.Random(seed)
+    coords = _coords(rng, n, clustering, num_clusters, cluster_spread, depot)
+    demands = _demands(rng, n, demand)
+
+    avg_demand = sum(demands) / (n - 1)
+    capacity = max(max(demands), int(math.ceil(route_size * avg_demand)))
+
+    return {
+        "name": f"SYNTHETIC_n{n}_s{seed}",
+        "n": n,
+        "capacity": capacity,
+        "coords": coords,
+        "demands": demands,
+        "asymmetry": asymmetry,
+        "seed": seed,
+    }
+
+
+def distance_row(inst: Dict, i: int, rng: Optional[random.Random] = None) -> List[int]:
+    """
+    Baris i matriks jarak (integer). Untuk asymmetry > 0, rng wajib diberikan
+    dan dipakai berurutan baris demi baris (reproducible dari seed).
+    """
+    xi, yi = inst["coords"][i]
+    row = []
+    for j, (xj, yj) in enumerate(inst["coords"]):
+        d = math.hypot(xi - xj, yi - yj)
+        if inst["asymmetry"] > 0 and i != j:
+            d *= 1.0 + inst["asymmetry"] * rng.uniform(-1.0, 1.0)
+        row.append(int(d + 0.5))
+    return row
+
+
+# ----------------------------------------------------------------------
+# Tulis .vrp
+# ----------------------------------------------------------------------
+def write_vrp(inst: Dict, path: str, fmt: str = "explicit"):
+    """Tulis instance ke .vrp (EXPLICIT FULL_MATRIX atau EUC_2D), baris demi baris."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Format tidak dikenal: {fmt} ({', '.join(FORMATS)})")
+    if fmt == "euc2d" and inst["asymmetry"] > 0:
+        raise ValueError("Format euc2d selalu simetris; pakai format explicit untuk asymmetry > 0")
+
+    n = inst["n"]
+    with open(path, "w") as f:
+        f.write(f"NAME : {inst['name']}\n")
+        f.write("TYPE : CVRP\n")
+        f.write(f"DIMENSION : {n}\n")
+        f.write(f"CAPACITY : {inst['capacity']}\n")
+
+        if fmt == "explicit":
+            f.write("EDGE_WEIGHT_TYPE : EXPLICIT\n")
+            f.write("EDGE_WEIGHT_FORMAT : FULL_MATRIX\n")
+            f.write("DISPLAY_DATA_TYPE : TWOD_DISPLAY\n\n")
+            f.write("EDGE_WEIGHT_SECTION\n")
+            rng = random.Random(inst["seed"] + 1)  # stream terpisah untuk asimetri
+            for i in range(n):
+                f.write(" ".join(map(str, distance_row(inst, i, rng))))
+                f.write("\n")
+        else:
+            f.write("EDGE_WEIGHT_TYPE : EUC_2D\n\n")
+            f.write("NODE_COORD_SECTION\n")
+            for i, (x, y) in enumerate(inst["coords"]):
+                f.write(f"{i + 1} {x} {y}\n")
+
+        f.write("\nDEMAND_SECTION\n")
+        for i, d in enumerate(inst["demands"]):
+            f.write(f"{i + 1} {d}\n")
+
+        if fmt == "explicit":
+            # koordinat hanya untuk visualisasi (TSPLIB DISPLAY_DATA_SECTION)
+            f.write("\nDISPLAY_DATA_SECTION\n")
+            for i, (x, y) in enumerate(inst["coords"]):
+                f.write(f"{i + 1} {x} {y}\n")
+
+        f.write("\nDEPOT_SECTION\n1\n-1\nEOF\n")
+
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    # argumen posisi: <n> [out.vrp]; opsi: --nama nilai
+    ARGS = [sys.argv[0]]
+    opts = {}
+    i = 1
+    while i < len(sys.argv):
+        if sys.argv[i].startswith("--"):
+            opts[sys.argv[i][2:].replace("-", "_")] = sys.argv[i + 1] if i + 1 < len(sys.argv) else None
+            i += 2
+        else:
+            ARGS.append(sys.argv[i])
+            i += 1
+
+    if len(ARGS) < 2:
+        print(__doc__)
+        sys.exit(2)
+
+    N = int(ARGS[1])
+    SEED = int(opts.get("seed", 1))
+    FORMAT = opts.get("format", "explicit")
+    OUT = ARGS[2] if len(ARGS) > 2 else f"synthetic_n{N}_s{SEED}.vrp"
+
+    inst = generate_instance(
+        N,
+        seed=SEED,
+        clustering=float(opts.get("clustering", 0.0)),
+        num_clusters=int(opts.get("num_clusters", 5)),
+        cluster_spread=float(opts.get("cluster_spread", 50.0)),
+        asymmetry=float(opts.get("asymmetry", 0.0)),
+        demand=opts.get("demand", "uniform"),
+        route_size=float(opts.get("route_size", 10.0)),
+        depot=opts.get("depot", "center"),
+    )
+    write_vrp(inst, OUT, FORMAT)
+
+    total = sum(inst["demands"])
+    print(f"Instance tersimpan di: {OUT}")
+    print(
+        f"n = {N}, capacity = {inst['capacity']}, total demand = {total}, "
+        f"min routes = {math.ceil(total / inst['capacity'])}, format = {FORMAT}"
+    )
@@ -0,0 +1,89 @@
+"""
+instrument.py
+
+Instrumentasi ringan untuk hot path solver: counter + timer kumulatif per
+nama (decode, fitness, crossover, mutation, local_search, neighborhood).
+
+Aktif hanya jika environment variable CVRP_INSTRUMENT=1 saat modul solver
+di-import. Kalau tidak aktif, dekorator @timed mengembalikan fungsi asli
+(tanpa wrapper) dan timer() mengembalikan context manager kosong, jadi
+tidak ada overhead di hot path.
+
+    CVRP_INSTRUMENT=1 python ga_vrp.py 1_FaridFajar.vrp 5
+"""
+
+import functools
+import os
+import time
+from contextlib import nullcontext
+from typing import Dict, List
+
+ENABLED = os.environ.get("CVRP_INSTRUMENT", "") not in ("", "0")
+
+COUNTS: Dict[str, int] = {}
+TIMES: Dict[str, float] = {}
+
+# urutan kolom time split di CSV ringkasan (waktu inklusif: fitness termasuk
+# decode, local_search termasuk fitness yang dipanggilnya)
+TIME_SPLIT = ("decode", "fitness", "crossover", "mutation", "local_search", "neighborhood")
+SUMMARY_HEADER = ["evals", "evals_per_sec", "iterations"] + [f"time_{k}_sec" for k in TIME_SPLIT]
+
+_NULL_TIMER = nullcontext()
+
+
+def timed(name: str):
+    """Dekorator: hitung jumlah panggilan & waktu kumulatif fungsi (jika ENABLED)."""
+    def decorator(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                TIMES[name] = TIMES.get(name, 0.0) + (time.perf_counter() - t0)
+                COUNTS[name] = COUNTS.get(name, 0) + 1
+
+        return wrapper
+
+    return decorator
+
+
+class _Timer:
+    __slots__ = ("name", "t0")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        TIMES[self.name] = TIMES.get(self.name, 0.0) + (time.perf_counter() - self.t0)
+        COUNTS[self.name] = COUNTS.get(self.name, 0) + 1
+        return False
+
+
+def timer(name: str):
+    """Context manager untuk blok inline (mis. scan neighborhood Tabu)."""
+    return _Timer(name) if ENABLED else _NULL_TIMER
+
+
+def reset():
+    COUNTS.clear()
+    TIMES.clear()
+
+
+def summary_fields(evals: int, iterations, solve_time_sec: float) -> List[str]:
+    """
+    Kolom instrumentasi untuk CSV/baris ringkasan (urut SUMMARY_HEADER).
+    evals & iterations selalu diisi; time split "-" kalau instrumentasi mati.
+    """
+    evals_per_sec = evals / solve_time_sec if solve_time_sec > 0 else 0.0
+    fields = [str(evals), f"{evals_per_sec:.1f}", str(iterations)]
+    for key in TIME_SPLIT:
+        fields.append(f"{TIMES.get(key, 0.0):.4f}" if ENABLED else "-")
+    return fields
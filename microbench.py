@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+microbench.py
+
+Microbenchmark untuk kernel hot path di bawah level solver:
+decode_routes, fitness, ox_crossover, mutate_swap, two_opt, route_local_search,
+scan neighborhood Tabu, greedy_vrp, dan load_cvrp_instance, pada instance sintetis 50 / 200 /
+1000 / 5000 node.
+
+Setiap kernel × ukuran: warmup, kalibrasi jumlah panggilan per sampel
+(seperti timeit), lalu beberapa repetisi. Hasil (median, Q1/Q3, IQR per
+panggilan) disimpan sebagai JSON supaya bisa dibandingkan antar commit.
+
+    python microbench.py                                # semua kernel & ukuran
+    python microbench.py --sizes 50,200 --out base.json
+    python microbench.py --kernels fitness,decode_routes
+    python microbench.py --full                         # tanpa batas MAX_NODES
+"""
+
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+from parser import load_cvrp_instance
+from instance_gen import generate_instance, write_vrp
+from instance_binding import bind_instance
+
+# ----------------------------------------------------------------------
+# Konfigurasi
+# ----------------------------------------------------------------------
+SIZES = (50, 200, 1000, 5000)
+KERNELS = (
+    "load_cvrp_instance",
+    "decode_routes",
+    "fitness",
+    "ox_crossover",
+    "mutate_swap",
+    "two_opt",
+    "route_local_search",
+    "tabu_neighborhood",
+    "greedy_vrp",
+)
+
+WARMUP = 1
+REPEAT = 7            # repetisi maksimum per kernel × ukuran
+MIN_REPEAT = 3        # repetisi minimum (kernel lambat)
+MIN_SAMPLE_SEC = 0.02  # satu sampel minimal selama ini (number digandakan)
+BUDGET_SEC = 10.0     # target waktu total per kernel × ukuran
+
+# two_opt & scan Tabu memanggil fitness O(n^2) kali per panggilan (O(n^3)
+# total) → default dibatasi; --full untuk semua ukuran
+MAX_NODES = {"two_opt": 200, "tabu_neighborhood": 200}
+
+INSTANCE_DIR = "bench_instances"
+INSTANCE_SEED = 2024
+
+
+# ----------------------------------------------------------------------
+# Instance sintetis
+# ----------------------------------------------------------------------
+def instance_path(n: int, seed: int = INSTANCE_SEED) -> str:
+    """Path instance sintetis n node (dibuat sekali, dipakai ulang antar run)."""
+    os.makedirs(INSTANCE_DIR, exist_ok=True)
+    path = os.path.join(INSTANCE_DIR, f"synthetic_n{n}_s{seed}.vrp")
+    if not os.path.exists(path):
+        write_vrp(generate_instance(n, seed=seed), path)
+    return path
+
+
+# ----------------------------------------------------------------------
+# Modul solver (membaca instance dari sys.argv[1] saat import)
+# ----------------------------------------------------------------------
+def _import_solvers(path: str):
+    saved = sys.argv
+    sys.argv = [saved[0], path]
+    try:
+        import ga_vrp
+        import tabu_vrp
+        import greedy_vrp
+    finally:
+        sys.argv = saved
+    return ga_vrp, tabu_vrp, greedy_vrp
+
+
+def make_kernels(path: str, n: int, capacity: float, dist, demand) -> Dict[str, Callable[[], object]]:
+    """Callable tanpa argumen per kernel, dengan input tetap (seeded)."""
+    ga_vrp, tabu_vrp, greedy_vrp = _import_solvers(path)
+    for module in (ga_vrp, tabu_vrp, greedy_vrp):
+        bind_instance(module, n, capacity, dist, demand)
+
+    rng = random.Random(n)
+    chrom = list(range(1, n))
+    rng.shuffle(chrom)
+    other = chrom[:]
+    rng.shuffle(other)
+    random.seed(n)  # ox_crossover / mutate_swap memakai modul random
+    tabu_memory = tabu_vrp.new_tabu_memory()
+
+    return {
+        "load_cvrp_instance": lambda: load_cvrp_instance(path),
+        "decode_routes": lambda: ga_vrp.decode_routes(chrom),
+        "fitness": lambda: ga_vrp.fitness(chrom),
+        "ox_crossover": lambda: ga_vrp.ox_crossover(chrom, other),
+        "mutate_swap": lambda: ga_vrp.mutate_swap(chrom, mutation_prob=1.0),
+        "two_opt": lambda: ga_vrp.two_opt(chrom),
+        "route_local_search": lambda: ga_vrp.route_local_search(chrom),
+        "tabu_neighborhood": lambda: tabu_vrp.scan_swap_neighborhood(chrom, tabu_memory, 1, float("inf")),
+        "greedy_vrp": lambda: greedy_vrp.greedy_vrp(),
+    }
+
+
+# ----------------------------------------------------------------------
+# Timing
+# ----------------------------------------------------------------------
+def _time_calls(fn: Callable[[], object], number: int) -> float:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        return time.perf_counter() - t0
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def measure(
+    fn: Callable[[], object],
+    warmup: int = WARMUP,
+    repeat: int = REPEAT,
+    min_repeat: int = MIN_REPEAT,
+    min_sample_sec: float = MIN_SAMPLE_SEC,
+    budget_sec: float = BUDGET_SEC,
+) -> dict:
+    """
+    Warmup, kalibrasi number (panggilan per sampel) sampai satu sampel
+    >= min_sample_sec, lalu repetisi sebanyak muat di budget_sec
+    (antara min_repeat dan repeat). Waktu dilaporkan per panggilan.
+    """
+    for _ in range(warmup):
+        fn()
+
+    number = 1
+    elapsed = _time_calls(fn, number)
+    while elapsed < min_sample_sec:
+        number *= 2
+        elapsed = _time_calls(fn, number)
+
+    reps = max(min_repeat, min(repeat, int(budget_sec / max(elapsed, 1e-9))))
+    samples = [elapsed / number]
+    for _ in range(reps - 1):
+        samples.append(_time_calls(fn, number) / number)
+
+    q1, median, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    return {
+        "number": number,
+        "repeat": reps,
+        "median_sec": median,
+        "q1_sec": q1,
+        "q3_sec": q3,
+        "iqr_sec": q3 - q1,
+        "min_sec": min(samples),
+        "samples_sec": samples,
+    }
+
+
+# ----------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------
+def git_commit() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_microbench(
+    sizes: Sequence[int] = SIZES,
+    kernels: Sequence[str] = KERNELS,
+    full: bool = False,
+    **measure_kwargs,
+) -> dict:
+    results: List[dict] = []
+    for n in sizes:
+        path = instance_path(n)
+        print(f"\n[Microbench] n = {n} ({path})")
+        n_loaded, capacity, dist, demand = load_cvrp_instance(path)
+        fns = make_kernels(path, n_loaded, capacity, dist, demand)
+
+        for name in kernels:
+            row = {"kernel": name, "nodes": n}
+            limit = MAX_NODES.get(name)
+            if not full and limit is not None and n > limit:
+                row["skipped"] = f"n > {limit} (pakai --full)"
+                print(f"MICROBENCH|{name}|{n}|skipped")
+                results.append(row)
+                continue
+
+            row.update(measure(fns[name], **measure_kwargs))
+            print(
+                f"MICROBENCH|{name}|{n}|"
+                f"{row['median_sec']:.6e}|{row['iqr_sec']:.3e}|"
+                f"{row['repeat']}x{row['number']}"
+            )
+            results.append(row)
+
+        del dist, demand, fns
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "instance_seed": INSTANCE_SEED,
+        },
+        "results": results,
+    }
+
+
+def _parse_list(arg: Optional[str], cast=str):
+    return [cast(x) for x in arg.split(",") if x] if arg else None
+
+
+if __name__ == "__main__":
+    opts = {}
+    args = sys.argv[1:]
+    for i, a in enumerate(args):
+        if a.startswith("--") and a != "--full":
+            opts[a[2:]] = args[i + 1] if i + 1 < len(args) else None
+
+    sizes = _parse_list(opts.get("sizes"), int) or SIZES
+    kernels = _parse_list(opts.get("kernels")) or KERNELS
+    unknown = [k for k in kernels if k not in KERNELS]
+    if unknown:
+        print(f"Kernel tidak dikenal: {unknown}; pilihan: {', '.join(KERNELS)}")
+        sys.exit(2)
+
+    report = run_microbench(sizes, kernels, full="--full" in args)
+
+    out = opts.get("out") or f"microbench_{report['meta']['commit']}.json"
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Hasil microbenchmark tersimpan di: {out}")
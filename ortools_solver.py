@@ -1,31 +1,46 @@
-from typing import List
+from typing import List, Dict, Any, Optional, Callable, Generator
 import sys
-import csv
 import os
 import time
 import math
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 
 import matplotlib.pyplot as plt
 
 from ortools.constraint_solver import routing_enums_pb2, pywrapcp
 from parser import load_cvrp_instance
+from constructive import greedy_routes, savings_routes
+from convergence import append_trace_csv
+import results_store
+import incumbents
+import instrument
+import profiling
+import timing
 
 # ---------------------------------------------------------
 # Pilih instance dari argumen CLI
 # ---------------------------------------------------------
-INSTANCE_FILE = sys.argv[1] if len(sys.argv) > 1 else "output_cvrp.vrp"
+# argumen posisi; flag "--..." (mis. --profile) diabaikan
+ARGS = [a for a in sys.argv if not a.startswith("--")]
+INSTANCE_FILE = ARGS[1] if len(ARGS) > 1 else "output_cvrp.vrp"
 
 # ---------------------------------------------------------
 # Load instance dari file .vrp
 # ---------------------------------------------------------
-N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
+with timing.phase("setup"):
+    N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
 DEPOT = 0
 
-# OR-Tools butuh demand integer → kita scale
+# OR-Tools butuh demand & jarak integer → kita scale (dibulatkan, bukan dipotong)
 DEMAND_SCALE = 100  # 1 unit = 0.01 di data asli
 DEMAND_INT = [int(round(d * DEMAND_SCALE)) for d in DEMAND]
 CAPACITY_INT = int(round(CAPACITY * DEMAND_SCALE))
 
+DIST_SCALE = 1  # jarak di instance sudah integer; naikkan kalau jarak pecahan
+with timing.phase("setup"):
+    DIST_INT = [[int(round(d * DIST_SCALE)) for d in row] for row in DIST]
+
 
 # ---------------------------------------------------------
 # Visualisasi rute (layout lingkaran sederhana)
@@ -58,29 +73,42 @@ def plot_routes(routes: List[List[int]], title: str, filename: str):
 
 
 # ---------------------------------------------------------
-# Helper: solve CVRP/TSP dengan OR-Tools Routing
+# Helper: bangun model Routing (sekali, bisa dipakai ulang antar run)
 # ---------------------------------------------------------
-def solve_with_ortools(num_vehicles: int = 1, time_limit_sec: int = 30):
+def build_routing_model(num_vehicles: int = 1):
+    """
+    Bangun RoutingIndexManager + RoutingModel beserta callback jarak dan
+    dimension kapasitas. Hasilnya bisa dioper ke solve_with_ortools(model=...)
+    berkali-kali supaya model tidak dibangun ulang di setiap run.
+    """
     # Manager: mapping index internal ↔ node (0..N-1)
     manager = pywrapcp.RoutingIndexManager(N, num_vehicles, DEPOT)
     routing = pywrapcp.RoutingModel(manager)
 
-    # ---- Distance callback ----
-    def distance_callback(from_index, to_index):
-        from_node = manager.IndexToNode(from_index)
-        to_node = manager.IndexToNode(to_index)
-        return int(DIST[from_node][to_node])
+    # ---- Distance & demand ----
+    # Matriks/vektor integer diregistrasi langsung ke OR-Tools supaya evaluasi
+    # arc tetap di C++ (tanpa callback Python per arc). OR-Tools lama yang
+    # belum punya RegisterTransitMatrix memakai callback Python.
+    if hasattr(routing, "RegisterTransitMatrix"):
+        transit_cb_index = routing.RegisterTransitMatrix(DIST_INT)
+        demand_cb_index = routing.RegisterUnaryTransitVector(DEMAND_INT)
+        callbacks = ()
+    else:
+        def distance_callback(from_index, to_index):
+            from_node = manager.IndexToNode(from_index)
+            to_node = manager.IndexToNode(to_index)
+            return DIST_INT[from_node][to_node]
+
+        def demand_callback(from_index):
+            from_node = manager.IndexToNode(from_index)
+            return DEMAND_INT[from_node]
+
+        transit_cb_index = routing.RegisterTransitCallback(distance_callback)
+        demand_cb_index = routing.RegisterUnaryTransitCallback(demand_callback)
+        callbacks = (distance_callback, demand_callback)
 
-    transit_cb_index = routing.RegisterTransitCallback(distance_callback)
     routing.SetArcCostEvaluatorOfAllVehicles(transit_cb_index)
 
-    # ---- Demand / Capacity dimension ----
-    def demand_callback(from_index):
-        from_node = manager.IndexToNode(from_index)
-        return DEMAND_INT[from_node]
-
-    demand_cb_index = routing.RegisterUnaryTransitCallback(demand_callback)
-
     routing.AddDimensionWithVehicleCapacity(
         demand_cb_index,
         0,
@@ -89,28 +117,77 @@ def solve_with_ortools(num_vehicles: int = 1, time_limit_sec: int = 30):
         "Capacity",
     )
 
-    # ---- Search parameters ----
+    model = {
+        "manager": manager,
+        "routing": routing,
+        "num_vehicles": num_vehicles,
+        # callback disimpan supaya tidak di-garbage-collect selama model hidup
+        "callbacks": callbacks,
+        # hook per-solve (diisi solve_with_ortools), dipanggil di setiap solusi baru
+        "on_improve": None,
+        "should_stop": None,
+        "best_cost": float("inf"),
+        # convergence trace per solve: (time_sec, jumlah solusi, best_cost)
+        "solve_start": 0.0,
+        "solutions": 0,
+        "trace": [],
+    }
+
+    def at_solution():
+        # GLS juga melapor solusi yang lebih jelek → hanya catat perbaikan
+        model["solutions"] += 1
+        cost = routing.CostVar().Value() / DIST_SCALE
+        improved = cost < model["best_cost"]
+        if improved:
+            model["best_cost"] = cost
+            model["trace"].append(
+                (time.perf_counter() - model["solve_start"], model["solutions"], cost)
+            )
+        if model["on_improve"] is not None and improved:
+            routes = []
+            for vehicle_id in range(num_vehicles):
+                index = routing.NextVar(routing.Start(vehicle_id)).Value()
+                route = [DEPOT]
+                while not routing.IsEnd(index):
+                    route.append(manager.IndexToNode(index))
+                    index = routing.NextVar(index).Value()
+                if len(route) > 1:
+                    routes.append(route + [DEPOT])
+            model["on_improve"](routes, cost)
+        if model["should_stop"] is not None and model["should_stop"]():
+            routing.solver().FinishCurrentSearch()
+
+    routing.AddAtSolutionCallback(at_solution)
+    model["callbacks"] = callbacks + (at_solution,)
+    return model
+
+
+def make_search_params(
+    time_limit_sec: int,
+    first_solution: str = "PATH_CHEAPEST_ARC",
+    metaheuristic: str = "GUIDED_LOCAL_SEARCH",
+):
+    """Search parameters dari nama enum OR-Tools (mis. "SAVINGS", "TABU_SEARCH")."""
     search_params = pywrapcp.DefaultRoutingSearchParameters()
-    search_params.first_solution_strategy = (
-        routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC
+    search_params.first_solution_strategy = getattr(
+        routing_enums_pb2.FirstSolutionStrategy, first_solution
     )
-    search_params.local_search_metaheuristic = (
-        routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH
+    search_params.local_search_metaheuristic = getattr(
+        routing_enums_pb2.LocalSearchMetaheuristic, metaheuristic
     )
     search_params.time_limit.FromSeconds(time_limit_sec)
+    return search_params
 
-    # ---- Solve ----
-    solution = routing.SolveWithParameters(search_params)
 
-    if not solution:
-        print("No solution found by OR-Tools.")
-        return None
+def extract_routes(model, solution):
+    """Ambil rute (list node termasuk depot) dan total jarak dari assignment."""
+    manager = model["manager"]
+    routing = model["routing"]
 
-    # ---- Ekstrak rute ----
     routes: List[List[int]] = []
     total_distance = 0
 
-    for vehicle_id in range(num_vehicles):
+    for vehicle_id in range(model["num_vehicles"]):
         index = routing.Start(vehicle_id)
         if routing.IsEnd(solution.Value(routing.NextVar(index))):
             continue
@@ -130,12 +207,216 @@ def solve_with_ortools(num_vehicles: int = 1, time_limit_sec: int = 30):
         routes.append(route)
         total_distance += route_distance
 
+    if DIST_SCALE != 1:
+        total_distance = total_distance / DIST_SCALE
+
+    return routes, total_distance
+
+
+# ---------------------------------------------------------
+# Helper: solve CVRP/TSP dengan OR-Tools Routing
+# ---------------------------------------------------------
+def solve_with_ortools(
+    num_vehicles: int = 1,
+    time_limit_sec: int = 30,
+    initial_routes: Optional[List[List[int]]] = None,
+    model=None,
+    first_solution: str = "PATH_CHEAPEST_ARC",
+    metaheuristic: str = "GUIDED_LOCAL_SEARCH",
+    on_improve: Optional[Callable[[List[List[int]], float], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+):
+    """
+    Solve dengan OR-Tools.
+    - model         : hasil build_routing_model(); None → bangun baru
+    - initial_routes: warm-start (mis. dari greedy/solver lain), list rute
+                      dengan atau tanpa depot; dibaca via
+                      RoutesToAssignment sehingga GLS langsung
+                      memperbaiki solusi, tanpa fase konstruksi.
+    - on_improve    : on_improve(routes, cost) setiap search menemukan
+                      solusi yang lebih baik dari sebelumnya
+    - should_stop   : dicek di setiap solusi; True → search dihentikan
+    """
+    if model is None:
+        model = build_routing_model(num_vehicles)
+    manager = model["manager"]
+    routing = model["routing"]
+    model["on_improve"] = on_improve
+    model["should_stop"] = should_stop
+    model["best_cost"] = float("inf")
+    model["solve_start"] = time.perf_counter()
+    model["solutions"] = 0
+    model["trace"] = []
+
+    # ---- Search parameters ----
+    search_params = make_search_params(time_limit_sec, first_solution, metaheuristic)
+
+    # ---- Solve ----
+    if initial_routes:
+        vehicle_routes = [[node for node in r if node != DEPOT] for r in initial_routes]
+        vehicle_routes = [r for r in vehicle_routes if r]
+        if len(vehicle_routes) > model["num_vehicles"]:
+            raise ValueError(
+                f"initial_routes punya {len(vehicle_routes)} rute, "
+                f"tapi model hanya punya {model['num_vehicles']} kendaraan"
+            )
+        vehicle_routes += [[] for _ in range(model["num_vehicles"] - len(vehicle_routes))]
+
+        routing.CloseModelWithParameters(search_params)
+        index_routes = [[manager.NodeToIndex(node) for node in r] for r in vehicle_routes]
+        # RoutesToAssignment ke assignment baru (bukan ReadAssignmentFromRoutes,
+        # yang gagal kalau model sudah pernah di-solve sebelumnya)
+        initial_solution = routing.solver().Assignment()
+        if not routing.RoutesToAssignment(index_routes, True, True, initial_solution):
+            print("[OR-Tools] Warm-start routes tidak valid, fallback ke first solution.")
+            solution = routing.SolveWithParameters(search_params)
+        else:
+            solution = routing.SolveFromAssignmentWithParameters(
+                initial_solution, search_params
+            )
+    else:
+        solution = routing.SolveWithParameters(search_params)
+
+    if not solution:
+        print("No solution found by OR-Tools.")
+        return None
+
+    # ---- Ekstrak rute ----
+    routes, total_distance = extract_routes(model, solution)
+
     return {
         "routes": routes,
         "total_distance": total_distance,
+        "trace": model["trace"],
+        "solutions": model["solutions"],
     }
 
 
+# ---------------------------------------------------------
+# Streaming incumbent (generator)
+# ---------------------------------------------------------
+def iter_incumbents(
+    num_vehicles: Optional[int] = None,
+    deadline: Optional[float] = None,
+    cancel=None,
+    model=None,
+    **kwargs,
+) -> Generator[Dict[str, Any], None, Optional[Dict[str, Any]]]:
+    """
+    Versi generator solve_with_ortools(**kwargs): yield dict "routes",
+    "cost", "elapsed", "evals" (jumlah solusi yang dilaporkan search sejauh
+    ini) setiap search menemukan solusi yang lebih baik. Berhenti lebih awal
+    kalau time.perf_counter() >= deadline, cancel.is_set(), atau pemanggil
+    berhenti mengiterasi (dicek di setiap solusi yang dilaporkan search).
+    num_vehicles None → seperti CLI dengan warm-start: initial_routes (default
+    rute greedy) dipakai sebagai warm-start, satu kendaraan per rute.
+    Return value generator = hasil solve_with_ortools.
+    """
+    if num_vehicles is None:
+        if model is not None:
+            num_vehicles = model["num_vehicles"]
+        else:
+            if kwargs.get("initial_routes") is None:
+                kwargs["initial_routes"] = greedy_routes(DIST, DEMAND, CAPACITY)
+            num_vehicles = len(kwargs["initial_routes"])
+    if model is None:
+        model = build_routing_model(num_vehicles)
+    start = time.perf_counter()
+
+    def make_item(routes, cost):
+        return {
+            "routes": [r[:] for r in routes],
+            "cost": cost,
+            "elapsed": time.perf_counter() - start,
+            "evals": model["solutions"],
+        }
+
+    def solve(on_improve, should_stop):
+        return solve_with_ortools(
+            num_vehicles=num_vehicles, model=model,
+            on_improve=on_improve, should_stop=should_stop, **kwargs,
+        )
+
+    return (yield from incumbents.stream(solve, make_item, deadline, cancel))
+
+
+# ---------------------------------------------------------
+# Portfolio paralel: beberapa konfigurasi OR-Tools sekaligus
+# ---------------------------------------------------------
+# (first solution strategy, local search metaheuristic), urut prioritas:
+# kalau core lebih sedikit dari jumlah konfigurasi, yang di depan yang jalan.
+PORTFOLIO_CONFIGS = [
+    ("PATH_CHEAPEST_ARC", "GUIDED_LOCAL_SEARCH"),
+    ("SAVINGS", "GUIDED_LOCAL_SEARCH"),
+    ("PATH_CHEAPEST_ARC", "TABU_SEARCH"),
+    ("CHRISTOFIDES", "SIMULATED_ANNEALING"),
+    ("PARALLEL_CHEAPEST_INSERTION", "GUIDED_LOCAL_SEARCH"),
+    ("LOCAL_CHEAPEST_INSERTION", "TABU_SEARCH"),
+    ("LOCAL_CHEAPEST_ARC", "GUIDED_LOCAL_SEARCH"),
+    ("GLOBAL_CHEAPEST_ARC", "SIMULATED_ANNEALING"),
+]
+
+
+def _portfolio_worker(args):
+    """Worker proses: bangun model sendiri lalu solve satu konfigurasi."""
+    num_vehicles, time_limit_sec, first_solution, metaheuristic, initial_routes, worker_idx = args
+    timing.pin_cpus(worker_idx)
+    start = time.perf_counter()
+    result = solve_with_ortools(
+        num_vehicles=num_vehicles,
+        time_limit_sec=time_limit_sec,
+        initial_routes=initial_routes,
+        first_solution=first_solution,
+        metaheuristic=metaheuristic,
+    )
+    elapsed = time.perf_counter() - start
+    if result is not None:
+        result["config"] = f"{first_solution}+{metaheuristic}"
+        result["solve_time"] = elapsed
+    return result
+
+
+def solve_portfolio(
+    num_vehicles: int = 1,
+    time_limit_sec: int = 30,
+    configs=None,
+    max_workers: Optional[int] = None,
+    initial_routes: Optional[List[List[int]]] = None,
+):
+    """
+    Jalankan beberapa konfigurasi OR-Tools paralel (satu proses per
+    konfigurasi) dengan time limit yang sama, lalu ambil hasil terbaik.
+    Jumlah konfigurasi dibatasi max_workers (default: jumlah core) supaya
+    wall-clock tetap ≈ time_limit_sec.
+
+    Return: hasil terbaik + "config" pemenang + "portfolio" (semua hasil).
+    """
+    configs = list(configs or PORTFOLIO_CONFIGS)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    configs = configs[:max(1, max_workers)]
+
+    jobs = [
+        (num_vehicles, time_limit_sec, fs, mh, initial_routes, idx)
+        for idx, (fs, mh) in enumerate(configs)
+    ]
+    with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+        results = list(pool.map(_portfolio_worker, jobs))
+
+    portfolio = []
+    best = None
+    for (fs, mh), res in zip(configs, results):
+        cost = res["total_distance"] if res is not None else None
+        portfolio.append({"config": f"{fs}+{mh}", "total_distance": cost})
+        if res is not None and (best is None or res["total_distance"] < best["total_distance"]):
+            best = res
+
+    if best is None:
+        return None
+    best["portfolio"] = portfolio
+    return best
+
+
 # ---------------------------------------------------------
 # Analisis hasil
 # ---------------------------------------------------------
@@ -174,30 +455,72 @@ def analyze_routes(routes: List[List[int]]):
 # Main
 # ---------------------------------------------------------
 if __name__ == "__main__":
+    profiling.maybe_start(INSTANCE_FILE, "ortools")
+    timing.pin_cpus()
     print(f"Using instance file: {INSTANCE_FILE}")
 
     # --- berapa kali mau di-run (num_runs) dari CLI ---
     # Contoh: python ortools_solver.py 1_FaridFajar.vrp 5
-    NUM_RUNS = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    NUM_RUNS = int(ARGS[2]) if len(ARGS) > 2 else 1
     print(f"Number of OR-Tools runs: {NUM_RUNS}")
 
     # --- batas waktu per run (samakan dengan GA & Tabu) ---
     TIME_LIMIT_PER_RUN = 10.0  # detik
     print(f"Time limit per OR-Tools run: {TIME_LIMIT_PER_RUN} seconds")
 
+    # --- mode portfolio: python ortools_solver.py <file> <runs> [warm] --portfolio ---
+    PORTFOLIO = "--portfolio" in sys.argv
+    if PORTFOLIO:
+        print(f"Portfolio mode: up to {os.cpu_count() or 1} configs in parallel")
+
+    # --- warm-start opsional: python ortools_solver.py <file> <runs> greedy|savings ---
+    WARM_START = ARGS[3] if len(ARGS) > 3 else None
+    NUM_VEHICLES = 1
+    initial_routes = None
+    if WARM_START == "greedy":
+        initial_routes = greedy_routes(DIST, DEMAND, CAPACITY)
+    elif WARM_START == "savings":
+        initial_routes = savings_routes(DIST, DEMAND, CAPACITY)
+    elif WARM_START:
+        print(f"Warm-start '{WARM_START}' tidak dikenal (pilihan: greedy, savings)")
+        sys.exit(1)
+    if initial_routes is not None:
+        # setiap rute warm-start butuh satu kendaraan
+        NUM_VEHICLES = max(NUM_VEHICLES, len(initial_routes))
+    print(f"Warm-start: {WARM_START or 'none (PATH_CHEAPEST_ARC)'}")
+
+    # --- model dibangun sekali, dipakai ulang di semua run ---
+    # (portfolio: setiap worker membangun model sendiri)
+    with timing.phase("setup"):
+        model = None if PORTFOLIO else build_routing_model(NUM_VEHICLES)
+
     costs = []
     times = []
+    run_traces = []
+    total_solutions = 0
     best_result = None
     best_run_idx = None
+    STARTED_AT = datetime.now().isoformat(timespec="seconds")
 
     for r in range(NUM_RUNS):
         print(f"\n=== OR-TOOLS RUN {r+1}/{NUM_RUNS} ===")
         start_time = time.perf_counter()
-        result = solve_with_ortools(
-            num_vehicles=1,
-            time_limit_sec=int(TIME_LIMIT_PER_RUN),
-        )
+        timing.start("solve")
+        if PORTFOLIO:
+            result = solve_portfolio(
+                num_vehicles=NUM_VEHICLES,
+                time_limit_sec=int(TIME_LIMIT_PER_RUN),
+                initial_routes=initial_routes,
+            )
+        else:
+            result = solve_with_ortools(
+                num_vehicles=NUM_VEHICLES,
+                time_limit_sec=int(TIME_LIMIT_PER_RUN),
+                initial_routes=initial_routes,
+                model=model,
+            )
         end_time = time.perf_counter()
+        timing.stop("solve")
         solve_time_sec = end_time - start_time
 
         if result is None:
@@ -208,18 +531,26 @@ if __name__ == "__main__":
         routes = result["routes"]
 
         print(f"Run {r+1}: objective = {total_distance}, time = {solve_time_sec:.4f} s")
+        if PORTFOLIO:
+            for entry in result["portfolio"]:
+                print(f"  - {entry['config']}: {entry['total_distance']}")
+            print(f"  Winner: {result['config']}")
 
         costs.append(total_distance)
         times.append(solve_time_sec)
+        run_traces.append({"run": r + 1, "seed": "-", "trace": result["trace"]})
+        total_solutions += result["solutions"]
 
         if best_result is None or total_distance < best_result["total_distance"]:
             best_result = {
                 "routes": routes,
                 "total_distance": total_distance,
                 "solve_time": solve_time_sec,
+                "config": result.get("config"),
             }
             best_run_idx = r + 1
 
+    timing.start("report")
     if best_result is None:
         print("No solution found in any run.")
         sys.exit(0)
@@ -242,6 +573,9 @@ if __name__ == "__main__":
     print(f"Worst cost    : {worst_cost}")
     print(f"Avg time (sec): {avg_solve_time:.4f}")
 
+    # instrumentasi: evals = jumlah solusi yang dilaporkan search OR-Tools
+    instr_fields = instrument.summary_fields(total_solutions, "-", sum(times))
+
     # Analisis & visualisasi untuk rute terbaik saja
     stats = analyze_routes(best_result["routes"])
 
@@ -269,15 +603,17 @@ if __name__ == "__main__":
         f"{total_demand:.2f}|"
         f"{route_str}|"
         f"{best_solve_time:.4f}|"
-        f"{avg_solve_time:.4f}"
+        f"{avg_solve_time:.4f}|"
+        + "|".join(instr_fields)
     )
 
     print("\n" + line_text)
+    if PORTFOLIO:
+        print(f"ORTOOLS_PORTFOLIO|{INSTANCE_FILE}|{best_result['config']}")
 
     # ---------- SIMPAN KE FILE <basename>_ortools_summary.csv ----------
     base_name = os.path.splitext(os.path.basename(INSTANCE_FILE))[0]
     summary_file = f"{base_name}_ortools_summary.csv"
-    file_exists = os.path.exists(summary_file)
 
     header = [
         "instance_file",
@@ -294,7 +630,7 @@ if __name__ == "__main__":
         "route",
         "best_solve_time_sec",
         "avg_solve_time_sec",
-    ]
+    ] + instrument.SUMMARY_HEADER
 
     row = [
         INSTANCE_FILE,
@@ -311,14 +647,28 @@ if __name__ == "__main__":
         route_str,
         f"{best_solve_time:.4f}",
         f"{avg_solve_time:.4f}",
-    ]
+    ] + instr_fields
+
+    ORTOOLS_PARAMS = {
+        "num_vehicles": NUM_VEHICLES,
+        "time_limit_sec": TIME_LIMIT_PER_RUN,
+        "warm_start": WARM_START,
+        "portfolio": PORTFOLIO,
+        "num_runs": NUM_RUNS,
+    }
+    results_store.save_result(
+        INSTANCE_FILE, "ortools", ORTOOLS_PARAMS, header, row, run_traces, STARTED_AT, summary_file,
+    )
 
-    with open(summary_file, "a", newline="") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(header)
-        writer.writerow(row)
+    # ---------- CONVERGENCE TRACE <basename>_ortools_trace.csv ----------
+    # (evals untuk OR-Tools = jumlah solusi yang dilaporkan search)
+    append_trace_csv(
+        f"{base_name}_ortools_trace.csv", INSTANCE_FILE, "OR-Tools", STARTED_AT, run_traces
+    )
 
     # ---------- PLOT RUTE TERBAIK ----------
     plot_filename = f"{base_name}_ortools_route.png"
     plot_routes(best_result["routes"], f"OR-Tools Best Route - {INSTANCE_FILE}", plot_filename)
+
+    timing.stop("report")
+    print(timing.timing_line("OR-Tools", INSTANCE_FILE))
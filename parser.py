@@ -1,6 +1,10 @@
+import math
+from typing import List, Optional, Tuple
+
+
 def load_cvrp_instance(path: str):
     """
-    Parse file .vrp (CVRP, EXPLICIT FULL_MATRIX) dan kembalikan:
+    Parse file .vrp (CVRP, EXPLICIT FULL_MATRIX atau EUC_2D) dan kembalikan:
     - n          : jumlah node (depot + customer)
     - capacity   : kapasitas kendaraan
     - dist       : matriks jarak [n][n]
@@ -14,6 +18,9 @@ def load_cvrp_instance(path: str):
         DEMAND_SECTION
         node demand
         ...
+
+    Untuk EDGE_WEIGHT_TYPE : EUC_2D, matriks dihitung dari NODE_COORD_SECTION
+    (jarak Euclid dibulatkan, konvensi TSPLIB).
     """
     with open(path, "r") as f:
         # buang baris kosong & strip whitespace
@@ -21,6 +28,7 @@ def load_cvrp_instance(path: str):
 
     n = None
     capacity = None
+    edge_weight_type = "EXPLICIT"
 
     i = 0
     # cari DIMENSION, CAPACITY dan EDGE_WEIGHT_SECTION
@@ -32,7 +40,9 @@ def load_cvrp_instance(path: str):
             n = int(line.split(":")[1])
         elif line.startswith("CAPACITY"):
             capacity = float(line.split(":")[1])
-        elif line == "EDGE_WEIGHT_SECTION":
+        elif line.startswith("EDGE_WEIGHT_TYPE"):
+            edge_weight_type = line.split(":")[1].strip()
+        elif line == "EDGE_WEIGHT_SECTION" or line == "NODE_COORD_SECTION":
             i += 1  # posisi baris pertama matriks
             break
 
@@ -41,14 +51,29 @@ def load_cvrp_instance(path: str):
     if n is None or capacity is None:
         raise ValueError("DIMENSION atau CAPACITY tidak ditemukan di file .vrp")
 
-    # baca matriks jarak n×n
-    dist = []
-    for r in range(n):
-        parts = lines[i + r].split()
-        if len(parts) != n:
-            raise ValueError(f"Row {r} di EDGE_WEIGHT_SECTION tidak punya {n} kolom")
-        row = list(map(float, parts))
-        dist.append(row)
+    if edge_weight_type == "EUC_2D":
+        # baca koordinat n node lalu hitung matriks jarak
+        coords = [None] * n
+        for r in range(n):
+            parts = lines[i + r].split()
+            if len(parts) != 3:
+                raise ValueError(f"Row {r} di NODE_COORD_SECTION harus 'node x y'")
+            coords[int(parts[0]) - 1] = (float(parts[1]), float(parts[2]))
+        dist = [
+            [float(int(math.hypot(xi - xj, yi - yj) + 0.5)) for xj, yj in coords]
+            for xi, yi in coords
+        ]
+    elif edge_weight_type == "EXPLICIT":
+        # baca matriks jarak n×n
+        dist = []
+        for r in range(n):
+            parts = lines[i + r].split()
+            if len(parts) != n:
+                raise ValueError(f"Row {r} di EDGE_WEIGHT_SECTION tidak punya {n} kolom")
+            row = list(map(float, parts))
+            dist.append(row)
+    else:
+        raise ValueError(f"EDGE_WEIGHT_TYPE {edge_weight_type} belum didukung")
     i += n
 
     # lompat ke DEMAND_SECTION
@@ -68,3 +93,34 @@ def load_cvrp_instance(path: str):
         i += 1
 
     return n, capacity, dist, demands
+
+
+def load_coordinates(path: str) -> Optional[List[Tuple[float, float]]]:
+    """
+    Koordinat node (index 0 = depot) dari NODE_COORD_SECTION atau
+    DISPLAY_DATA_SECTION, atau None kalau file tidak punya koordinat
+    (mis. instance spreadsheet yang hanya berisi matriks jarak).
+    """
+    n = None
+    coords = None
+    section = False
+    with open(path, "r") as f:
+        for raw in f:
+            line = raw.strip()
+            if not line:
+                continue
+            if line.startswith("DIMENSION"):
+                n = int(line.split(":")[1])
+            elif line in ("NODE_COORD_SECTION", "DISPLAY_DATA_SECTION"):
+                if n is None:
+                    return None
+                coords = [None] * n
+                section = True
+            elif section:
+                parts = line.split()
+                if len(parts) != 3 or not parts[0].isdigit():
+                    break
+                coords[int(parts[0]) - 1] = (float(parts[1]), float(parts[2]))
+    if coords is None or any(c is None for c in coords):
+        return None
+    return coords
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+perf_gate.py
+
+Regression gate performa terhadap baseline yang disimpan (offline, satu mesin).
+
+    python perf_gate.py baseline [nama] [--repeats 3]   # jalankan benchmark, simpan baselines/<nama>.json
+    python perf_gate.py compare  [nama] [--repeats 3]   # jalankan benchmark, bandingkan dengan baseline
+    python perf_gate.py compare  [nama] --reuse         # pakai hasil benchmark yang sudah ada di disk (hanya untuk compare)
+
+Metrik per solver × instance:
+- cost           : best cost akhir setiap run (dari *_trace.csv batch terbaru)
+- time_sec       : avg_time_sec dari benchmark_summary.csv
+- evals_per_sec  : throughput dari benchmark_summary.csv
+
+Setiap repetisi benchmark menambah satu sampel time/throughput dan num_runs
+sampel cost. Regresi = uji Mann-Whitney satu sisi (p <= ALPHA) DAN perubahan
+median melewati MIN_EFFECT. Ada regresi (atau metrik baseline hilang) →
+exit code 1; laporan di perf_gate_report.csv. Metrik yang jumlah sampelnya
+terlalu sedikit untuk bisa mencapai p <= ALPHA (mis. time/throughput dengan
+--reuse, satu sampel) dilaporkan "insufficient samples", bukan "ok".
+"""
+
+import csv
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence
+
+from convergence import load_latest_traces
+from microbench import git_commit
+
+BASELINE_DIR = "baselines"
+SUMMARY_CSV = "benchmark_summary.csv"
+REPORT_CSV = "perf_gate_report.csv"
+
+ALPHA = 0.05
+# perubahan relatif minimum (arah memburuk) supaya dianggap regresi
+MIN_EFFECT = {"cost": 0.01, "time_sec": 0.05, "evals_per_sec": 0.05}
+# True → nilai lebih kecil lebih baik
+LOWER_IS_BETTER = {"cost": True, "time_sec": True, "evals_per_sec": False}
+METRICS = ("cost", "time_sec", "evals_per_sec")
+EXACT_MAX_COMBINATIONS = 20000
+
+REPORT_HEADER = [
+    "instance",
+    "algorithm",
+    "metric",
+    "baseline_n",
+    "current_n",
+    "baseline_median",
+    "current_median",
+    "change_pct",
+    "p_value",
+    "status",
+]
+
+
+# ----------------------------------------------------------------------
+# Statistik
+# ----------------------------------------------------------------------
+def _u_statistic(x: Sequence[float], y: Sequence[float]) -> float:
+    """U = jumlah pasangan (xi > yj) + 0.5 × (xi == yj)."""
+    u = 0.0
+    for a in x:
+        for b in y:
+            if a > b:
+                u += 1.0
+            elif a == b:
+                u += 0.5
+    return u
+
+
+def mann_whitney_greater(x: Sequence[float], y: Sequence[float]) -> float:
+    """
+    p-value satu sisi H1: x cenderung lebih besar dari y.
+    Exact (enumerasi semua pembagian sampel gabungan) kalau kombinasi
+    <= EXACT_MAX_COMBINATIONS, selain itu aproksimasi normal dengan koreksi
+    ties dan continuity.
+    """
+    n, m = len(x), len(y)
+    if n == 0 or m == 0:
+        return 1.0
+    u_obs = _u_statistic(x, y)
+    pooled = list(x) + list(y)
+
+    if math.comb(n + m, n) <= EXACT_MAX_COMBINATIONS:
+        hits = 0
+        total = 0
+        for idx in combinations(range(n + m), n):
+            chosen = set(idx)
+            xs = [pooled[i] for i in idx]
+            ys = [pooled[i] for i in range(n + m) if i not in chosen]
+            if _u_statistic(xs, ys) >= u_obs - 1e-12:
+                hits += 1
+            total += 1
+        return hits / total
+
+    # aproksimasi normal
+    counts: Dict[float, int] = {}
+    for v in pooled:
+        counts[v] = counts.get(v, 0) + 1
+    tie_term = sum(t ** 3 - t for t in counts.values())
+    nm = n + m
+    var = n * m / 12.0 * ((nm + 1) - tie_term / (nm * (nm - 1)))
+    if var <= 0:
+        return 1.0
+    z = (u_obs - n * m / 2.0 - 0.5) / math.sqrt(var)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def min_p_value(n: int, m: int) -> float:
+    """
+    p-value terkecil yang mungkin dari mann_whitney_greater untuk ukuran
+    sampel n dan m (semua x di atas semua y, tanpa ties).
+    """
+    if n == 0 or m == 0:
+        return 1.0
+    if math.comb(n + m, n) <= EXACT_MAX_COMBINATIONS:
+        return 1.0 / math.comb(n + m, n)
+    return 0.0
+
+
+def _median(values: Sequence[float]) -> float:
+    s = sorted(values)
+    k = len(s)
+    return s[k // 2] if k % 2 else 0.5 * (s[k // 2 - 1] + s[k // 2])
+
+
+# ----------------------------------------------------------------------
+# Snapshot hasil benchmark
+# ----------------------------------------------------------------------
+def _to_float(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def collect_snapshot(summary_csv: str = SUMMARY_CSV, trace_pattern: str = "*_trace.csv") -> Dict[str, dict]:
+    """
+    Ambil metrik dari satu eksekusi benchmark_all.py:
+    {"<instance>|<algorithm>": {"cost": [...], "time_sec": [...], "evals_per_sec": [...]}}
+    """
+    traces = load_latest_traces(trace_pattern)
+    snapshot: Dict[str, dict] = {}
+
+    with open(summary_csv, newline="") as f:
+        for row in csv.DictReader(f):
+            inst = os.path.basename(row["instance"])
+            algo = row["algorithm"]
+            # trace OR-Tools portfolio tetap berlabel "OR-Tools"
+            runs = traces.get((inst, algo.split(" (")[0]), {})
+            if runs:
+                costs = [points[-1][2] for _, points in sorted(runs.items())]
+            else:
+                costs = [float(row["best_cost"])]
+
+            metrics = {"cost": costs, "time_sec": [], "evals_per_sec": []}
+            for metric, column in (("time_sec", "avg_time_sec"), ("evals_per_sec", "evals_per_sec")):
+                value = _to_float(row.get(column))
+                if value is not None:
+                    metrics[metric].append(value)
+            snapshot[f"{inst}|{algo}"] = metrics
+    return snapshot
+
+
+def merge_snapshots(snapshots: Sequence[Dict[str, dict]]) -> Dict[str, dict]:
+    merged: Dict[str, dict] = {}
+    for snap in snapshots:
+        for key, metrics in snap.items():
+            target = merged.setdefault(key, {m: [] for m in METRICS})
+            for metric in METRICS:
+                target[metric].extend(metrics.get(metric, []))
+    return merged
+
+
+def run_benchmark(repeats: int) -> Dict[str, dict]:
+    """Jalankan benchmark_all.py sebanyak repeats dan gabungkan snapshot-nya."""
+    snapshots = []
+    for r in range(repeats):
+        print(f"\n[PerfGate] Benchmark repetisi {r + 1}/{repeats}")
+        # --no-cache: setiap repetisi harus benar-benar menjalankan solver
+        subprocess.run([sys.executable, "benchmark_all.py", "--no-cache"], check=True)
+        snapshots.append(collect_snapshot())
+    return merge_snapshots(snapshots)
+
+
+def machine_info() -> dict:
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+# ----------------------------------------------------------------------
+# Baseline & perbandingan
+# ----------------------------------------------------------------------
+def baseline_path(name: str) -> str:
+    return os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def save_baseline(name: str, metrics: Dict[str, dict], repeats: int) -> str:
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    path = baseline_path(name)
+    payload = {
+        "meta": {
+            "name": name,
+            "commit": git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "repeats": repeats,
+            "machine": machine_info(),
+        },
+        "metrics": metrics,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+    return path
+
+
+def compare(
+    baseline: Dict[str, dict],
+    current: Dict[str, dict],
+    alpha: float = ALPHA,
+    min_effect: Dict[str, float] = MIN_EFFECT,
+) -> List[dict]:
+    """Bandingkan setiap metrik baseline dengan hasil sekarang."""
+    rows = []
+    for key in sorted(baseline):
+        inst, algo = key.split("|", 1)
+        for metric in METRICS:
+            base = baseline[key].get(metric, [])
+            if not base:
+                continue
+            cur = current.get(key, {}).get(metric, [])
+            row = {
+                "instance": inst,
+                "algorithm": algo,
+                "metric": metric,
+                "baseline_n": len(base),
+                "current_n": len(cur),
+                "baseline_median": _median(base),
+                "current_median": None,
+                "change_pct": None,
+                "p_value": None,
+                "status": "missing",
+            }
+            if cur:
+                b_med, c_med = row["baseline_median"], _median(cur)
+                change = (c_med - b_med) / abs(b_med) if b_med else 0.0
+                if LOWER_IS_BETTER[metric]:
+                    p = mann_whitney_greater(cur, base)
+                    worse = change > min_effect[metric]
+                else:
+                    p = mann_whitney_greater(base, cur)
+                    worse = -change > min_effect[metric]
+                if p <= alpha and worse:
+                    status = "REGRESSION"
+                elif min_p_value(len(cur), len(base)) > alpha:
+                    # uji tidak mungkin signifikan: "ok" akan menyesatkan
+                    status = "insufficient samples"
+                else:
+                    status = "ok"
+                row.update({
+                    "current_median": c_med,
+                    "change_pct": 100.0 * change,
+                    "p_value": p,
+                    "status": status,
+                })
+            rows.append(row)
+    return rows
+
+
+def write_report(rows: Sequence[dict], filename: str = REPORT_CSV):
+    def fmt(v, spec):
+        return "-" if v is None else format(v, spec)
+
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(REPORT_HEADER)
+        for r in rows:
+            writer.writerow([
+                r["instance"],
+                r["algorithm"],
+                r["metric"],
+                r["baseline_n"],
+                r["current_n"],
+                fmt(r["baseline_median"], ".6g"),
+                fmt(r["current_median"], ".6g"),
+                fmt(r["change_pct"], ".2f"),
+                fmt(r["p_value"], ".4f"),
+                r["status"],
+            ])
+
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+def _parse_cli(argv: List[str]):
+    args, opts = [], {}
+    i = 0
+    while i < len(argv):
+        if argv[i] == "--reuse":
+            opts["reuse"] = True
+            i += 1
+        elif argv[i].startswith("--"):
+            opts[argv[i][2:]] = argv[i + 1] if i + 1 < len(argv) else None
+            i += 2
+        else:
+            args.append(argv[i])
+            i += 1
+    return args, opts
+
+
+if __name__ == "__main__":
+    ARGS, OPTS = _parse_cli(sys.argv[1:])
+    if not ARGS or ARGS[0] not in ("baseline", "compare"):
+        print(__doc__)
+        sys.exit(2)
+
+    COMMAND = ARGS[0]
+    NAME = ARGS[1] if len(ARGS) > 1 else "default"
+    REPEATS = int(OPTS.get("repeats", 3))
+    ALPHA_CLI = float(OPTS.get("alpha", ALPHA))
+
+    if OPTS.get("reuse"):
+        if COMMAND == "baseline":
+            # satu sampel time/throughput per metrik: setiap compare berikutnya
+            # tidak akan pernah bisa mendeteksi regresi waktu
+            print("--reuse tidak didukung untuk baseline; jalankan dengan --repeats (minimal 3)")
+            sys.exit(2)
+        REPEATS = 1
+        metrics = collect_snapshot()
+    else:
+        metrics = run_benchmark(REPEATS)
+
+    if COMMAND == "baseline":
+        if min_p_value(REPEATS, REPEATS) > ALPHA_CLI:
+            print(f"[PerfGate] Peringatan: dengan --repeats {REPEATS}, regresi time/throughput "
+                  f"tidak akan pernah signifikan (p minimum > {ALPHA_CLI})")
+        path = save_baseline(NAME, metrics, REPEATS)
+        print(f"\n✅ Baseline tersimpan di: {path}")
+        sys.exit(0)
+
+    path = baseline_path(NAME)
+    if not os.path.exists(path):
+        print(f"Baseline {path} tidak ditemukan; buat dulu dengan: python perf_gate.py baseline {NAME}")
+        sys.exit(2)
+    with open(path) as f:
+        baseline = json.load(f)
+
+    if baseline["meta"].get("machine") != machine_info():
+        print("[PerfGate] Peringatan: baseline dibuat di mesin/lingkungan berbeda:")
+        print(f"           {baseline['meta'].get('machine')}")
+
+    rows = compare(baseline["metrics"], metrics, alpha=ALPHA_CLI)
+    write_report(rows)
+
+    print(f"\n=== PERF GATE vs {NAME} (commit {baseline['meta'].get('commit')}) ===")
+    failed = [r for r in rows if r["status"] in ("REGRESSION", "missing")]
+    untested = [r for r in rows if r["status"] == "insufficient samples"]
+    for r in rows:
+        print(
+            "PERF_GATE|"
+            f"{r['instance']}|{r['algorithm']}|{r['metric']}|"
+            f"{r['baseline_median']:.6g}|"
+            f"{'-' if r['current_median'] is None else format(r['current_median'], '.6g')}|"
+            f"{'-' if r['change_pct'] is None else format(r['change_pct'], '+.2f')}|"
+            f"{'-' if r['p_value'] is None else format(r['p_value'], '.4f')}|"
+            f"{r['status']}"
+        )
+    print(f"\nLaporan tersimpan di: {REPORT_CSV}")
+
+    if untested:
+        print(f"⚠️  {len(untested)} metrik tidak bisa diuji (insufficient samples; tambah --repeats)")
+    if failed:
+        print(f"❌ {len(failed)} regresi / metrik hilang terdeteksi")
+        sys.exit(1)
+    if untested:
+        print("✅ Tidak ada regresi signifikan pada metrik yang bisa diuji")
+    else:
+        print("✅ Tidak ada regresi signifikan")
@@ -0,0 +1,129 @@
+"""
+profiling.py
+
+Mode profiling untuk semua entry point solver (dan benchmark_all.py):
+
+    python ga_vrp.py 1_FaridFajar.vrp 5 --profile            # cProfile + sampler
+    python ga_vrp.py 1_FaridFajar.vrp 5 --profile=cprofile   # hanya cProfile
+    python ga_vrp.py 1_FaridFajar.vrp 5 --profile=sample     # hanya sampler
+
+Output di folder profiles/ dengan nama <basename>_<solver>_<timestamp>:
+- .prof      : data pstats cProfile (snakeviz / pstats)
+- .txt       : top fungsi (cumulative time) dari cProfile
+- .collapsed : collapsed stack dari sampler ("f1;f2;f3 <count>"), siap untuk
+               flamegraph.pl atau speedscope
+"""
+
+import atexit
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+PROFILE_DIR = "profiles"
+SAMPLE_INTERVAL_SEC = 0.005
+TOP_N = 40
+
+
+def profile_mode(argv=None) -> Optional[str]:
+    """'--profile' → 'both', '--profile=cprofile' / '--profile=sample' → mode itu."""
+    for arg in (argv if argv is not None else sys.argv)[1:]:
+        if arg == "--profile":
+            return "both"
+        if arg.startswith("--profile="):
+            mode = arg.split("=", 1)[1]
+            if mode not in ("both", "cprofile", "sample"):
+                raise ValueError(f"Mode profile tidak dikenal: {mode} (both/cprofile/sample)")
+            return mode
+    return None
+
+
+# --------------------------------------------------------------------
+# Sampling profiler (thread yang membaca stack main thread berkala)
+# --------------------------------------------------------------------
+class StackSampler(threading.Thread):
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL_SEC):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def write_collapsed(counts: Counter, filename: str):
+    with open(filename, "w") as f:
+        for stack, count in counts.most_common():
+            f.write(f"{stack} {count}\n")
+
+
+# --------------------------------------------------------------------
+# Entry point helper
+# --------------------------------------------------------------------
+def maybe_start(instance_file: str, solver: str, argv=None) -> Optional[str]:
+    """
+    Panggil di awal blok __main__. Jika ada flag --profile, mulai profiler dan
+    daftarkan penulisan hasil saat proses selesai (atexit, termasuk sys.exit).
+    Return prefix path file output, atau None kalau profiling tidak aktif.
+    """
+    mode = profile_mode(argv)
+    if mode is None:
+        return None
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    base_name = os.path.splitext(os.path.basename(instance_file))[0]
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    prefix = os.path.join(PROFILE_DIR, f"{base_name}_{solver}_{stamp}")
+
+    profiler = None
+    sampler = None
+    if mode in ("both", "cprofile"):
+        profiler = cProfile.Profile()
+    if mode in ("both", "sample"):
+        sampler = StackSampler(threading.main_thread().ident)
+
+    start = time.perf_counter()
+
+    def finish():
+        elapsed = time.perf_counter() - start
+        if sampler is not None:
+            sampler.stop()
+            write_collapsed(sampler.counts, prefix + ".collapsed")
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(prefix + ".prof")
+            out = io.StringIO()
+            stats = pstats.Stats(profiler, stream=out)
+            stats.sort_stats("cumulative").print_stats(TOP_N)
+            with open(prefix + ".txt", "w") as f:
+                f.write(f"# {solver} on {instance_file}, wall time {elapsed:.4f} s\n")
+                f.write(out.getvalue())
+        print(f"[Profile] {solver} ({mode}) saved to {prefix}.*")
+
+    atexit.register(finish)
+    if sampler is not None:
+        sampler.start()
+    if profiler is not None:
+        profiler.enable()
+    print(f"[Profile] Profiling {solver} on {instance_file} (mode={mode})")
+    return prefix
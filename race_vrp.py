@@ -0,0 +1,304 @@
+"""
+race_vrp.py
+
+Race mode: GA, Tabu Search, SA, dan OR-Tools dijalankan paralel (satu proses
+per solver) pada instance yang sama. Incumbent terbaik dibagi lewat shared
+memory: solver berbasis restart (GA/Tabu/SA) memulai setiap epoch dari
+incumbent global, sehingga solver yang tertinggal otomatis "dipangkas" ke
+solusi terbaik. Begitu target cost / gap tercapai (atau waktu habis), semua
+worker dibatalkan dan hasil pertama yang cukup bagus langsung dikembalikan.
+
+Contoh:
+    python race_vrp.py 1_FaridFajar.vrp 10 19000
+"""
+
+import sys
+import os
+import time
+import random
+import multiprocessing as mp
+from typing import List, Optional, Sequence
+
+import ga_vrp
+import tabu_vrp
+import sa_vrp
+import ortools_solver
+from constructive import greedy_routes, routes_to_chromosome, perturb_chromosome
+import profiling
+import results_store
+import timing
+
+# semua modul solver membaca instance yang sama dari sys.argv[1]
+ARGS = ga_vrp.ARGS
+INSTANCE_FILE = ga_vrp.INSTANCE_FILE
+N = ga_vrp.N
+CAPACITY = ga_vrp.CAPACITY
+DEMAND = ga_vrp.DEMAND
+DIST = ga_vrp.DIST
+
+RACE_SOLVERS = ("ga", "tabu", "sa", "ortools")
+SOLVER_LABELS = {"ga": "GA", "tabu": "Tabu", "sa": "SA", "ortools": "OR-Tools"}
+
+
+# --------------------------------------------------------------------
+# Incumbent bersama (shared memory antar proses)
+# --------------------------------------------------------------------
+def make_incumbent(num_customers: int):
+    """Buat incumbent di shared memory: cost, kromosom, solver pemenang, waktu."""
+    return {
+        "lock": mp.Lock(),
+        "cost": mp.Value("d", float("inf"), lock=False),
+        "chrom": mp.Array("i", num_customers, lock=False),
+        "winner": mp.Value("i", -1, lock=False),
+        "found_at": mp.Value("d", 0.0, lock=False),
+        "version": mp.Value("i", 0, lock=False),
+    }
+
+
+def publish(inc, chrom: List[int], cost: float, solver_idx: int) -> bool:
+    """Simpan chrom sebagai incumbent jika lebih baik. Return True kalau diterima."""
+    if cost >= inc["cost"].value:  # cek cepat tanpa lock
+        return False
+    with inc["lock"]:
+        if cost >= inc["cost"].value:
+            return False
+        inc["chrom"][:] = chrom
+        inc["cost"].value = cost
+        inc["winner"].value = solver_idx
+        inc["found_at"].value = time.time()
+        inc["version"].value += 1
+    return True
+
+
+def snapshot(inc):
+    """Return (chrom, cost, version); chrom None kalau belum ada incumbent."""
+    with inc["lock"]:
+        if inc["version"].value == 0:
+            return None, float("inf"), 0
+        return list(inc["chrom"]), inc["cost"].value, inc["version"].value
+
+
+# --------------------------------------------------------------------
+# Worker per solver
+# --------------------------------------------------------------------
+def _race_worker(solver: str, solver_idx: int, inc, stop_event, deadline: float,
+                 epoch_sec: float, seed: int):
+    timing.pin_cpus(solver_idx)
+    random.seed(seed)
+
+    def on_improve(chrom, cost, routes=None):
+        # incumbent bersama berupa kromosom yang di-decode greedy; cost rute
+        # GA (hasil route local search) belum tentu sama dengan cost decode-nya
+        if routes is not None:
+            cost = ga_vrp.fitness(chrom)
+        publish(inc, chrom, cost, solver_idx)
+
+    def should_stop():
+        return stop_event.is_set() or time.time() >= deadline
+
+    if solver == "ortools":
+        # OR-Tools jalan sekali sampai deadline; setiap solusi dipublikasikan.
+        # Armada = jumlah rute greedy (warm-start), seperti ortools_solver CLI
+        # dengan warm-start: satu kendaraan tidak cukup kalau total demand
+        # melebihi kapasitas
+        def on_routes(routes, _cost):
+            chrom = routes_to_chromosome(routes, DEMAND, CAPACITY)
+            on_improve(chrom, ga_vrp.fitness(chrom))
+
+        initial = greedy_routes(DIST, DEMAND, CAPACITY)
+        ortools_solver.solve_with_ortools(
+            num_vehicles=len(initial),
+            time_limit_sec=max(1, int(deadline - time.time())),
+            initial_routes=initial,
+            on_improve=on_routes,
+            should_stop=should_stop,
+        )
+        return
+
+    # GA/Tabu/SA: restart per epoch dari incumbent global
+    last_version = -1
+    while not should_stop():
+        chrom, _, version = snapshot(inc)
+        budget = min(epoch_sec, deadline - time.time())
+        if budget <= 0:
+            break
+
+        if solver == "ga":
+            ga_vrp.genetic_algorithm(
+                time_limit_sec=budget,
+                initial_chroms=[chrom] if chrom else None,
+                log_every=0,
+                on_improve=on_improve,
+                should_stop=should_stop,
+            )
+        elif solver == "tabu":
+            # Tabu deterministik: kalau incumbent belum berubah, perturbasi dulu
+            if chrom is not None and version == last_version:
+                chrom = perturb_chromosome(chrom, 3)
+            tabu_vrp.tabu_search(
+                time_limit_sec=budget,
+                initial_chrom=chrom,
+                log_every=0,
+                on_improve=on_improve,
+                should_stop=should_stop,
+            )
+        elif solver == "sa":
+            sa_vrp.simulated_annealing(
+                time_limit_sec=budget,
+                initial_chrom=chrom,
+                on_improve=on_improve,
+                should_stop=should_stop,
+            )
+        else:
+            raise ValueError(f"Solver race tidak dikenal: {solver}")
+
+        last_version = version
+
+
+# --------------------------------------------------------------------
+# Race utama
+# --------------------------------------------------------------------
+def race(
+    solvers: Sequence[str] = RACE_SOLVERS,
+    time_limit_sec: float = 10.0,
+    target_cost: Optional[float] = None,
+    reference_cost: Optional[float] = None,
+    target_gap: Optional[float] = None,
+    epoch_sec: float = 2.0,
+    poll_sec: float = 0.05,
+    grace_sec: float = 0.2,
+    base_seed: int = 400,
+):
+    """
+    Jalankan semua solver paralel dan berhenti saat:
+    - incumbent <= target_cost, atau
+    - (incumbent - reference_cost) / reference_cost <= target_gap, atau
+    - time_limit_sec habis.
+    Worker yang belum selesai diberi grace_sec untuk berhenti kooperatif,
+    setelah itu di-terminate.
+    """
+    inc = make_incumbent(N - 1)
+    stop_event = mp.Event()
+
+    start = time.time()
+    deadline = start + time_limit_sec
+
+    workers = []
+    for idx, solver in enumerate(solvers):
+        p = mp.Process(
+            target=_race_worker,
+            args=(solver, idx, inc, stop_event, deadline, epoch_sec, base_seed + idx),
+            daemon=True,
+        )
+        p.start()
+        workers.append(p)
+
+    hit_target = False
+    while time.time() < deadline and any(p.is_alive() for p in workers):
+        cost = inc["cost"].value
+        if target_cost is not None and cost <= target_cost:
+            hit_target = True
+        elif reference_cost and target_gap is not None:
+            if (cost - reference_cost) / reference_cost <= target_gap:
+                hit_target = True
+        if hit_target:
+            break
+        time.sleep(poll_sec)
+
+    # --- cancel semua worker (hasil diambil dulu, latency tidak ikut grace) ---
+    stop_event.set()
+    elapsed = time.time() - start
+    chrom, cost, _ = snapshot(inc)
+    with inc["lock"]:
+        winner_idx = inc["winner"].value
+        found_at = inc["found_at"].value
+
+    grace_deadline = time.time() + grace_sec
+    for p in workers:
+        p.join(timeout=max(0.0, grace_deadline - time.time()))
+    for p in workers:
+        if p.is_alive():
+            p.terminate()
+            p.join()
+
+    if chrom is None:
+        return None
+
+    return {
+        "chrom": chrom,
+        "fitness": cost,
+        "winner": solvers[winner_idx],
+        "time_to_best": found_at - start,
+        "elapsed": elapsed,
+        "hit_target": hit_target,
+    }
+
+
+# --------------------------------------------------------------------
+# Entry point
+# --------------------------------------------------------------------
+if __name__ == "__main__":
+    profiling.maybe_start(INSTANCE_FILE, "race")
+    print(f"Using instance file: {INSTANCE_FILE}")
+
+    # Contoh: python race_vrp.py 1_FaridFajar.vrp 10 19000
+    TIME_LIMIT = float(ARGS[2]) if len(ARGS) > 2 else 10.0
+    TARGET_COST = float(ARGS[3]) if len(ARGS) > 3 else None
+    print(f"Race time limit: {TIME_LIMIT} seconds, target cost: {TARGET_COST}")
+
+    result = race(time_limit_sec=TIME_LIMIT, target_cost=TARGET_COST)
+    if result is None:
+        print("No solution found in race.")
+        sys.exit(0)
+
+    routes = ga_vrp.decode_routes(result["chrom"])
+    route_str = "/".join("-".join(str(node) for node in r) for r in routes)
+    chrom_str = "-".join(str(c) for c in result["chrom"])
+    winner = SOLVER_LABELS.get(result["winner"], result["winner"])
+
+    print("\n=== RACE RESULT ===")
+    print(f"Best cost     : {result['fitness']:.2f}")
+    print(f"Winner        : {winner}")
+    print(f"Time to best  : {result['time_to_best']:.4f} s")
+    print(f"Elapsed       : {result['elapsed']:.4f} s")
+    print(f"Target hit    : {result['hit_target']}")
+
+    line_text = (
+        "RACE_SUMMARY|"
+        f"{INSTANCE_FILE}|"
+        f"{result['fitness']:.2f}|"
+        f"{winner}|"
+        f"{result['time_to_best']:.4f}|"
+        f"{result['elapsed']:.4f}|"
+        f"{int(result['hit_target'])}|"
+        f"{len(routes)}|"
+        f"{route_str}|"
+        f"{chrom_str}"
+    )
+    print("\n" + line_text)
+
+    # ---------- SIMPAN KE FILE <basename>_race_summary.csv ----------
+    base_name = os.path.splitext(os.path.basename(INSTANCE_FILE))[0]
+    summary_file = f"{base_name}_race_summary.csv"
+
+    header = [
+        "instance_file",
+        "best_cost",
+        "winner",
+        "time_to_best_sec",
+        "elapsed_sec",
+        "hit_target",
+        "num_routes",
+        "best_route",
+        "chromosome",
+    ]
+
+    RACE_PARAMS = {
+        "solvers": list(RACE_SOLVERS),
+        "time_limit_sec": TIME_LIMIT,
+        "target_cost": TARGET_COST,
+    }
+    results_store.save_result(
+        INSTANCE_FILE, "race", RACE_PARAMS, header, line_text.split("|")[1:],
+        summary_file=summary_file,
+    )
@@ -0,0 +1,290 @@
+"""
+reopt_vrp.py
+
+Re-optimasi inkremental: perbarui solusi sebelumnya setelah perubahan kecil
+pada himpunan customer, tanpa solve ulang dari awal.
+
+Delta yang didukung (index node = index di matriks jarak instance):
+- removed        : customer yang dibatalkan → dilepas dari rutenya
+                   (tetangga kiri & kanan langsung disambung)
+- added          : customer baru → cheapest insertion (posisi termurah yang
+                   muat kapasitas di semua rute; rute baru kalau tidak ada)
+- demand_changes : {customer: demand baru} → rute yang jadi overload
+                   melepas customer dengan penghematan jarak terbesar sampai
+                   muat, lalu customer itu disisipkan ulang seperti added
+
+Customer aktif = customer di rute sebelumnya − removed + added. Matriks
+jarak boleh berisi lokasi lain yang tidak dilayani (mis. semua lokasi
+pelanggan tetap); lokasi tersebut diabaikan.
+
+Setelah repair, route_ls.RouteLS (mode strict) dijalankan dengan time limit
+pendek, hanya pada customer aktif. Sebagian besar rute lama biasanya tetap
+utuh, jadi repair + local search jauh lebih cepat daripada solve ulang.
+
+Murni seperti route_ls.py: tidak membaca global instance, semua lewat
+(dist, demands, capacity).
+
+    python reopt_vrp.py instance.vrp <summary.csv | rute "0-3-5-0/0-2-0"> [opsi]
+      --remove=3,7  --add=12,15  --demand=5:2.5,9:1  --time=1.0
+"""
+
+import csv
+import heapq
+import os
+import random
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from parser import load_cvrp_instance
+from route_ls import RouteLS
+
+DEPOT = 0
+EPS = 1e-9
+
+
+# --------------------------------------------------------------------
+# Helper rute
+# --------------------------------------------------------------------
+def routes_cost(routes: List[List[int]], dist) -> float:
+    return sum(dist[r[t]][r[t + 1]] for r in routes for t in range(len(r) - 1))
+
+
+def active_neighbor_lists(dist, active: Sequence[int], k: int) -> List[List[int]]:
+    """Neighbor list (k terdekat) yang hanya berisi customer aktif."""
+    lists: List[List[int]] = [[] for _ in range(len(dist))]
+    for i in active:
+        row = dist[i]
+        nearest = heapq.nsmallest(k + 1, active, key=row.__getitem__)
+        lists[i] = [j for j in nearest if j != i][:k]
+    return lists
+
+
+def remove_customers(routes: List[List[int]], customers) -> List[List[int]]:
+    """Buang customer dari rute (rute yang jadi kosong ikut dibuang)."""
+    drop = set(customers)
+    result = []
+    for r in routes:
+        kept = [c for c in r if c not in drop]
+        if len(kept) > 2:
+            result.append(kept)
+    return result
+
+
+def evict_overload(
+    routes: List[List[int]], dist, demands: Sequence[float], capacity: float
+) -> List[int]:
+    """
+    Untuk setiap rute yang melebihi kapasitas: lepas customer dengan
+    penghematan jarak terbesar (per unit demand) sampai rute muat lagi.
+    Rute diubah in-place. Return customer yang dilepas.
+    """
+    evicted = []
+    for r in routes:
+        load = sum(demands[c] for c in r[1:-1])
+        while load > capacity + EPS and len(r) > 2:
+            def saving(t: int) -> float:
+                a, c, b = r[t - 1], r[t], r[t + 1]
+                gain = dist[a][c] + dist[c][b] - dist[a][b]
+                return gain / max(demands[c], EPS)
+
+            t = max(range(1, len(r) - 1), key=saving)
+            load -= demands[r[t]]
+            evicted.append(r.pop(t))
+    routes[:] = [r for r in routes if len(r) > 2]
+    return evicted
+
+
+def cheapest_insertion(
+    routes: List[List[int]], customers: Iterable[int], dist, demands: Sequence[float], capacity: float
+) -> int:
+    """
+    Sisipkan customer (demand terbesar dulu) di posisi termurah yang muat
+    kapasitas; kalau tidak ada, buka rute baru [0, c, 0]. Rute diubah
+    in-place. Return jumlah rute baru.
+    """
+    loads = [sum(demands[c] for c in r[1:-1]) for r in routes]
+    opened = 0
+    for c in sorted(customers, key=lambda x: -demands[x]):
+        best = None
+        best_delta = float("inf")
+        for ri, r in enumerate(routes):
+            if loads[ri] + demands[c] > capacity + EPS:
+                continue
+            for t in range(len(r) - 1):
+                a, b = r[t], r[t + 1]
+                delta = dist[a][c] + dist[c][b] - dist[a][b]
+                if delta < best_delta:
+                    best_delta = delta
+                    best = (ri, t + 1)
+        if best is None:
+            routes.append([DEPOT, c, DEPOT])
+            loads.append(demands[c])
+            opened += 1
+        else:
+            ri, at = best
+            routes[ri].insert(at, c)
+            loads[ri] += demands[c]
+    return opened
+
+
+# --------------------------------------------------------------------
+# API utama
+# --------------------------------------------------------------------
+def reoptimize(
+    previous_routes: List[List[int]],
+    dist,
+    demands: Sequence[float],
+    capacity: float,
+    added: Iterable[int] = (),
+    removed: Iterable[int] = (),
+    demand_changes: Optional[Dict[int, float]] = None,
+    time_limit_sec: float = 1.0,
+    neighbors_k: int = 20,
+    neighbors: Optional[List[List[int]]] = None,
+    seed: Optional[int] = None,
+) -> Dict:
+    """
+    Perbarui previous_routes (list rute [0, ..., 0]) untuk delta yang
+    diberikan: hapus → evict overload → cheapest insertion → RouteLS sampai
+    local optimum atau time_limit_sec (dihitung sejak fungsi dipanggil).
+
+    neighbors: neighbor list seluruh instance (mis. route_ls.neighbor_lists
+    yang di-cache pemanggil); disaring ke customer aktif. Kalau None, neighbor
+    list customer aktif dihitung di sini.
+
+    Return dict: "routes", "fitness", "repaired_cost" (sebelum local search),
+    "demands" (setelah demand_changes), "inserted", "evicted", "opened",
+    "ls_moves", "evals", "elapsed".
+    """
+    start = time.perf_counter()
+    n = len(dist)
+    added = list(dict.fromkeys(added))
+    removed = set(removed)
+    demand_changes = demand_changes or {}
+
+    served = [c for r in previous_routes for c in r[1:-1]]
+    if len(set(served)) != len(served):
+        raise ValueError("Customer muncul lebih dari sekali di rute sebelumnya")
+    for c in [*served, *added, *removed, *demand_changes]:
+        if not 1 <= c < n:
+            raise ValueError(f"Customer {c} di luar instance (1..{n - 1})")
+    served_set = set(served)
+    already = [c for c in added if c in served_set]
+    if already:
+        raise ValueError(f"Customer sudah dilayani, tidak bisa ditambah: {already}")
+    both = removed.intersection(added)
+    if both:
+        raise ValueError(f"Customer sekaligus ditambah dan dihapus: {sorted(both)}")
+
+    new_demands = list(demands)
+    for c, d in demand_changes.items():
+        new_demands[c] = float(d)
+    active = [c for c in served if c not in removed] + added
+    too_big = [c for c in active if new_demands[c] > capacity + EPS]
+    if too_big:
+        raise ValueError(f"Demand customer melebihi kapasitas: {too_big}")
+
+    # repair: hapus, lepas yang overload, sisipkan ulang
+    routes = remove_customers(previous_routes, removed)
+    evicted = evict_overload(routes, dist, new_demands, capacity)
+    inserted = added + evicted
+    opened = cheapest_insertion(routes, inserted, dist, new_demands, capacity)
+    repaired_cost = routes_cost(routes, dist)
+
+    # local search singkat, hanya pada customer aktif
+    ls_moves = evals = 0
+    if len(active) > 1:
+        k = min(neighbors_k, len(active) - 1)
+        if neighbors is None:
+            nbrs = active_neighbor_lists(dist, active, k)
+        else:
+            is_active = [False] * n
+            for c in active:
+                is_active[c] = True
+            nbrs = [[v for v in row if is_active[v]][:k] for row in neighbors]
+        ls = RouteLS(dist, new_demands, capacity, nbrs, rng=random.Random(seed))
+        ls.load_routes(routes)
+        ls.run(deadline=start + time_limit_sec)
+        routes = ls.solution()
+        ls_moves, evals = ls.moves, ls.evals
+
+    return {
+        "routes": routes,
+        "fitness": routes_cost(routes, dist),
+        "repaired_cost": repaired_cost,
+        "demands": new_demands,
+        "inserted": inserted,
+        "evicted": evicted,
+        "opened": opened,
+        "ls_moves": ls_moves,
+        "evals": evals,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+# --------------------------------------------------------------------
+# CLI
+# --------------------------------------------------------------------
+def parse_routes(text: str) -> List[List[int]]:
+    """Rute format summary ("0-3-5-0/0-2-0") → list rute."""
+    return [[int(v) for v in part.split("-")] for part in text.strip().split("/") if part]
+
+
+def load_previous_routes(source: str) -> List[List[int]]:
+    """Rute dari baris terakhir kolom best_route <basename>_<algo>_summary.csv, atau string rute."""
+    if os.path.exists(source):
+        with open(source, newline="") as f:
+            rows = list(csv.DictReader(f))
+        if not rows:
+            raise ValueError(f"{source} tidak berisi baris ringkasan")
+        return parse_routes(rows[-1]["best_route"])
+    return parse_routes(source)
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def _demand_map(value: str) -> Dict[int, float]:
+    pairs = [p.split(":") for p in value.split(",") if p]
+    return {int(c): float(d) for c, d in pairs}
+
+
+if __name__ == "__main__":
+    ARGS = [a for a in sys.argv if not a.startswith("--")]
+    if len(ARGS) < 3:
+        print(__doc__)
+        sys.exit(2)
+    INSTANCE_FILE = ARGS[1]
+
+    OPTS = {"--remove": "", "--add": "", "--demand": "", "--time": "1.0"}
+    for arg in sys.argv[1:]:
+        name, _, value = arg.partition("=")
+        if name in OPTS:
+            OPTS[name] = value
+
+    N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
+    previous = load_previous_routes(ARGS[2])
+    res = reoptimize(
+        previous, DIST, DEMAND, CAPACITY,
+        added=_int_list(OPTS["--add"]),
+        removed=_int_list(OPTS["--remove"]),
+        demand_changes=_demand_map(OPTS["--demand"]),
+        time_limit_sec=float(OPTS["--time"]),
+    )
+
+    routes = res["routes"]
+    print(
+        f"[Reopt] previous = {routes_cost(previous, DIST):.2f}, repaired = {res['repaired_cost']:.2f}, "
+        f"final = {res['fitness']:.2f}, inserted = {len(res['inserted'])} "
+        f"(evicted {len(res['evicted'])}), new routes = {res['opened']}, "
+        f"ls moves = {res['ls_moves']}, time = {res['elapsed']:.4f}s"
+    )
+    route_str = "/".join("-".join(map(str, r)) for r in routes)
+    # Format: REOPT_SUMMARY|file|cost|repaired_cost|n_routes|n_active|inserted|evicted|ls_moves|evals|time|route
+    print(
+        f"\nREOPT_SUMMARY|{INSTANCE_FILE}|{res['fitness']:.2f}|{res['repaired_cost']:.2f}|"
+        f"{len(routes)}|{sum(len(r) - 2 for r in routes)}|{len(res['inserted'])}|"
+        f"{len(res['evicted'])}|{res['ls_moves']}|{res['evals']}|{res['elapsed']:.4f}|{route_str}"
+    )
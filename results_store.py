@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+results_store.py
+
+Penyimpanan hasil solver di satu database SQLite (default results.db,
+override lewat environment variable CVRP_RESULTS_DB), menggantikan append ke
+<basename>_<algo>_summary.csv:
+
+- WAL mode + busy timeout → aman ditulis paralel oleh beberapa proses solver
+- tabel summaries: satu baris ringkasan per eksekusi solver (header + row
+  disimpan apa adanya, jadi bisa diekspor ke layout CSV lama)
+- tabel runs: best cost per run (seed), di-insert batch dalam satu transaksi
+- index pada (instance_hash, solver, params_hash, seed)
+- tabel benchmark_cache: stdout eksekusi solver per cache key benchmark_all.py
+- tabel legacy_imports: penanda CSV lama yang sudah diimpor per instance × solver
+
+CSV per solver tetap ditulis ulang (atomik) dari database setiap kali solver
+selesai. CSV lama yang belum ada di database diimpor otomatis saat solver
+pertama kali menulis untuk instance × solver itu (semua baris, sekali saja).
+
+    python results_store.py import                # impor semua *_summary.csv lama
+    python results_store.py export [dir]          # tulis ulang semua CSV dari database
+    python results_store.py stats                 # jumlah eksekusi per instance × solver
+"""
+
+import csv
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+DB_PATH = os.environ.get("CVRP_RESULTS_DB", "results.db")
+SOLVERS = ("greedy", "ga", "tabu", "sa", "alns", "hgs", "decomp", "ortools", "race")
+BUSY_TIMEOUT_SEC = 30.0
+LEGACY_PARAMS_HASH = "legacy"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    id            INTEGER PRIMARY KEY,
+    created_at    TEXT NOT NULL,
+    started_at    TEXT,
+    instance_file TEXT NOT NULL,
+    instance_hash TEXT NOT NULL,
+    solver        TEXT NOT NULL,
+    params_hash   TEXT NOT NULL,
+    params_json   TEXT NOT NULL,
+    seed          INTEGER,
+    best_cost     REAL,
+    header_json   TEXT NOT NULL,
+    row_json      TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id            INTEGER PRIMARY KEY,
+    summary_id    INTEGER NOT NULL REFERENCES summaries(id) ON DELETE CASCADE,
+    instance_hash TEXT NOT NULL,
+    solver        TEXT NOT NULL,
+    params_hash   TEXT NOT NULL,
+    seed          INTEGER,
+    run           INTEGER,
+    cost          REAL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_key
+    ON summaries (instance_hash, solver, params_hash, seed);
+CREATE INDEX IF NOT EXISTS idx_summaries_file
+    ON summaries (instance_file, solver);
+CREATE INDEX IF NOT EXISTS idx_runs_key
+    ON runs (instance_hash, solver, params_hash, seed);
+CREATE TABLE IF NOT EXISTS benchmark_cache (
+    cache_key     TEXT PRIMARY KEY,
+    created_at    TEXT NOT NULL,
+    instance_file TEXT NOT NULL,
+    solver        TEXT NOT NULL,
+    key_json      TEXT NOT NULL,
+    stdout        TEXT NOT NULL,
+    process_wall_sec REAL,
+    process_cpu_sec  REAL
+);
+CREATE TABLE IF NOT EXISTS legacy_imports (
+    instance_file TEXT NOT NULL,
+    solver        TEXT NOT NULL,
+    filename      TEXT NOT NULL,
+    imported_at   TEXT NOT NULL,
+    num_rows      INTEGER NOT NULL,
+    PRIMARY KEY (instance_file, solver)
+);
+"""
+
+
+# ----------------------------------------------------------------------
+# Koneksi & hash
+# ----------------------------------------------------------------------
+def connect(path: Optional[str] = None) -> sqlite3.Connection:
+    """Buka database (buat schema kalau belum ada), WAL mode, autocommit manual."""
+    conn = sqlite3.connect(path or DB_PATH, timeout=BUSY_TIMEOUT_SEC, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _write_transaction(conn: sqlite3.Connection, fn, retries: int = 5):
+    """
+    Jalankan fn(conn) dalam BEGIN IMMEDIATE ... COMMIT (lock tulis diambil di
+    awal, jadi tidak ada deadlock upgrade antar proses). Retry kalau masih
+    "database is locked" setelah busy timeout.
+    """
+    for attempt in range(retries):
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as exc:
+            if "locked" not in str(exc) or attempt == retries - 1:
+                raise
+            time.sleep(0.1 * (attempt + 1))
+            continue
+        try:
+            result = fn(conn)
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def file_hash(path: str) -> str:
+    """SHA-256 isi file instance ("-" kalau file tidak ada)."""
+    if not os.path.exists(path):
+        return "-"
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def params_hash(params: Dict) -> str:
+    blob = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+def _seed_value(seed) -> Optional[int]:
+    try:
+        return int(seed)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# ----------------------------------------------------------------------
+# Tulis hasil
+# ----------------------------------------------------------------------
+def _insert_summary(
+    conn: sqlite3.Connection,
+    instance_file: str,
+    inst_hash: str,
+    solver: str,
+    p_hash: str,
+    params_json: str,
+    header: Sequence[str],
+    row: Sequence,
+    started_at: Optional[str],
+    run_costs: Sequence[tuple],
+) -> int:
+    values = dict(zip(header, row))
+    best_cost = _to_float(values.get("best_cost", values.get("cost")))
+    seed = _seed_value(values.get("best_seed"))
+
+    cur = conn.execute(
+        "INSERT INTO summaries (created_at, started_at, instance_file, instance_hash, solver, "
+        "params_hash, params_json, seed, best_cost, header_json, row_json) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            datetime.now().isoformat(timespec="seconds"),
+            started_at,
+            os.path.basename(instance_file),
+            inst_hash,
+            solver,
+            p_hash,
+            params_json,
+            seed,
+            best_cost,
+            json.dumps(list(header)),
+            json.dumps([str(v) for v in row]),
+        ),
+    )
+    summary_id = cur.lastrowid
+    conn.executemany(
+        "INSERT INTO runs (summary_id, instance_hash, solver, params_hash, seed, run, cost) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (summary_id, inst_hash, solver, p_hash, _seed_value(seed_), run, cost)
+            for run, seed_, cost in run_costs
+        ],
+    )
+    return summary_id
+
+
+def run_costs_from_traces(run_traces: Sequence[dict]) -> List[tuple]:
+    """[(run, seed, best_cost_akhir)] dari list {"run", "seed", "trace"}."""
+    return [(rt["run"], rt["seed"], rt["trace"][-1][2]) for rt in run_traces if rt["trace"]]
+
+
+def save_result(
+    instance_file: str,
+    solver: str,
+    params: Dict,
+    header: Sequence[str],
+    row: Sequence,
+    run_traces: Sequence[dict] = (),
+    started_at: Optional[str] = None,
+    summary_file: Optional[str] = None,
+    db_path: Optional[str] = None,
+) -> int:
+    """
+    Simpan satu ringkasan eksekusi solver + best cost per run (batch, satu
+    transaksi). Jika summary_file diberikan: CSV lama diimpor dulu (sekali),
+    lalu summary_file ditulis ulang dari database. Return id summary.
+    """
+    conn = connect(db_path)
+    try:
+        if summary_file and os.path.exists(summary_file):
+            import_csv(summary_file, solver, header, conn=conn)
+
+        inst_hash = file_hash(instance_file)
+        summary_id = _write_transaction(conn, lambda c: _insert_summary(
+            c,
+            instance_file,
+            inst_hash,
+            solver,
+            params_hash(params),
+            json.dumps(params, sort_keys=True, default=str),
+            header,
+            row,
+            started_at,
+            run_costs_from_traces(run_traces),
+        ))
+
+        if summary_file:
+            export_csv(summary_file, instance_file, solver, conn=conn)
+    finally:
+        conn.close()
+    return summary_id
+
+
+# ----------------------------------------------------------------------
+# Cache benchmark (dipakai benchmark_all.py)
+# ----------------------------------------------------------------------
+def cache_get(cache_key: str, conn: Optional[sqlite3.Connection] = None) -> Optional[dict]:
+    """Hasil eksekusi solver yang tersimpan untuk cache_key (None kalau belum ada)."""
+    own_conn = conn is None
+    conn = conn or connect()
+    try:
+        row = conn.execute(
+            "SELECT stdout, process_wall_sec, process_cpu_sec, created_at "
+            "FROM benchmark_cache WHERE cache_key = ?",
+            (cache_key,),
+        ).fetchone()
+    finally:
+        if own_conn:
+            conn.close()
+    if row is None:
+        return None
+    return {"stdout": row[0], "process_wall_sec": row[1], "process_cpu_sec": row[2], "created_at": row[3]}
+
+
+def cache_put(
+    cache_key: str,
+    key_parts: Dict,
+    instance_file: str,
+    solver: str,
+    stdout: str,
+    process_wall_sec: float,
+    process_cpu_sec: float,
+    conn: Optional[sqlite3.Connection] = None,
+):
+    own_conn = conn is None
+    conn = conn or connect()
+    try:
+        _write_transaction(conn, lambda c: c.execute(
+            "INSERT OR REPLACE INTO benchmark_cache (cache_key, created_at, instance_file, solver, "
+            "key_json, stdout, process_wall_sec, process_cpu_sec) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                cache_key,
+                datetime.now().isoformat(timespec="seconds"),
+                os.path.basename(instance_file),
+                solver,
+                json.dumps(key_parts, sort_keys=True),
+                stdout,
+                process_wall_sec,
+                process_cpu_sec,
+            ),
+        ))
+    finally:
+        if own_conn:
+            conn.close()
+
+
+# ----------------------------------------------------------------------
+# Impor CSV lama
+# ----------------------------------------------------------------------
+def import_csv(
+    filename: str,
+    solver: str,
+    header: Optional[Sequence[str]] = None,
+    conn: Optional[sqlite3.Connection] = None,
+) -> int:
+    """
+    Impor semua baris CSV ringkasan lama, sekali per instance × solver
+    (penanda di tabel legacy_imports). Baris yang sama persis di luar kolom
+    waktu tetap diimpor: itu eksekusi ulang yang sah (greedy/tabu
+    deterministik). Kalau database sudah punya ringkasan instance × solver
+    tanpa penanda (database lama, atau CSV hasil ekspor), impor dilewati dan
+    hanya penandanya yang dicatat. CSV tanpa header dengan kolom tag
+    (mis. "SA_SUMMARY,...") dipetakan ke header yang diberikan.
+    Return jumlah baris yang diimpor.
+    """
+    own_conn = conn is None
+    conn = conn or connect()
+    try:
+        with open(filename, newline="") as f:
+            rows = [r for r in csv.reader(f) if r]
+        if not rows:
+            return 0
+
+        if rows[0][0].endswith("_SUMMARY"):
+            if header is None:
+                raise ValueError(f"{filename} tidak punya header; berikan header solver")
+            file_header = list(header)
+            data = [r[1:] for r in rows]
+        else:
+            file_header, data = rows[0], rows[1:]
+
+        if not data:
+            return 0
+        instance_file = os.path.basename(data[0][0])
+
+        def do_import(c: sqlite3.Connection) -> int:
+            marked = c.execute(
+                "SELECT 1 FROM legacy_imports WHERE instance_file = ? AND solver = ?",
+                (instance_file, solver),
+            ).fetchone()
+            if marked:
+                return 0
+
+            imported = 0
+            exists = c.execute(
+                "SELECT 1 FROM summaries WHERE instance_file = ? AND solver = ? LIMIT 1",
+                (instance_file, solver),
+            ).fetchone()
+            if not exists:
+                csv_dir = os.path.dirname(os.path.abspath(filename))
+                inst_path = os.path.join(csv_dir, instance_file)
+                inst_hash = file_hash(inst_path)
+                for r in data:
+                    r = r + ["-"] * (len(file_header) - len(r))
+                    _insert_summary(
+                        c, instance_file, inst_hash, solver, LEGACY_PARAMS_HASH, "{}",
+                        file_header, r[:len(file_header)], None, (),
+                    )
+                    imported += 1
+            c.execute(
+                "INSERT INTO legacy_imports (instance_file, solver, filename, imported_at, num_rows) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (instance_file, solver, os.path.basename(filename),
+                 datetime.now().isoformat(timespec="seconds"), imported),
+            )
+            return imported
+
+        return _write_transaction(conn, do_import)
+    finally:
+        if own_conn:
+            conn.close()
+
+
+# ----------------------------------------------------------------------
+# Ekspor ke layout CSV lama
+# ----------------------------------------------------------------------
+def export_csv(
+    filename: str,
+    instance_file: str,
+    solver: str,
+    conn: Optional[sqlite3.Connection] = None,
+) -> int:
+    """
+    Tulis ulang <basename>_<algo>_summary.csv dari database (header = header
+    ringkasan terbaru; kolom yang tidak ada di baris lama diisi "-").
+    Ditulis ke file sementara lalu os.replace → pembaca tidak pernah melihat
+    file setengah jadi. Return jumlah baris.
+    """
+    own_conn = conn is None
+    conn = conn or connect()
+    try:
+        records = conn.execute(
+            "SELECT header_json, row_json FROM summaries "
+            "WHERE instance_file = ? AND solver = ? ORDER BY id",
+            (os.path.basename(instance_file), solver),
+        ).fetchall()
+    finally:
+        if own_conn:
+            conn.close()
+    if not records:
+        return 0
+
+    header = json.loads(records[-1][0])
+    tmp = f"{filename}.tmp{os.getpid()}"
+    with open(tmp, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for header_json, row_json in records:
+            values = dict(zip(json.loads(header_json), json.loads(row_json)))
+            writer.writerow([values.get(col, "-") for col in header])
+    os.replace(tmp, filename)
+    return len(records)
+
+
+def export_all(directory: str = ".", conn: Optional[sqlite3.Connection] = None) -> List[str]:
+    own_conn = conn is None
+    conn = conn or connect()
+    try:
+        pairs = conn.execute(
+            "SELECT DISTINCT instance_file, solver FROM summaries ORDER BY instance_file, solver"
+        ).fetchall()
+        written = []
+        for instance_file, solver in pairs:
+            base_name = os.path.splitext(instance_file)[0]
+            filename = os.path.join(directory, f"{base_name}_{solver}_summary.csv")
+            export_csv(filename, instance_file, solver, conn=conn)
+            written.append(filename)
+        return written
+    finally:
+        if own_conn:
+            conn.close()
+
+
+def import_all(pattern: str = "*_summary.csv", conn: Optional[sqlite3.Connection] = None) -> int:
+    """Impor semua <basename>_<solver>_summary.csv (solver dari nama file)."""
+    own_conn = conn is None
+    conn = conn or connect()
+    total = 0
+    try:
+        for path in sorted(glob.glob(pattern)):
+            stem = os.path.basename(path)[: -len("_summary.csv")]
+            solver = stem.rsplit("_", 1)[-1]
+            if solver not in SOLVERS:
+                continue
+            try:
+                n = import_csv(path, solver, conn=conn)
+            except ValueError as exc:
+                print(f"[Store] Lewati {path}: {exc}")
+                continue
+            print(f"[Store] {path}: {n} baris diimpor")
+            total += n
+        return total
+    finally:
+        if own_conn:
+            conn.close()
+
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    COMMAND = sys.argv[1] if len(sys.argv) > 1 else "stats"
+
+    if COMMAND == "import":
+        print(f"Total diimpor: {import_all()} baris ke {DB_PATH}")
+    elif COMMAND == "export":
+        out_dir = sys.argv[2] if len(sys.argv) > 2 else "."
+        for path in export_all(out_dir):
+            print(f"[Store] Ekspor: {path}")
+    elif COMMAND == "stats":
+        conn = connect()
+        rows = conn.execute(
+            "SELECT instance_file, solver, COUNT(*), MIN(best_cost), "
+            "(SELECT COUNT(*) FROM runs r WHERE r.instance_hash = s.instance_hash AND r.solver = s.solver) "
+            "FROM summaries s GROUP BY instance_file, solver ORDER BY instance_file, solver"
+        ).fetchall()
+        conn.close()
+        print("instance_file,solver,executions,best_cost,runs")
+        for r in rows:
+            print(",".join(str(v) for v in r))
+    else:
+        print(__doc__)
+        sys.exit(2)
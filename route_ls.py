@@ -0,0 +1,333 @@
+"""
+route_ls.py
+
+Local search berbasis rute untuk CVRP (dipakai HGS di hgs_vrp.py dan opsi
+local_search="route" di ga_vrp.genetic_algorithm).
+Murni seperti constructive.py: tidak membaca global instance, semua lewat
+(dist, demands, capacity).
+
+Representasi: list rute [0, c1, ..., cm, 0]. Per rute di-cache:
+- load dan prefix load (cload)
+- prefix jarak maju (fwd) dan prefix jarak arah balik (bwd), supaya biaya
+  segmen yang dibalik tetap O(1) untuk matriks asimetris
+- index posisi (pos) dan rute (route_of) setiap customer
+
+Move (granular: pasangan u dengan v dari neighbor list u), semua dievaluasi
+O(1):
+- relocate segmen 1-3 customer (Or-opt), maju atau dibalik, sebelum/sesudah v
+- swap u ↔ v
+- 2-opt* antar rute (ekor rute u ditukar dengan ekor rute v)
+- 2-opt intra rute (reversal segmen di antara u dan v)
+
+Objective: total jarak + penalty × kelebihan kapasitas per rute (penalty
+None → mode strict: move yang melanggar kapasitas ditolak, cek feasibility
+O(1) dari load/prefix load yang di-cache). Setiap move yang diterapkan hanya
+menghitung ulang cache rute yang berubah.
+"""
+
+import random
+import time
+from typing import Callable, List, Optional, Sequence
+
+DEPOT = 0
+EPS = 1e-9
+
+
+def neighbor_lists(dist, k: int) -> List[List[int]]:
+    """k customer terdekat (jarak keluar dist[i][j]) untuk setiap node (depot: [])."""
+    n = len(dist)
+    customers = list(range(1, n))
+    lists: List[List[int]] = [[] for _ in range(n)]
+    for i in customers:
+        row = dist[i]
+        nearest = sorted(customers, key=row.__getitem__)[: k + 1]
+        lists[i] = [j for j in nearest if j != i][:k]
+    return lists
+
+
+class RouteLS:
+    """State local search: rute + cache per rute + index posisi customer."""
+
+    def __init__(
+        self,
+        dist,
+        demands: Sequence[float],
+        capacity: float,
+        neighbors: List[List[int]],
+        penalty: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.dist = dist
+        self.demands = demands
+        self.capacity = capacity
+        self.neighbors = neighbors
+        self.penalty = penalty
+        self.rng = rng or random
+        n = len(demands)
+        self.pos = [0] * n
+        self.route_of = [-1] * n
+        self.routes: List[List[int]] = []
+        self.load: List[float] = []
+        self.cload: List[List[float]] = []
+        self.fwd: List[List[float]] = []
+        self.bwd: List[List[float]] = []
+        self.moves = 0   # jumlah move yang diterapkan
+        self.evals = 0   # jumlah evaluasi delta move
+
+    # ------------------------------------------------------------------
+    # State & cache
+    # ------------------------------------------------------------------
+    def load_routes(self, routes: List[List[int]]):
+        """Set solusi dari list rute [0, ..., 0] (rute kosong dibuang)."""
+        self.routes = [r[:] for r in routes if len(r) > 2]
+        k = len(self.routes)
+        self.load = [0.0] * k
+        self.cload = [[] for _ in range(k)]
+        self.fwd = [[] for _ in range(k)]
+        self.bwd = [[] for _ in range(k)]
+        for ri in range(k):
+            self._update(ri)
+
+    def _update(self, ri: int):
+        route = self.routes[ri]
+        dist, demands = self.dist, self.demands
+        cload = [0.0] * len(route)
+        fwd = [0.0] * len(route)
+        bwd = [0.0] * len(route)
+        for t in range(1, len(route)):
+            a, b = route[t - 1], route[t]
+            cload[t] = cload[t - 1] + demands[b]
+            fwd[t] = fwd[t - 1] + dist[a][b]
+            bwd[t] = bwd[t - 1] + dist[b][a]
+            self.pos[b] = t
+            self.route_of[b] = ri
+        self.cload[ri] = cload
+        self.fwd[ri] = fwd
+        self.bwd[ri] = bwd
+        self.load[ri] = cload[-1]
+
+    def _pen(self, load: float) -> float:
+        """Penalti kelebihan kapasitas (inf kalau penalty None dan overload)."""
+        excess = load - self.capacity
+        if excess <= EPS:
+            return 0.0
+        return float("inf") if self.penalty is None else self.penalty * excess
+
+    def route_cost(self, ri: int) -> float:
+        return self.fwd[ri][-1]
+
+    def distance(self) -> float:
+        return sum(f[-1] for f in self.fwd)
+
+    def excess(self) -> float:
+        return sum(max(0.0, l - self.capacity) for l in self.load)
+
+    def objective(self) -> float:
+        penalty = self.penalty or 0.0
+        return self.distance() + penalty * self.excess()
+
+    def solution(self) -> List[List[int]]:
+        """Rute [0, ..., 0] tanpa rute kosong."""
+        return [r[:] for r in self.routes if len(r) > 2]
+
+    # ------------------------------------------------------------------
+    # Move: relocate segmen (Or-opt, termasuk relocate 1 customer)
+    # ------------------------------------------------------------------
+    def _try_relocate(self, u: int, v: int) -> bool:
+        """Pindahkan segmen yang diawali u (1-3 customer) ke sebelum/sesudah v."""
+        dist, demands = self.dist, self.demands
+        ru, rv = self.route_of[u], self.route_of[v]
+        route_u, route_v = self.routes[ru], self.routes[rv]
+        i, j = self.pos[u], self.pos[v]
+        pen_u_old = self._pen(self.load[ru])
+        pen_v_old = self._pen(self.load[rv]) if rv != ru else 0.0
+
+        for seg_len in (1, 2, 3):
+            e = i + seg_len - 1  # posisi akhir segmen
+            if route_u[e] == DEPOT:
+                break
+            if ru == rv and i <= j <= e:
+                break
+            first, last = route_u[i], route_u[e]
+            prev_s, next_s = route_u[i - 1], route_u[e + 1]
+            seg_fwd = self.fwd[ru][e] - self.fwd[ru][i]
+            seg_bwd = self.bwd[ru][e] - self.bwd[ru][i]
+            seg_load = self.cload[ru][e] - self.cload[ru][i - 1]
+            remove = dist[prev_s][next_s] - dist[prev_s][first] - seg_fwd - dist[last][next_s]
+
+            if ru != rv:
+                pen_delta = (
+                    self._pen(self.load[ru] - seg_load) + self._pen(self.load[rv] + seg_load)
+                    - pen_u_old - pen_v_old
+                )
+                if pen_delta == float("inf"):
+                    continue
+            else:
+                pen_delta = 0.0
+
+            # edge (a, b) tujuan: sesudah v atau sebelum v; di rute yang sama
+            # edge yang menempel ke segmen dilewati (v tepat sebelum/sesudah segmen)
+            for a, b, at in ((v, route_v[j + 1], j + 1), (route_v[j - 1], v, j)):
+                if ru == rv and (at == i or at == e + 1):
+                    continue
+                base = remove - dist[a][b] + pen_delta
+                self.evals += 1
+                delta = base + dist[a][first] + seg_fwd + dist[last][b]
+                if delta < -EPS:
+                    self._apply_relocate(ru, rv, i, e, at, reverse=False)
+                    return True
+                if seg_len > 1:
+                    self.evals += 1
+                    delta = base + dist[a][last] + seg_bwd + dist[first][b]
+                    if delta < -EPS:
+                        self._apply_relocate(ru, rv, i, e, at, reverse=True)
+                        return True
+        return False
+
+    def _apply_relocate(self, ru: int, rv: int, i: int, e: int, at: int, reverse: bool):
+        segment = self.routes[ru][i:e + 1]
+        if reverse:
+            segment.reverse()
+        if ru == rv:
+            route = self.routes[ru]
+            rest = route[:i] + route[e + 1:]
+            # posisi sisipan di rute tanpa segmen
+            at_rest = at if at <= i else at - len(segment)
+            self.routes[ru] = rest[:at_rest] + segment + rest[at_rest:]
+            self._update(ru)
+        else:
+            route_u = self.routes[ru]
+            self.routes[ru] = route_u[:i] + route_u[e + 1:]
+            route_v = self.routes[rv]
+            self.routes[rv] = route_v[:at] + segment + route_v[at:]
+            self._update(ru)
+            self._update(rv)
+        self.moves += 1
+
+    # ------------------------------------------------------------------
+    # Move: swap u ↔ v
+    # ------------------------------------------------------------------
+    def _try_swap(self, u: int, v: int) -> bool:
+        dist, demands = self.dist, self.demands
+        ru, rv = self.route_of[u], self.route_of[v]
+        i, j = self.pos[u], self.pos[v]
+        if ru == rv and abs(i - j) <= 1:
+            return False  # tetangga langsung: sudah dicakup relocate
+        route_u, route_v = self.routes[ru], self.routes[rv]
+        pu, nu = route_u[i - 1], route_u[i + 1]
+        pv, nv = route_v[j - 1], route_v[j + 1]
+        delta = (
+            dist[pu][v] + dist[v][nu] - dist[pu][u] - dist[u][nu]
+            + dist[pv][u] + dist[u][nv] - dist[pv][v] - dist[v][nv]
+        )
+        if ru != rv:
+            dq = demands[v] - demands[u]
+            delta += (
+                self._pen(self.load[ru] + dq) + self._pen(self.load[rv] - dq)
+                - self._pen(self.load[ru]) - self._pen(self.load[rv])
+            )
+        self.evals += 1
+        if delta < -EPS:
+            route_u[i], route_v[j] = v, u
+            self._update(ru)
+            if rv != ru:
+                self._update(rv)
+            self.moves += 1
+            return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Move: 2-opt* (antar rute) dan 2-opt (intra rute)
+    # ------------------------------------------------------------------
+    def _try_two_opt_star(self, u: int, v: int) -> bool:
+        """Rute u: [.. u | ekor v], rute v: [.. v | ekor u]."""
+        dist = self.dist
+        ru, rv = self.route_of[u], self.route_of[v]
+        i, j = self.pos[u], self.pos[v]
+        route_u, route_v = self.routes[ru], self.routes[rv]
+        nu, nv = route_u[i + 1], route_v[j + 1]
+        load_a = self.cload[ru][i] + (self.load[rv] - self.cload[rv][j])
+        load_b = self.cload[rv][j] + (self.load[ru] - self.cload[ru][i])
+        delta = (
+            dist[u][nv] + dist[v][nu] - dist[u][nu] - dist[v][nv]
+            + self._pen(load_a) + self._pen(load_b)
+            - self._pen(self.load[ru]) - self._pen(self.load[rv])
+        )
+        self.evals += 1
+        if delta < -EPS:
+            self.routes[ru] = route_u[:i + 1] + route_v[j + 1:]
+            self.routes[rv] = route_v[:j + 1] + route_u[i + 1:]
+            self._update(ru)
+            self._update(rv)
+            self.moves += 1
+            return True
+        return False
+
+    def _try_two_opt(self, u: int, v: int) -> bool:
+        """Balik segmen sesudah u sampai v (u sebelum v di rute yang sama)."""
+        dist = self.dist
+        ri = self.route_of[u]
+        i, j = self.pos[u], self.pos[v]
+        if i > j:
+            i, j = j, i
+        if j - i < 2:
+            return False
+        route = self.routes[ri]
+        a, b = route[i], route[i + 1]
+        c, d = route[j], route[j + 1]
+        fwd, bwd = self.fwd[ri], self.bwd[ri]
+        delta = (
+            dist[a][c] + dist[b][d] - dist[a][b] - dist[c][d]
+            + (bwd[j] - bwd[i + 1]) - (fwd[j] - fwd[i + 1])
+        )
+        self.evals += 1
+        if delta < -EPS:
+            route[i + 1:j + 1] = route[i + 1:j + 1][::-1]
+            self._update(ri)
+            self.moves += 1
+            return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Driver
+    # ------------------------------------------------------------------
+    def run(
+        self,
+        max_passes: int = 1000,
+        deadline: Optional[float] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> int:
+        """
+        First-improvement granular local search sampai tidak ada move yang
+        memperbaiki (atau max_passes, time.perf_counter() >= deadline, atau
+        should_stop() True; keduanya dicek setiap 64 customer). Urutan
+        customer diacak setiap pass. Return jumlah move yang diterapkan.
+        """
+        customers = [c for r in self.routes for c in r[1:-1]]
+        moves_before = self.moves
+        for _ in range(max_passes):
+            improved = False
+            self.rng.shuffle(customers)
+            for idx, u in enumerate(customers):
+                if idx % 64 == 0 and (
+                    (deadline is not None and time.perf_counter() >= deadline)
+                    or (should_stop is not None and should_stop())
+                ):
+                    return self.moves - moves_before
+                for v in self.neighbors[u]:
+                    if self.route_of[v] == self.route_of[u]:
+                        moved = (
+                            self._try_relocate(u, v)
+                            or self._try_swap(u, v)
+                            or self._try_two_opt(u, v)
+                        )
+                    else:
+                        moved = (
+                            self._try_relocate(u, v)
+                            or self._try_swap(u, v)
+                            or self._try_two_opt_star(u, v)
+                        )
+                    improved = improved or moved
+            if not improved:
+                break
+        return self.moves - moves_before
@@ -1,24 +1,37 @@
 import random
 import sys
-import csv
 import os
 import time
 import math
+from datetime import datetime
 import matplotlib.pyplot as plt
-from typing import List, Optional
+from typing import List, Dict, Any, Optional, Callable, Generator
 from parser import load_cvrp_instance
+from constructive import seed_chromosomes, parse_seed_with
+from convergence import append_trace_csv
+import results_store
+import incumbents
+import instrument
+import profiling
+import timing
+from instrument import timed
 
 # --------------------------------------------------------------------
 # Konfigurasi & Load Instance
 # --------------------------------------------------------------------
-INSTANCE_FILE = sys.argv[1] if len(sys.argv) > 1 else "output_cvrp.vrp"
-N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
+# argumen posisi; flag "--..." (mis. --profile) diabaikan
+ARGS = [a for a in sys.argv if not a.startswith("--")]
+INSTANCE_FILE = ARGS[1] if len(ARGS) > 1 else "output_cvrp.vrp"
+with timing.phase("setup"):
+    N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
 DEPOT = 0
 CUSTOMERS = list(range(1, N))
+FITNESS_EVALS = 0  # jumlah pemanggilan fitness() (untuk convergence trace)
 
 # --------------------------------------------------------------------
 # Fungsi Helper (Sama dengan algoritma lain)
 # --------------------------------------------------------------------
+@timed("decode")
 def decode_routes(chromosome: List[int]) -> List[List[int]]:
     routes = []
     route = [DEPOT]
@@ -47,7 +60,10 @@ def route_cost(route: List[int]) -> float:
 def solution_cost(routes: List[List[int]]) -> float:
     return sum(route_cost(r) for r in routes)
 
+@timed("fitness")
 def fitness(chromosome: List[int], penalty_factor: float = 1000.0) -> float:
+    global FITNESS_EVALS
+    FITNESS_EVALS += 1
     routes = decode_routes(chromosome)
     base_cost = solution_cost(routes)
     
@@ -93,16 +109,35 @@ def simulated_annealing(
     initial_temp: float = 1000.0,
     cooling_rate: float = 0.995,
     stop_temp: float = 0.1,
-    time_limit_sec: Optional[float] = None
+    time_limit_sec: Optional[float] = None,
+    seed_with: Optional[List[str]] = None,
+    initial_chrom: Optional[List[int]] = None,
+    on_improve: Optional[Callable[[List[int], float], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None
 ):
+    # on_improve(chrom, fitness): dipanggil setiap ada best global baru
+    # should_stop(): dicek setiap iterasi; True → berhenti lebih awal
+    # Return juga "trace": list (time_sec, evals, best_cost) setiap best membaik
     start_time = time.perf_counter()
+    evals_start = FITNESS_EVALS
     
-    # 1. Inisialisasi Solusi Awal
-    current_sol = random_chromosome()
+    # 1. Inisialisasi Solusi Awal (random, atau warm-start dari solusi
+    #    konstruktif terbaik jika seed_with diisi, mis. ["greedy", "savings"],
+    #    atau initial_chrom eksplisit, mis. incumbent dari solver lain)
+    if initial_chrom is not None:
+        current_sol = initial_chrom[:]
+    elif seed_with:
+        seeds = seed_chromosomes(DIST, DEMAND, CAPACITY, seed_with, len(seed_with))
+        current_sol = min(seeds, key=fitness)
+    else:
+        current_sol = random_chromosome()
     current_cost = fitness(current_sol)
     
     best_sol = current_sol[:]
     best_cost = current_cost
+    trace = [(time.perf_counter() - start_time, FITNESS_EVALS - evals_start, best_cost)]
+    if on_improve is not None:
+        on_improve(best_sol, best_cost)
     
     temp = initial_temp
     iter_count = 0
@@ -112,6 +147,8 @@ def simulated_annealing(
         iter_count += 1
         if time_limit_sec and (time.perf_counter() - start_time) > time_limit_sec:
             break
+        if should_stop is not None and should_stop():
+            break
             
         # 2. Buat Neighbor (Tukar posisi 2 customer secara acak / SWAP)
         neighbor = current_sol[:]
@@ -134,34 +171,81 @@ def simulated_annealing(
             if current_cost < best_cost:
                 best_cost = current_cost
                 best_sol = current_sol[:]
+                trace.append((time.perf_counter() - start_time, FITNESS_EVALS - evals_start, best_cost))
+                if on_improve is not None:
+                    on_improve(best_sol, best_cost)
         
         # 5. Turunkan Suhu (Cooling)
         temp *= cooling_rate
         
-    return {"chrom": best_sol, "fitness": best_cost, "iters": iter_count}
+    return {"chrom": best_sol, "fitness": best_cost, "iters": iter_count, "trace": trace}
+
+
+# --------------------------------------------------------------------
+# Streaming incumbent (generator)
+# --------------------------------------------------------------------
+def iter_incumbents(
+    deadline: Optional[float] = None,
+    cancel=None,
+    **kwargs,
+) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
+    """
+    Versi generator simulated_annealing(**kwargs): yield dict "routes",
+    "chrom", "cost", "elapsed", "evals" setiap ada best global baru.
+    Berhenti lebih awal kalau time.perf_counter() >= deadline,
+    cancel.is_set(), atau pemanggil berhenti mengiterasi. Return value
+    generator = hasil simulated_annealing.
+    """
+    start = time.perf_counter()
+    evals_start = FITNESS_EVALS
+
+    def make_item(chrom, cost):
+        return {
+            "routes": decode_routes(chrom),
+            "chrom": chrom[:],
+            "cost": cost,
+            "elapsed": time.perf_counter() - start,
+            "evals": FITNESS_EVALS - evals_start,
+        }
+
+    def solve(on_improve, should_stop):
+        return simulated_annealing(on_improve=on_improve, should_stop=should_stop, **kwargs)
+
+    return (yield from incumbents.stream(solve, make_item, deadline, cancel))
 
 # --------------------------------------------------------------------
 # Main Execution (Untuk dijalankan via terminal / benchmark)
 # --------------------------------------------------------------------
 if __name__ == "__main__":
+    profiling.maybe_start(INSTANCE_FILE, "sa")
+    timing.pin_cpus()
     # Ambil parameter jumlah run dari command line
-    NUM_RUNS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    NUM_RUNS = int(ARGS[2]) if len(ARGS) > 2 else 5
     TIME_LIMIT = 10.0 # Detik per run (biar adil dengan algo lain)
+    # Warm-start opsional: python sa_vrp.py <file> <runs> greedy,savings
+    SEED_WITH = parse_seed_with(ARGS[3] if len(ARGS) > 3 else None)
     
     print(f"Running SA on {INSTANCE_FILE} for {NUM_RUNS} runs...")
     
     best_overall = None
     fitnesses = []
+    run_traces = []
+    total_iters = 0
     
+    STARTED_AT = datetime.now().isoformat(timespec="seconds")
+    evals_before = FITNESS_EVALS
     start_total = time.perf_counter()
+    timing.start("solve")
     
     for r in range(NUM_RUNS):
         seed = 300 + r
         random.seed(seed) # Set seed biar reproducible
         
         # Jalankan algoritma
-        res = simulated_annealing(time_limit_sec=TIME_LIMIT)
+        res = simulated_annealing(time_limit_sec=TIME_LIMIT, seed_with=SEED_WITH)
         fitnesses.append(res["fitness"])
+        run_traces.append({"run": r + 1, "seed": seed, "trace": res["trace"]})
+        total_iters += res["iters"]
         
         # Simpan yang terbaik dari semua run
         if best_overall is None or res["fitness"] < best_overall["fitness"]:
@@ -173,8 +257,13 @@ if __name__ == "__main__":
             }
             
     end_total = time.perf_counter()
+    timing.stop("solve")
+    timing.start("report")
     total_time = end_total - start_total
     
+    # Instrumentasi: evals, evals/s, iterasi, time split (lihat instrument.py)
+    instr_fields = instrument.summary_fields(FITNESS_EVALS - evals_before, total_iters, total_time)
+    
     # --- Output Summary ---
     routes = decode_routes(best_overall["chrom"])
     route_str = "/".join(["-".join(map(str, r)) for r in routes])
@@ -184,21 +273,48 @@ if __name__ == "__main__":
     worst_cost = max(fitnesses)
     
     # Format output satu baris untuk ditangkap benchmark_all.py
-    # Format: SA_SUMMARY|file|best|avg|worst|runs|best_run|seed|n_routes|n_nodes|n_cust|cap|total_dem|route|chrom|total_time|avg_time
+    # Format: SA_SUMMARY|file|best|avg|worst|runs|best_run|seed|n_routes|n_nodes|n_cust|cap|total_dem|route|chrom|total_time|avg_time|<instrument.SUMMARY_HEADER>
     summary_line = (
         f"SA_SUMMARY|{INSTANCE_FILE}|{best_overall['fitness']:.2f}|"
         f"{avg_cost:.2f}|{worst_cost:.2f}|{NUM_RUNS}|"
         f"{best_overall['run']}|{best_overall['seed']}|{len(routes)}|{N}|{N-1}|"
         f"{CAPACITY}|{sum(DEMAND):.2f}|{route_str}|{chrom_str}|"
-        f"{total_time:.4f}|{total_time/NUM_RUNS:.4f}"
+        f"{total_time:.4f}|{total_time/NUM_RUNS:.4f}|"
+        + "|".join(instr_fields)
     )
     print("\n" + summary_line)
     
-    # Simpan ke CSV khusus SA
+    # Simpan ke results store + CSV khusus SA (header = field SA_SUMMARY tanpa tag)
     base_name = os.path.splitext(os.path.basename(INSTANCE_FILE))[0]
-    with open(f"{base_name}_sa_summary.csv", "a", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(summary_line.split("|"))
+    header = [
+        "instance_file",
+        "best_cost",
+        "avg_cost",
+        "worst_cost",
+        "num_runs",
+        "best_run",
+        "best_seed",
+        "num_routes",
+        "num_nodes",
+        "num_customers",
+        "capacity",
+        "total_demand",
+        "best_route",
+        "chromosome",
+        "total_time_sec",
+        "avg_time_per_run_sec",
+    ] + instrument.SUMMARY_HEADER
+    SA_PARAMS = {"time_limit_sec": TIME_LIMIT, "seed_with": SEED_WITH, "num_runs": NUM_RUNS}
+    results_store.save_result(
+        INSTANCE_FILE, "sa", SA_PARAMS, header, summary_line.split("|")[1:],
+        run_traces, STARTED_AT, f"{base_name}_sa_summary.csv",
+    )
+
+    # Simpan convergence trace semua run
+    append_trace_csv(f"{base_name}_sa_trace.csv", INSTANCE_FILE, "SA", STARTED_AT, run_traces)
         
     # Simpan Gambar Rute
-    plot_routes(routes, f"SA Best Route - {INSTANCE_FILE}", f"{base_name}_sa_route.png")
\ No newline at end of file
+    plot_routes(routes, f"SA Best Route - {INSTANCE_FILE}", f"{base_name}_sa_route.png")
+
+    timing.stop("report")
+    print(timing.timing_line("SA", INSTANCE_FILE))
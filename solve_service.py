@@ -0,0 +1,689 @@
+"""
+solve_service.py
+
+Service HTTP/JSON lokal untuk solve CVRP tanpa biaya start interpreter,
+import, dan parsing per request:
+
+- Front end asyncio (HTTP/1.1 minimal, stdlib saja) menerima job, menaruhnya
+  di antrean terbatas (--max-queue, penuh → 429), dan menjalankan maks.
+  --workers job sekaligus.
+- Back end ProcessPoolExecutor (fork). Semua modul solver di-import dan
+  instance dari argumen CLI di-parse SEBELUM fork, jadi setiap worker sudah
+  "hangat" (modul, matplotlib, OR-Tools, instance) dan tetap hidup selama
+  service jalan. Instance yang didaftarkan belakangan di-cache di worker
+  setelah dipakai pertama kali; job hanya mengirim id instance, matriks
+  jarak instance inline baru dikirim kalau worker belum punya. Kalau worker
+  mati (BrokenProcessPool), pool dibangun ulang.
+- Setiap incumbent baru dari solver dikirim worker lewat multiprocessing
+  Queue dan bisa di-stream (NDJSON, chunked) ke client. Job bisa dihentikan
+  lebih awal lewat target_cost atau DELETE; solver berhenti di pengecekan
+  should_stop berikutnya dan hasil terbaik sejauh ini tetap dikembalikan.
+
+    python solve_service.py inst1.vrp [inst2.vrp ...] [--port=8765] [--host=127.0.0.1]
+                            [--workers=N] [--max-queue=64] [--max-time=300]
+
+Minimal satu instance dibutuhkan saat start (modul solver membaca instance
+pertama saat di-import). Endpoint:
+
+    GET    /health                  status antrean & worker
+    GET    /instances               instance yang ter-cache
+    POST   /instances               {"path": "x.vrp"} atau
+                                    {"name", "capacity", "dist", "demands"}
+    POST   /jobs                    {"instance": id | "path": "x.vrp", "solver": "hgs",
+                                     "time_limit_sec": 10, "seed": 1, "target_cost": null,
+                                     "params": {...}, "stream": false}
+    GET    /jobs                    ringkasan semua job
+    GET    /jobs/<id>               status + hasil
+    GET    /jobs/<id>/stream        NDJSON: event "incumbent"... lalu "done"
+    DELETE /jobs/<id>               batalkan (queued) / hentikan (running)
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import multiprocessing as mp
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+
+from parser import load_cvrp_instance
+from constructive import greedy_routes
+from instance_binding import bind_instance
+from reopt_vrp import reoptimize, routes_cost
+import results_store
+
+# --------------------------------------------------------------------
+# Konfigurasi
+# --------------------------------------------------------------------
+# argumen posisi = instance yang di-preload; flag "--..." = opsi service
+ARGS = [a for a in sys.argv if not a.startswith("--")]
+PRELOAD = ARGS[1:]
+
+SOLVERS = ("greedy", "ga", "tabu", "sa", "alns", "hgs", "ortools", "reopt")
+SOLVER_MODULES = {
+    "ga": "ga_vrp",
+    "tabu": "tabu_vrp",
+    "sa": "sa_vrp",
+    "alns": "alns_vrp",
+    "hgs": "hgs_vrp",
+    "ortools": "ortools_solver",
+}
+# parameter default per solver (sama dengan main masing-masing modul);
+# "params" di request menimpa nilai ini
+DEFAULT_PARAMS = {
+    "ga": {"generations": 300, "pop_size": 150, "local_search": "route", "log_every": 0},
+    "tabu": {"max_iters": 500, "tabu_tenure": 10, "max_no_improve": 150, "log_every": 0},
+    "sa": {},
+    "alns": {"iterations": 20000},
+    "hgs": {"mu": 25, "lam": 40, "n_elite": 4, "n_close": 5, "neighbors_k": 20, "max_no_improve": 2000},
+    "ortools": {"first_solution": "PATH_CHEAPEST_ARC", "metaheuristic": "GUIDED_LOCAL_SEARCH"},
+    "greedy": {},
+    "reopt": {},
+}
+
+# solver berbasis kromosom: nama fungsi solve di modulnya
+CHROM_SOLVER_FUNCS = {"ga": "genetic_algorithm", "tabu": "tabu_search", "sa": "simulated_annealing"}
+
+CANCEL_SLOTS = 1024      # job_id % CANCEL_SLOTS → slot flag pembatalan
+MAX_JOBS_KEPT = 1000     # job selesai yang disimpan untuk GET /jobs/<id>
+FINAL_STATUSES = ("done", "cancelled", "failed")
+
+# diisi sebelum fork, diwarisi worker
+MODULES: Dict[str, Any] = {}
+INSTANCES: Dict[str, Dict[str, Any]] = {}
+PRELOADED_IDS = set()
+CANCEL = None   # mp.Array("i"): CANCEL[job_id % CANCEL_SLOTS] == job_id → stop
+EVENTS = None   # mp.Queue: (job_id, event) dari worker ke front end
+
+
+def load_solvers():
+    """Import semua modul solver (membaca instance pertama dari sys.argv)."""
+    for name, module in SOLVER_MODULES.items():
+        MODULES[name] = importlib.import_module(module)
+
+
+# --------------------------------------------------------------------
+# Instance
+# --------------------------------------------------------------------
+def register_file(path: str) -> str:
+    """Parse file .vrp (sekali per isi file). Return id instance (hash isi file)."""
+    digest = results_store.file_hash(path)
+    if digest == "-":
+        raise ValueError(f"File instance tidak ditemukan: {path}")
+    inst_id = digest[:16]
+    if inst_id not in INSTANCES:
+        n, capacity, dist, demands = load_cvrp_instance(path)
+        INSTANCES[inst_id] = {
+            "name": os.path.basename(path), "path": path,
+            "n": n, "capacity": capacity, "dist": dist, "demands": demands,
+        }
+    return inst_id
+
+
+def register_inline(spec: Dict[str, Any]) -> str:
+    """Instance dari JSON {"name", "capacity", "dist", "demands"}. Return id instance."""
+    try:
+        capacity = float(spec["capacity"])
+        dist = [[float(d) for d in row] for row in spec["dist"]]
+        demands = [float(d) for d in spec["demands"]]
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Instance inline butuh capacity, dist (n×n) dan demands (n)")
+    n = len(demands)
+    if n < 2 or len(dist) != n or any(len(row) != n for row in dist):
+        raise ValueError(f"dist harus matriks {n}×{n} (sesuai panjang demands)")
+    payload = json.dumps([capacity, dist, demands]).encode()
+    inst_id = hashlib.sha256(payload).hexdigest()[:16]
+    if inst_id not in INSTANCES:
+        INSTANCES[inst_id] = {
+            "name": str(spec.get("name", inst_id)), "path": None,
+            "n": n, "capacity": capacity, "dist": dist, "demands": demands,
+        }
+    return inst_id
+
+
+def instance_info(inst_id: str) -> Dict[str, Any]:
+    inst = INSTANCES[inst_id]
+    return {
+        "instance": inst_id, "name": inst["name"], "n": inst["n"],
+        "capacity": inst["capacity"], "total_demand": sum(inst["demands"]),
+    }
+
+
+# --------------------------------------------------------------------
+# Worker (proses back end)
+# --------------------------------------------------------------------
+_WORKER_CACHE: Dict[str, Dict[str, Any]] = {}
+_BOUND: Dict[str, str] = {}   # nama solver → id instance yang sedang di-bind
+
+
+class InstanceNotCached(Exception):
+    """Worker belum punya instance dan task tidak membawa datanya."""
+
+
+def _warm(_idx: int) -> int:
+    return os.getpid()  # no-op: hanya supaya proses worker start saat service start
+
+
+def _worker_instance(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Instance job: warisan fork / cache worker, selain itu dari task["instance"]
+    ({"path"} atau data inline). Task tanpa data → InstanceNotCached (dispatcher
+    mengirim ulang job dengan data instance).
+    """
+    inst_id = task["instance_id"]
+    inst = INSTANCES.get(inst_id) or _WORKER_CACHE.get(inst_id)
+    if inst is None:
+        src = task["instance"]
+        if src is None:
+            raise InstanceNotCached(inst_id)
+        if src.get("path"):
+            n, capacity, dist, demands = load_cvrp_instance(src["path"])
+            inst = {"n": n, "capacity": capacity, "dist": dist, "demands": demands}
+        else:
+            inst = src
+        _WORKER_CACHE[inst_id] = inst
+    return inst
+
+
+def bind_solver(solver: str, inst_id: str, inst: Dict[str, Any]):
+    """instance_binding.bind_instance, dilewati kalau instance ini sudah di-bind."""
+    if _BOUND.get(solver) == inst_id:
+        return
+    bind_instance(MODULES[solver], inst["n"], inst["capacity"], inst["dist"], inst["demands"])
+    _BOUND[solver] = inst_id
+
+
+def run_job(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Jalankan satu job di worker. Setiap incumbent baru dikirim ke EVENTS;
+    pesan terakhir job selalu (job_id, None) supaya front end tahu semua
+    incumbent sudah terkirim. Return dict: "routes", "cost", "evals", "elapsed".
+    """
+    job_id = task["job_id"]
+    slot = job_id % CANCEL_SLOTS
+    solver = task["solver"]
+    target = task["target_cost"]
+    start = time.perf_counter()
+    deadline = start + task["time_limit_sec"]
+    best = [float("inf")]
+    # di luar try: cache miss dikirim ulang dispatcher, belum ada event job
+    inst = _worker_instance(task)
+    try:
+        random.seed(task["seed"])
+        module = MODULES.get(solver)
+        if module is not None:
+            bind_solver(solver, task["instance_id"], inst)
+        evals_before = getattr(module, "FITNESS_EVALS", 0)
+
+        def evals() -> int:
+            return getattr(module, "FITNESS_EVALS", 0) - evals_before
+
+        def publish(cost: float, routes=None, tour=None):
+            if cost >= best[0]:
+                return
+            best[0] = cost
+            event = {"event": "incumbent", "cost": cost, "elapsed": time.perf_counter() - start, "evals": evals()}
+            if routes is not None:
+                event["routes"] = routes
+            if tour is not None:
+                event["tour"] = list(tour)
+            EVENTS.put((job_id, event))
+
+        def should_stop() -> bool:
+            return (
+                CANCEL[slot] == job_id
+                or time.perf_counter() >= deadline
+                or (target is not None and best[0] <= target)
+            )
+
+        params = {**DEFAULT_PARAMS[solver], **task["params"]}
+        with contextlib.redirect_stdout(io.StringIO()):
+            routes = _solve(solver, module, inst, params, task["time_limit_sec"], publish, should_stop)
+        cost = routes_cost(routes, inst["dist"])
+        publish(cost, routes=routes)
+        return {"routes": routes, "cost": cost, "evals": evals(), "elapsed": time.perf_counter() - start}
+    finally:
+        EVENTS.put((job_id, None))
+
+
+def _solve(solver, module, inst, params, time_limit_sec, publish, should_stop) -> List[List[int]]:
+    """Panggil solver dengan hook on_improve / should_stop. Return rute terbaik."""
+    if solver == "greedy":
+        return greedy_routes(inst["dist"], inst["demands"], inst["capacity"])
+    if solver == "reopt":
+        res = reoptimize(
+            params["previous_routes"], inst["dist"], inst["demands"], inst["capacity"],
+            added=params.get("added", ()),
+            removed=params.get("removed", ()),
+            demand_changes={int(c): d for c, d in params.get("demand_changes", {}).items()},
+            time_limit_sec=time_limit_sec,
+        )
+        return res["routes"]
+    if solver == "ortools":
+        initial = greedy_routes(inst["dist"], inst["demands"], inst["capacity"])
+        res = module.solve_with_ortools(
+            num_vehicles=len(initial),
+            time_limit_sec=max(1, int(round(time_limit_sec))),
+            initial_routes=initial,
+            on_improve=lambda routes, cost: publish(cost, routes=routes),
+            should_stop=should_stop,
+            **params,
+        )
+        return res["routes"] if res else initial
+    if solver in ("alns", "hgs"):
+        run = module.alns if solver == "alns" else module.hybrid_genetic_search
+        res = run(
+            time_limit_sec=time_limit_sec,
+            on_improve=lambda tour, cost: publish(cost, tour=tour),
+            should_stop=should_stop,
+            **params,
+        )
+        return res["routes"]
+
+    # GA mengirim rute hasil route local search sebagai argumen ketiga
+    def on_improve(chrom, cost, routes=None):
+        publish(cost, routes=routes if routes is not None else module.decode_routes(chrom), tour=chrom)
+
+    run = getattr(module, CHROM_SOLVER_FUNCS[solver])
+    res = run(time_limit_sec=time_limit_sec, on_improve=on_improve, should_stop=should_stop, **params)
+    return res["routes"] if "routes" in res else module.decode_routes(res["chrom"])
+
+
+# --------------------------------------------------------------------
+# Front end: state job
+# --------------------------------------------------------------------
+JOBS: Dict[int, Dict[str, Any]] = {}
+_NEXT_JOB_ID = 0
+
+
+def new_job(spec: Dict[str, Any], max_time: float) -> Dict[str, Any]:
+    """Validasi request POST /jobs dan buat state job (status "queued")."""
+    global _NEXT_JOB_ID
+    solver = spec.get("solver", "hgs")
+    if solver not in SOLVERS:
+        raise ValueError(f"Solver tidak dikenal: {solver} ({', '.join(SOLVERS)})")
+    if "path" in spec:
+        inst_id = register_file(spec["path"])
+    else:
+        inst_id = spec.get("instance")
+        if inst_id not in INSTANCES:
+            raise ValueError(f"Instance tidak dikenal: {inst_id} (daftarkan lewat POST /instances)")
+    time_limit = float(spec.get("time_limit_sec", 10.0))
+    if not 0 < time_limit <= max_time:
+        raise ValueError(f"time_limit_sec harus di (0, {max_time}]")
+    params = spec.get("params") or {}
+    if not isinstance(params, dict):
+        raise ValueError("params harus object JSON")
+    if solver == "reopt" and "previous_routes" not in params:
+        raise ValueError("Solver reopt butuh params.previous_routes")
+    target = spec.get("target_cost")
+
+    _NEXT_JOB_ID += 1
+    return {
+        "id": _NEXT_JOB_ID,
+        "solver": solver,
+        "instance": inst_id,
+        "time_limit_sec": time_limit,
+        "seed": int(spec.get("seed", _NEXT_JOB_ID)),
+        "target_cost": None if target is None else float(target),
+        "params": params,
+        "status": "queued",
+        "created_at": time.time(),
+        "started_at": None,
+        "finished_at": None,
+        "events": [],
+        "changed": asyncio.Event(),
+        "drained": asyncio.Event(),
+        "result": None,
+        "error": None,
+    }
+
+
+def push_event(job: Dict[str, Any], event: Dict[str, Any]):
+    """Tambah event ke job dan bangunkan semua stream yang menunggu."""
+    job["events"].append(event)
+    changed, job["changed"] = job["changed"], asyncio.Event()
+    changed.set()
+
+
+def on_worker_event(job_id: int, event: Optional[Dict[str, Any]]):
+    job = JOBS.get(job_id)
+    if job is None:
+        return
+    if event is None:
+        job["drained"].set()
+    else:
+        push_event(job, event)
+
+
+def job_summary(job: Dict[str, Any]) -> Dict[str, Any]:
+    res = job["result"] or {}
+    incumbents = [e for e in job["events"] if e["event"] == "incumbent"]
+    return {
+        "job": job["id"],
+        "solver": job["solver"],
+        "instance": job["instance"],
+        "status": job["status"],
+        "time_limit_sec": job["time_limit_sec"],
+        "seed": job["seed"],
+        "incumbents": len(incumbents),
+        "best_cost": res.get("cost", incumbents[-1]["cost"] if incumbents else None),
+        "queue_sec": (job["started_at"] or time.time()) - job["created_at"],
+        "run_sec": (job["finished_at"] or time.time()) - job["started_at"] if job["started_at"] else None,
+        "error": job["error"],
+    }
+
+
+def prune_jobs():
+    finished = [j for j in JOBS.values() if j["status"] in FINAL_STATUSES]
+    for job in sorted(finished, key=lambda j: j["id"])[:max(0, len(finished) - MAX_JOBS_KEPT)]:
+        del JOBS[job["id"]]
+
+
+# --------------------------------------------------------------------
+# Front end: dispatcher (satu per worker) & pembaca event
+# --------------------------------------------------------------------
+def start_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool fork (mewarisi modul & instance) dengan semua worker sudah jalan."""
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("fork"))
+    list(pool.map(_warm, range(workers)))  # paksa semua worker start sekarang
+    return pool
+
+
+def restart_pool(state: Dict[str, Any], broken: ProcessPoolExecutor):
+    """Ganti pool yang rusak (sekali, walau beberapa dispatcher melihatnya)."""
+    if state["pool"] is not broken:
+        return
+    broken.shutdown(wait=False, cancel_futures=True)
+    state["pool"] = start_pool(state["workers"])
+    state["pool_restarts"] += 1
+    print(f"[Service] worker process mati, pool dibangun ulang ({state['pool_restarts']}x)")
+
+
+async def dispatcher(queue: asyncio.Queue, state: Dict[str, Any]):
+    loop = asyncio.get_running_loop()
+    while True:
+        job = await queue.get()
+        if job["status"] != "queued":
+            continue  # dibatalkan saat antre
+        job["status"] = "running"
+        job["started_at"] = time.time()
+        inst_id = job["instance"]
+        inst = INSTANCES[inst_id]
+        task = {
+            "job_id": job["id"],
+            "solver": job["solver"],
+            "instance_id": inst_id,
+            # instance preload sudah ada di memori worker (warisan fork);
+            # instance inline hanya id dulu (lihat InstanceNotCached)
+            "instance": {"path": inst["path"]} if inst["path"] and inst_id not in PRELOADED_IDS else None,
+            "time_limit_sec": job["time_limit_sec"],
+            "seed": job["seed"],
+            "target_cost": job["target_cost"],
+            "params": job["params"],
+        }
+        pool = state["pool"]
+        try:
+            try:
+                result = await loop.run_in_executor(pool, run_job, task)
+            except InstanceNotCached:
+                task["instance"] = inst
+                result = await loop.run_in_executor(pool, run_job, task)
+            await job["drained"].wait()
+            job["result"] = result
+            if job["status"] != "cancelled":
+                job["status"] = "done"
+        except BrokenProcessPool:
+            job["status"] = "failed"
+            job["error"] = "worker process mati"
+            await loop.run_in_executor(None, restart_pool, state, pool)
+        except Exception as exc:  # error dari solver / params → job gagal, service jalan terus
+            await job["drained"].wait()
+            job["status"] = "failed"
+            job["error"] = f"{type(exc).__name__}: {exc}"
+        job["finished_at"] = time.time()
+        done = {"event": "done", **job_summary(job)}
+        if job["result"]:
+            done["routes"] = job["result"]["routes"]
+        push_event(job, done)
+        print(
+            f"[Service] job {job['id']} {job['solver']} {job['status']}: "
+            f"cost = {job_summary(job)['best_cost']}, run = {job['finished_at'] - job['started_at']:.2f}s"
+        )
+        prune_jobs()
+
+
+def event_reader(loop: asyncio.AbstractEventLoop):
+    """Thread: teruskan event worker (EVENTS) ke event loop front end."""
+    while True:
+        item = EVENTS.get()
+        if item is None:
+            break
+        loop.call_soon_threadsafe(on_worker_event, *item)
+
+
+# --------------------------------------------------------------------
+# Front end: HTTP
+# --------------------------------------------------------------------
+STATUS_TEXT = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found",
+               405: "Method Not Allowed", 429: "Too Many Requests", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+async def send_json(writer: asyncio.StreamWriter, status: int, body: Any):
+    data = json.dumps(body).encode()
+    writer.write(
+        f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data
+    )
+    await writer.drain()
+
+
+async def send_stream(writer: asyncio.StreamWriter, job: Dict[str, Any]):
+    """NDJSON chunked: semua event job (termasuk yang sudah lewat) sampai "done"."""
+    writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+        b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n"
+    )
+    idx = 0
+    while True:
+        changed = job["changed"]
+        while idx < len(job["events"]):
+            line = json.dumps(job["events"][idx]).encode() + b"\n"
+            writer.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+            idx += 1
+        await writer.drain()
+        if job["finished_at"] is not None and idx == len(job["events"]):
+            break
+        await changed.wait()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+def get_job(parts: List[str]) -> Dict[str, Any]:
+    try:
+        job = JOBS.get(int(parts[1]))
+    except ValueError:
+        job = None
+    if job is None:
+        raise HTTPError(404, f"Job tidak ditemukan: {parts[1]}")
+    return job
+
+
+async def route(method: str, path: str, body: bytes, writer, state: Dict[str, Any]):
+    parts = [p for p in path.split("?")[0].split("/") if p]
+    loop = asyncio.get_running_loop()
+    spec = {}
+    if body:
+        try:
+            spec = json.loads(body)
+        except json.JSONDecodeError as exc:
+            raise HTTPError(400, f"Body bukan JSON: {exc}")
+        if not isinstance(spec, dict):
+            raise HTTPError(400, "Body harus object JSON")
+
+    if parts == ["health"] and method == "GET":
+        queue = state["queue"]
+        running = sum(j["status"] == "running" for j in JOBS.values())
+        return await send_json(writer, 200, {
+            "workers": state["workers"], "queued": queue.qsize(), "max_queue": queue.maxsize,
+            "running": running, "instances": len(INSTANCES), "solvers": list(SOLVERS),
+            "pool_restarts": state["pool_restarts"],
+        })
+    if parts == ["instances"]:
+        if method == "GET":
+            return await send_json(writer, 200, [instance_info(i) for i in INSTANCES])
+        if method == "POST":
+            try:
+                if "path" in spec:
+                    inst_id = await loop.run_in_executor(None, register_file, spec["path"])
+                else:
+                    inst_id = register_inline(spec)
+            except ValueError as exc:
+                raise HTTPError(400, str(exc))
+            return await send_json(writer, 200, instance_info(inst_id))
+        raise HTTPError(405, method)
+    if parts == ["jobs"]:
+        if method == "GET":
+            return await send_json(writer, 200, [job_summary(j) for j in JOBS.values()])
+        if method == "POST":
+            try:
+                if "path" in spec:
+                    await loop.run_in_executor(None, register_file, spec["path"])
+                job = new_job(spec, state["max_time"])
+            except (ValueError, TypeError) as exc:
+                raise HTTPError(400, str(exc))
+            try:
+                state["queue"].put_nowait(job)
+            except asyncio.QueueFull:
+                raise HTTPError(429, f"Antrean penuh ({state['queue'].maxsize} job)")
+            JOBS[job["id"]] = job
+            if spec.get("stream"):
+                return await send_stream(writer, job)
+            return await send_json(writer, 202, job_summary(job))
+        raise HTTPError(405, method)
+    if len(parts) == 2 and parts[0] == "jobs":
+        job = get_job(parts)
+        if method == "GET":
+            summary = job_summary(job)
+            if job["result"]:
+                summary["routes"] = job["result"]["routes"]
+            return await send_json(writer, 200, summary)
+        if method == "DELETE":
+            if job["status"] == "queued":
+                job["status"] = "cancelled"
+                job["finished_at"] = time.time()
+                push_event(job, {"event": "done", **job_summary(job)})
+            elif job["status"] == "running":
+                job["status"] = "cancelled"
+                CANCEL[job["id"] % CANCEL_SLOTS] = job["id"]
+            return await send_json(writer, 200, job_summary(job))
+        raise HTTPError(405, method)
+    if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "stream" and method == "GET":
+        return await send_stream(writer, get_job(parts))
+    raise HTTPError(404, f"Path tidak dikenal: {path}")
+
+
+async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, state: Dict[str, Any]):
+    try:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        if not request_line:
+            return
+        method, path = request_line.split(" ")[:2]
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        body = await reader.readexactly(length) if length else b""
+        await route(method.upper(), path, body, writer, state)
+    except HTTPError as exc:
+        await send_json(writer, exc.status, {"error": str(exc)})
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except Exception as exc:
+        await send_json(writer, 500, {"error": f"{type(exc).__name__}: {exc}"})
+    finally:
+        writer.close()
+
+
+async def serve(pool: ProcessPoolExecutor, host: str, port: int, workers: int, max_queue: int, max_time: float):
+    loop = asyncio.get_running_loop()
+    state = {
+        "queue": asyncio.Queue(maxsize=max_queue), "workers": workers, "max_time": max_time,
+        "pool": pool, "pool_restarts": 0,
+    }
+    reader_thread = threading.Thread(target=event_reader, args=(loop,), daemon=True)
+    reader_thread.start()
+    dispatchers = [asyncio.create_task(dispatcher(state["queue"], state)) for _ in range(workers)]
+    server = await asyncio.start_server(lambda r, w: handle_client(r, w, state), host, port)
+    print(f"[Service] listening on http://{host}:{port} ({workers} workers, max queue {max_queue})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for task in dispatchers:
+            task.cancel()
+        EVENTS.put(None)
+        if state["pool"] is not pool:
+            state["pool"].shutdown(cancel_futures=True)
+
+
+# --------------------------------------------------------------------
+# Main Execution
+# --------------------------------------------------------------------
+if __name__ == "__main__":
+    if not PRELOAD:
+        print(__doc__)
+        sys.exit(2)
+
+    HOST, PORT = "127.0.0.1", 8765
+    WORKERS = os.cpu_count() or 1
+    MAX_QUEUE = 64
+    MAX_TIME = 300.0
+    for arg in sys.argv[1:]:
+        name, _, value = arg.partition("=")
+        if name == "--host" and value:
+            HOST = value
+        elif name == "--port" and value:
+            PORT = int(value)
+        elif name == "--workers" and value:
+            WORKERS = int(value)
+        elif name == "--max-queue" and value:
+            MAX_QUEUE = int(value)
+        elif name == "--max-time" and value:
+            MAX_TIME = float(value)
+
+    # semua yang mahal dikerjakan sekali di sini, sebelum fork
+    load_solvers()
+    for path in PRELOAD:
+        inst_id = register_file(path)
+        PRELOADED_IDS.add(inst_id)
+        print(f"[Service] instance {instance_info(inst_id)}")
+    ctx = mp.get_context("fork")
+    CANCEL = ctx.Array("i", CANCEL_SLOTS, lock=False)
+    EVENTS = ctx.Queue()
+    pool = start_pool(WORKERS)
+
+    try:
+        asyncio.run(serve(pool, HOST, PORT, WORKERS, MAX_QUEUE, MAX_TIME))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -1,32 +1,60 @@
 import random
 import sys
-import csv
 import os
 import time
 import math
-from typing import List, Dict, Any, Optional
+import multiprocessing as mp
+from array import array
+import queue
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable, Generator
 
 import matplotlib.pyplot as plt
 
 from parser import load_cvrp_instance
+from constructive import seed_chromosomes, perturb_chromosome, parse_seed_with
+from convergence import append_trace_csv
+import results_store
+import checkpoint
+import incumbents
+import instrument
+import profiling
+import timing
+from instrument import timed
 
 # --------------------------------------------------------------------
 # Pilih instance file dari argumen CLI
 # --------------------------------------------------------------------
-INSTANCE_FILE = sys.argv[1] if len(sys.argv) > 1 else "output_cvrp.vrp"
+# argumen posisi; flag "--..." (mis. --profile) diabaikan
+ARGS = [a for a in sys.argv if not a.startswith("--")]
+INSTANCE_FILE = ARGS[1] if len(ARGS) > 1 else "output_cvrp.vrp"
 
 # --------------------------------------------------------------------
 # Load instance dari file .vrp
 # --------------------------------------------------------------------
-N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
+with timing.phase("setup"):
+    N, CAPACITY, DIST, DEMAND = load_cvrp_instance(INSTANCE_FILE)
 
 DEPOT = 0
 CUSTOMERS = list(range(1, N))  # node 1..N-1
 
+# jumlah pemanggilan fitness() (dipakai untuk convergence trace)
+FITNESS_EVALS = 0
+
+# Reactive tabu (Battiti & Tecchiolli): tenure naik saat solusi berulang
+# (cycling), turun kalau lama tidak ada pengulangan; escape acak kalau
+# pengulangan kronis
+TENURE_INCREASE = 1.2
+TENURE_DECREASE = 0.9
+MIN_TENURE = 2
+ESCAPE_REPEATS = 3     # solusi dikunjungi ≥ ini kali → dihitung "chaotic"
+ESCAPE_CHAOTIC = 3     # chaotic > ini → escape (perturbasi acak)
+
 
 # --------------------------------------------------------------------
 # Representasi solusi & fungsi bantu
 # --------------------------------------------------------------------
+@timed("decode")
 def decode_routes(chromosome: List[int]) -> List[List[int]]:
     """
     chromosome: permutasi customer [1..N-1] (index node, 0=depot)
@@ -67,12 +95,15 @@ def solution_cost(routes: List[List[int]]) -> float:
     return sum(route_cost(r) for r in routes)
 
 
+@timed("fitness")
 def fitness(chromosome: List[int], penalty_factor: float = 1000.0) -> float:
     """
     Nilai fitness = total cost + penalti overload kapasitas (kalau ada).
     Decode routes akan sebisa mungkin menjaga kapasitas, tapi penalti disimpan
     untuk jaga-jaga jika ada overload.
     """
+    global FITNESS_EVALS
+    FITNESS_EVALS += 1
     routes = decode_routes(chromosome)
     base_cost = solution_cost(routes)
 
@@ -91,42 +122,187 @@ def random_chromosome() -> List[int]:
     return chrom
 
 
+def initial_chromosome(
+    seed_with: Optional[List[str]] = None,
+    seed_perturb: int = 0,
+) -> List[int]:
+    """
+    Titik awal Tabu Search: random, atau (jika seed_with diisi) solusi
+    konstruktif terbaik, opsional diperturbasi seed_perturb swap supaya
+    restart yang berbeda tidak mulai dari titik yang persis sama.
+    """
+    if not seed_with:
+        return random_chromosome()
+
+    seeds = seed_chromosomes(DIST, DEMAND, CAPACITY, seed_with, len(seed_with))
+    start = min(seeds, key=fitness)
+    if seed_perturb > 0:
+        start = perturb_chromosome(start, seed_perturb)
+    return start
+
+
 # --------------------------------------------------------------------
 # Tabu Search untuk CVRP (representasi: permutasi customer)
 # --------------------------------------------------------------------
+def new_tabu_memory() -> array:
+    """
+    Status tabu per pasangan customer (a, b), a < b, di index a * N + b:
+    iterasi terakhir move masih tabu. Cek & update O(1), tidak perlu
+    membersihkan entry yang expired.
+    """
+    return array("i", bytes(4 * N * N))
+
+
+def scan_swap_neighborhood(
+    current: List[int],
+    tabu_until: array,
+    it: int,
+    best_fitness: float,
+    current_fitness: float = float("inf"),
+    freq: Optional[List[int]] = None,
+    freq_weight: float = 0.0,
+):
+    """
+    Evaluasi semua neighbor SWAP (i, j) dari current dan pilih yang terbaik
+    yang tidak tabu (kecuali memenuhi aspiration: lebih baik dari best_fitness).
+    freq / freq_weight: diversifikasi jangka panjang; move yang tidak
+    memperbaiki current dinilai f + freq_weight × (freq[a] + freq[b]).
+    Return (neighbor, fitness, move_key); neighbor None kalau tidak ada.
+    """
+    best_candidate = None
+    best_candidate_f = float("inf")
+    best_candidate_score = float("inf")
+    best_candidate_move = None
+
+    for i in range(len(current) - 1):
+        for j in range(i + 1, len(current)):
+            a = current[i]
+            b = current[j]
+            move_key = a * N + b if a < b else b * N + a
+
+            neighbor = current[:]
+            neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
+            f = fitness(neighbor)
+
+            # cek tabu + aspiration
+            if tabu_until[move_key] > it and f >= best_fitness:
+                # tabu dan tidak mengungguli solusi global terbaik
+                continue
+
+            score = f
+            if freq is not None and f >= current_fitness:
+                score += freq_weight * (freq[a] + freq[b])
+
+            if score < best_candidate_score:
+                best_candidate_score = score
+                best_candidate_f = f
+                best_candidate = neighbor
+                best_candidate_move = move_key
+
+    return best_candidate, best_candidate_f, best_candidate_move
+
+
 def tabu_search(
     max_iters: int = 500,
     tabu_tenure: int = 10,
     max_no_improve: int = 100,
+    reactive: bool = True,
+    freq_penalty: float = 0.5,
     log_every: int = 50,
     time_limit_sec: Optional[float] = None,
+    seed_with: Optional[List[str]] = None,
+    seed_perturb: int = 0,
+    initial_chrom: Optional[List[int]] = None,
+    on_improve: Optional[Callable[[List[int], float], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    resume_state: Optional[Dict[str, Any]] = None,
+    on_checkpoint: Optional[Callable[[Dict[str, Any]], None]] = None,
+    checkpoint_every_sec: float = checkpoint.CHECKPOINT_EVERY_SEC,
 ) -> Dict[str, Any]:
     """
     Tabu Search sederhana dengan neighborhood berbasis SWAP antar dua customer.
     - Representasi solusi: permutasi pelanggan [1..N-1]
     - Neighborhood: semua pasangan (i, j), i < j → swap posisi customer
-    - Tabu list: pasangan customer (c1, c2) yang baru saja di-swap
+    - Tabu list: pasangan customer (c1, c2) yang baru saja di-swap, disimpan
+      sebagai array iterasi-expire per pasangan (new_tabu_memory, O(1))
     - Aspiration: move tabu boleh dipakai jika menghasilkan solusi global terbaik baru
+    - reactive: tenure awal tabu_tenure, naik (× TENURE_INCREASE) setiap
+      current kembali ke solusi yang pernah dikunjungi (hash kromosom), turun
+      (× TENURE_DECREASE) kalau tidak ada pengulangan selama rata-rata
+      panjang siklus; pengulangan kronis → escape dengan perturbasi acak
+    - freq_penalty: diversifikasi jangka panjang; move yang tidak memperbaiki
+      current dipenalti freq_penalty × (best / jumlah customer) × frekuensi
+      relatif customer yang di-swap (berapa kali dipindah / iterasi)
 
     Jika time_limit_sec tidak None, loop akan berhenti jika waktu per run
     melebihi time_limit_sec (fairness vs GA & OR-Tools).
+    seed_with / seed_perturb: warm-start dari solusi konstruktif
+    (lihat initial_chromosome). initial_chrom: titik awal eksplisit
+    (mis. incumbent dari solver lain), mengalahkan seed_with.
+    on_improve(chrom, fitness): dipanggil setiap ada best global baru.
+    should_stop(): dicek setiap iterasi; True → berhenti lebih awal.
+    on_checkpoint(state): dipanggil di akhir iterasi setiap
+    checkpoint_every_sec (atau saat ada permintaan stop, lihat checkpoint.py)
+    dengan state lengkap run ini; resume_state: state tersebut → lanjut persis
+    dari iterasi berikutnya (current, tabu list, RNG, waktu & evals terpakai).
+
+    Return dict best juga berisi "trace": list (time_sec, evals, best_fitness)
+    yang dicatat setiap best global membaik, dan "iters" (jumlah iterasi
+    yang selesai).
     """
 
-    start_time = time.perf_counter()
-
-    current = random_chromosome()
-    current_fitness = fitness(current)
-
-    best = {
-        "chrom": current[:],
-        "fitness": current_fitness,
-    }
-
-    # key tabu: tuple(sorted(customer_i, customer_j)) → expire_iter
-    tabu_list: Dict[tuple, int] = {}
-
-    it = 0
-    no_improve = 0
+    if resume_state is not None:
+        start_time = time.perf_counter() - resume_state["elapsed"]
+        evals_start = FITNESS_EVALS - resume_state["evals"]
+        current = resume_state["current"]
+        current_fitness = resume_state["current_fitness"]
+        best = resume_state["best"]
+        trace = resume_state["trace"]
+        tabu_until = resume_state["tabu_until"]
+        tenure = resume_state["tenure"]
+        visited = resume_state["visited"]
+        freq = resume_state["freq"]
+        avg_cycle = resume_state["avg_cycle"]
+        last_tenure_change = resume_state["last_tenure_change"]
+        chaotic = resume_state["chaotic"]
+        escapes = resume_state["escapes"]
+        it = iters_done = resume_state["iteration"]
+        no_improve = resume_state["no_improve"]
+        random.setstate(resume_state["rng"])
+    else:
+        start_time = time.perf_counter()
+        evals_start = FITNESS_EVALS
+
+        if initial_chrom is not None:
+            current = initial_chrom[:]
+        else:
+            current = initial_chromosome(seed_with, seed_perturb)
+        current_fitness = fitness(current)
+
+        best = {
+            "chrom": current[:],
+            "fitness": current_fitness,
+        }
+        trace = [(time.perf_counter() - start_time, FITNESS_EVALS - evals_start, best["fitness"])]
+        if on_improve is not None:
+            on_improve(best["chrom"], best["fitness"])
+
+        # a * N + b (a < b) → iterasi terakhir move (a, b) masih tabu
+        tabu_until = new_tabu_memory()
+        tenure = float(tabu_tenure)
+        # hash kromosom → (iterasi terakhir dikunjungi, jumlah kunjungan)
+        visited: Dict[int, tuple] = {}
+        freq = [0] * N  # berapa kali setiap customer ikut di-swap
+        avg_cycle = float(tabu_tenure)
+        last_tenure_change = 0
+        chaotic = 0
+        escapes = 0
+
+        it = 0
+        iters_done = 0
+        no_improve = 0
+
+    last_checkpoint = time.perf_counter()
 
     while it < max_iters and no_improve < max_no_improve:
         it += 1
@@ -138,31 +314,17 @@ def tabu_search(
                 print(f"[Tabu] Time limit reached at iteration {it}")
                 break
 
-        best_candidate = None
-        best_candidate_f = float("inf")
-        best_candidate_move = None
+        if should_stop is not None and should_stop():
+            print(f"[Tabu] Stopped at iteration {it}")
+            break
 
         # generate semua neighbor via SWAP
-        for i in range(len(current) - 1):
-            for j in range(i + 1, len(current)):
-                a = current[i]
-                b = current[j]
-                move_key = (min(a, b), max(a, b))
-
-                neighbor = current[:]
-                neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
-                f = fitness(neighbor)
-
-                # cek tabu + aspiration
-                is_tabu = move_key in tabu_list and tabu_list[move_key] > it
-                if is_tabu and f >= best["fitness"]:
-                    # tabu dan tidak mengungguli solusi global terbaik
-                    continue
-
-                if f < best_candidate_f:
-                    best_candidate_f = f
-                    best_candidate = neighbor
-                    best_candidate_move = move_key
+        freq_weight = freq_penalty * best["fitness"] / max(1, len(CUSTOMERS) * it)
+        with instrument.timer("neighborhood"):
+            best_candidate, best_candidate_f, best_candidate_move = scan_swap_neighborhood(
+                current, tabu_until, it, best["fitness"], current_fitness,
+                freq if freq_penalty > 0 else None, freq_weight,
+            )
 
         if best_candidate is None:
             # tidak ada neighbor yang dapat dipilih (jarang terjadi)
@@ -173,23 +335,55 @@ def tabu_search(
         current = best_candidate
         current_fitness = best_candidate_f
 
-        # update tabu list untuk move yang dipakai
+        # update status tabu & frekuensi untuk move yang dipakai (O(1))
         if best_candidate_move is not None:
-            tabu_list[best_candidate_move] = it + tabu_tenure
-
-        # bersihkan tabu yang sudah expired (opsional, untuk mencegah growth)
-        expired_keys = [mv for mv, exp in tabu_list.items() if exp <= it]
-        for k in expired_keys:
-            del tabu_list[k]
+            tabu_until[best_candidate_move] = it + round(tenure)
+            freq[best_candidate_move // N] += 1
+            freq[best_candidate_move % N] += 1
+
+        if reactive:
+            key = hash(tuple(current))
+            seen = visited.get(key)
+            if seen is not None:
+                # cycling: tenure naik, rata-rata panjang siklus diperbarui
+                last_seen, count = seen
+                visited[key] = (it, count + 1)
+                avg_cycle = 0.1 * (it - last_seen) + 0.9 * avg_cycle
+                tenure = min(max(tabu_tenure, len(CUSTOMERS) / 2), tenure * TENURE_INCREASE + 1)
+                last_tenure_change = it
+                if count + 1 >= ESCAPE_REPEATS:
+                    chaotic += 1
+            else:
+                visited[key] = (it, 1)
+                if it - last_tenure_change > avg_cycle:
+                    tenure = max(MIN_TENURE, tenure * TENURE_DECREASE)
+                    last_tenure_change = it
+
+            if chaotic > ESCAPE_CHAOTIC:
+                # escape: lompat ke solusi acak di sekitar current
+                current = perturb_chromosome(current, 1 + int(avg_cycle / 2))
+                current_fitness = fitness(current)
+                visited.clear()
+                chaotic = 0
+                escapes += 1
 
         # update best global
         if current_fitness < best["fitness"]:
             best["chrom"] = current[:]
             best["fitness"] = current_fitness
             no_improve = 0
+            trace.append((
+                time.perf_counter() - start_time,
+                FITNESS_EVALS - evals_start,
+                best["fitness"],
+            ))
+            if on_improve is not None:
+                on_improve(best["chrom"], best["fitness"])
         else:
             no_improve += 1
 
+        iters_done = it
+
         if log_every and it % log_every == 0:
             print(
                 f"Iter {it}: current = {current_fitness:.2f}, "
@@ -197,10 +391,229 @@ def tabu_search(
                 f"no_improve = {no_improve}"
             )
 
+        if on_checkpoint is not None and checkpoint.due(last_checkpoint, checkpoint_every_sec):
+            on_checkpoint({
+                "iteration": iters_done,
+                "current": current,
+                "current_fitness": current_fitness,
+                "best": best,
+                "trace": trace,
+                "tabu_until": tabu_until,
+                "tenure": tenure,
+                "visited": visited,
+                "freq": freq,
+                "avg_cycle": avg_cycle,
+                "last_tenure_change": last_tenure_change,
+                "chaotic": chaotic,
+                "escapes": escapes,
+                "no_improve": no_improve,
+                "elapsed": time.perf_counter() - start_time,
+                "evals": FITNESS_EVALS - evals_start,
+                "rng": random.getstate(),
+            })
+            last_checkpoint = time.perf_counter()
+
     print(
         f"[Tabu] Selesai di iter {it}, best fitness = {best['fitness']:.2f}, "
-        f"no_improve = {no_improve}"
+        f"no_improve = {no_improve}, tenure = {tenure:.1f}, escapes = {escapes}"
     )
+    best["trace"] = trace
+    best["iters"] = iters_done
+    best["elapsed"] = time.perf_counter() - start_time
+    best["evals"] = FITNESS_EVALS - evals_start
+    return best
+
+
+# --------------------------------------------------------------------
+# Streaming incumbent (generator)
+# --------------------------------------------------------------------
+def iter_incumbents(
+    deadline: Optional[float] = None,
+    cancel=None,
+    **kwargs,
+) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
+    """
+    Versi generator tabu_search(**kwargs): yield dict "routes", "chrom",
+    "cost", "elapsed", "evals" setiap ada best global baru. Berhenti
+    lebih awal kalau time.perf_counter() >= deadline, cancel.is_set(),
+    atau pemanggil berhenti mengiterasi. Return value generator = hasil
+    tabu_search.
+    """
+    start = time.perf_counter()
+    evals_start = FITNESS_EVALS
+
+    def make_item(chrom, cost):
+        return {
+            "routes": decode_routes(chrom),
+            "chrom": chrom[:],
+            "cost": cost,
+            "elapsed": time.perf_counter() - start,
+            "evals": FITNESS_EVALS - evals_start,
+        }
+
+    def solve(on_improve, should_stop):
+        return tabu_search(on_improve=on_improve, should_stop=should_stop, **kwargs)
+
+    return (yield from incumbents.stream(solve, make_item, deadline, cancel))
+
+
+# --------------------------------------------------------------------
+# Elite pool & path relinking
+# --------------------------------------------------------------------
+def permutation_distance(a: List[int], b: List[int]) -> int:
+    """Jumlah posisi yang berbeda antara dua kromosom."""
+    return sum(1 for x, y in zip(a, b) if x != y)
+
+
+def update_elite_pool(pool: List[Dict[str, Any]], chrom: List[int], fit: float, size: int) -> bool:
+    """
+    Masukkan solusi ke elite pool (terurut fitness, maks. size anggota).
+    Duplikat ditolak; kalau pool penuh, solusi harus lebih baik dari anggota
+    terburuk dan menggantikan anggota lebih buruk yang paling mirip
+    (menjaga diversity pool). Return True kalau masuk.
+    """
+    if size <= 0 or any(e["chrom"] == chrom for e in pool):
+        return False
+    if len(pool) >= size:
+        worse = [e for e in pool if e["fitness"] > fit]
+        if not worse:
+            return False
+        pool.remove(min(worse, key=lambda e: permutation_distance(e["chrom"], chrom)))
+    pool.append({"chrom": chrom[:], "fitness": fit})
+    pool.sort(key=lambda e: e["fitness"])
+    return True
+
+
+def decode_prefix(chromosome: List[int]) -> Dict[str, Any]:
+    """
+    State decode greedy setelah setiap posisi t: load rute yang sedang
+    terbuka dan jarak kumulatif sampai customer ke-t. Dipakai swap_fitness
+    untuk evaluasi swap tanpa decode ulang dari awal.
+    """
+    loads = [0.0] * len(chromosome)
+    costs = [0.0] * len(chromosome)
+    load = 0.0
+    cost = 0.0
+    prev = DEPOT
+    for t, cust in enumerate(chromosome):
+        demand = DEMAND[cust]
+        if load + demand > CAPACITY and prev != DEPOT:
+            cost += DIST[prev][DEPOT] + DIST[DEPOT][cust]
+            load = demand
+        else:
+            cost += DIST[prev][cust]
+            load += demand
+        prev = cust
+        loads[t] = load
+        costs[t] = cost
+    total = cost + DIST[prev][DEPOT] if chromosome else 0.0
+    # overload hanya mungkin di rute 1 customer (demand > kapasitas) → konstan
+    overload = sum(max(0.0, DEMAND[c] - CAPACITY) for c in chromosome)
+    return {"load": loads, "cost": costs, "total": total, "penalty": 1000.0 * overload}
+
+
+def swap_fitness(chromosome: List[int], prefix: Dict[str, Any], i: int, j: int) -> float:
+    """
+    Fitness kromosom setelah swap posisi i < j, dihitung dari state prefix:
+    decode dilanjutkan dari posisi i dan berhenti begitu state (load rute
+    terbuka, customer terakhir) kembali sama dengan decode asal setelah j;
+    sisanya diambil dari jarak kumulatif yang di-cache.
+    """
+    global FITNESS_EVALS
+    FITNESS_EVALS += 1
+    loads, costs = prefix["load"], prefix["cost"]
+    if i > 0:
+        load, cost, prev = loads[i - 1], costs[i - 1], chromosome[i - 1]
+    else:
+        load, cost, prev = 0.0, 0.0, DEPOT
+    for t in range(i, len(chromosome)):
+        if t == i:
+            cust = chromosome[j]
+        elif t == j:
+            cust = chromosome[i]
+        else:
+            cust = chromosome[t]
+        demand = DEMAND[cust]
+        if load + demand > CAPACITY and prev != DEPOT:
+            cost += DIST[prev][DEPOT] + DIST[DEPOT][cust]
+            load = demand
+        else:
+            cost += DIST[prev][cust]
+            load += demand
+        prev = cust
+        if t > j and load == loads[t]:
+            return cost + (prefix["total"] - costs[t]) + prefix["penalty"]
+    return cost + DIST[prev][DEPOT] + prefix["penalty"]
+
+
+@timed("local_search")
+def path_relinking(
+    source: List[int],
+    target: List[int],
+    deadline: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Jalan dari source ke target: setiap langkah memilih swap terbaik yang
+    menaruh customer target[i] di posisi i yang masih berbeda (setiap
+    langkah memperbaiki ≥ 1 posisi), dievaluasi dengan swap_fitness.
+    Return solusi antara terbaik {"chrom", "fitness"} (tanpa kedua ujung),
+    atau None kalau jarak terlalu dekat / waktu habis sebelum ada langkah.
+    """
+    current = source[:]
+    pos = {c: t for t, c in enumerate(current)}
+    diff = [t for t in range(len(current)) if current[t] != target[t]]
+    best = None
+
+    while len(diff) > 2:  # ≤ 2 posisi berbeda → satu swap lagi = target
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        prefix = decode_prefix(current)
+        best_move = None
+        best_f = float("inf")
+        for i in diff:
+            j = pos[target[i]]
+            f = swap_fitness(current, prefix, min(i, j), max(i, j))
+            if f < best_f:
+                best_f = f
+                best_move = (i, j)
+
+        i, j = best_move
+        current[i], current[j] = current[j], current[i]
+        pos[current[i]] = i
+        pos[current[j]] = j
+        diff = [t for t in diff if current[t] != target[t]]
+
+        f = fitness(current)
+        if best is None or f < best["fitness"]:
+            best = {"chrom": current[:], "fitness": f}
+
+    return best
+
+
+def relink_elite(
+    pool: List[Dict[str, Any]],
+    guide: Dict[str, Any],
+    time_limit_sec: float,
+) -> Optional[Dict[str, Any]]:
+    """
+    Path relinking dua arah antara guide dan setiap anggota elite pool
+    (terbaik dulu) dalam batas time_limit_sec. Solusi antara yang bagus ikut
+    masuk pool. Return solusi relinking terbaik atau None.
+    """
+    deadline = time.perf_counter() + time_limit_sec
+    best = None
+    for elite in list(pool):
+        if elite["chrom"] == guide["chrom"]:
+            continue
+        for source, target in ((guide["chrom"], elite["chrom"]), (elite["chrom"], guide["chrom"])):
+            if time.perf_counter() >= deadline:
+                return best
+            res = path_relinking(source, target, deadline)
+            if res is None:
+                continue
+            update_elite_pool(pool, res["chrom"], res["fitness"], len(pool))
+            if best is None or res["fitness"] < best["fitness"]:
+                best = res
     return best
 
 
@@ -270,23 +683,144 @@ def analyze_solution(chromosome: List[int]):
 # --------------------------------------------------------------------
 # Multi-run untuk statistik Tabu Search
 # --------------------------------------------------------------------
-def multi_run_tabu(num_runs: int = 5, time_limit_sec: Optional[float] = None, **ts_kwargs):
+def multi_run_tabu(
+    num_runs: int = 5,
+    time_limit_sec: Optional[float] = None,
+    elite_size: int = 0,
+    relink_time_sec: float = 2.0,
+    relink_restart: bool = True,
+    checkpoint_file: Optional[str] = None,
+    resume: bool = False,
+    checkpoint_every_sec: float = checkpoint.CHECKPOINT_EVERY_SEC,
+    **ts_kwargs,
+):
     """
     Jalankan Tabu Search berkali-kali (dengan seed berbeda) untuk lihat:
     - best fitness per run
     - best overall
 
-    time_limit_sec: batas waktu per run, diteruskan ke tabu_search
+    time_limit_sec: batas waktu per run, termasuk fase relinking (run yang
+    diikuti relinking memberi tabu_search time_limit_sec - relink_time_sec,
+    relink_time_sec maks. setengah time_limit_sec)
+    elite_size > 0: best setiap run masuk elite pool; setelah run kedua dst.
+    best run tersebut di-relink dengan anggota pool (path relinking, maks.
+    relink_time_sec per fase, dipotong di sisa waktu run). Hasil relinking yang lebih baik dihitung
+    sebagai hasil run itu, dan dengan relink_restart run berikutnya mulai
+    dari solusi relinking terbaik (bukan titik awal random/konstruktif).
+    checkpoint_file / resume / checkpoint_every_sec: seperti multi_run GA
+    (lihat checkpoint.py).
+
+    Dengan warm-start (seed_with), run pertama mulai dari solusi konstruktif
+    apa adanya; run berikutnya dari salinan terperturbasi (Tabu deterministik,
+    jadi tanpa perturbasi semua run akan identik).
     """
+    global FITNESS_EVALS
     best_overall = None
     fitnesses = []
-
-    for r in range(num_runs):
+    run_traces = []
+    total_iters = 0
+    first_run = 0
+    resumed_sec = 0.0
+    evals_start = FITNESS_EVALS
+    elite_pool: List[Dict[str, Any]] = []
+    restart_chrom = None
+
+    inst_hash = results_store.file_hash(INSTANCE_FILE)
+    p_hash = results_store.params_hash({
+        "num_runs": num_runs,
+        "time_limit_sec": time_limit_sec,
+        "elite_size": elite_size,
+        "relink_time_sec": relink_time_sec,
+        "relink_restart": relink_restart,
+        **{k: v for k, v in ts_kwargs.items() if k != "log_every"},
+    })
+    state = None
+    if checkpoint_file and resume:
+        state = checkpoint.load_for_resume(checkpoint_file, "tabu", inst_hash, p_hash)
+    if state is not None:
+        print(f"[Tabu] Resume dari {checkpoint_file}: run {state['next_run'] + 1}/{num_runs}")
+        best_overall = state["best_overall"]
+        fitnesses = state["fitnesses"]
+        run_traces = state["run_traces"]
+        total_iters = state["total_iters"]
+        first_run = state["next_run"]
+        resumed_sec = state["elapsed"]
+        elite_pool = state["elite_pool"]
+        restart_chrom = state["restart_chrom"]
+        FITNESS_EVALS += state["evals"]
+    run_start = time.perf_counter() - resumed_sec
+
+    def write_checkpoint(next_run: int, run_state: Optional[Dict[str, Any]]):
+        checkpoint.save(checkpoint_file, {
+            "solver": "tabu",
+            "instance_hash": inst_hash,
+            "params_hash": p_hash,
+            "next_run": next_run,
+            "run_state": run_state,
+            "best_overall": best_overall,
+            "fitnesses": fitnesses,
+            "run_traces": run_traces,
+            "total_iters": total_iters,
+            "elite_pool": elite_pool,
+            "restart_chrom": restart_chrom,
+            "evals": FITNESS_EVALS - evals_start,
+            "elapsed": time.perf_counter() - run_start,
+        })
+        if checkpoint.STOP_REQUESTED:
+            checkpoint.exit_preempted(checkpoint_file)
+
+    for r in range(first_run, num_runs):
         seed = 200 + r
-        random.seed(seed)
+        run_state = state["run_state"] if state is not None and r == first_run else None
+        if run_state is None:
+            random.seed(seed)
         print(f"\n=== TABU RUN {r+1}/{num_runs} (seed={seed}) ===")
-        best = tabu_search(time_limit_sec=time_limit_sec, **ts_kwargs)
+        run_kwargs = dict(ts_kwargs)
+        if run_kwargs.get("seed_with") and r > 0:
+            run_kwargs.setdefault("seed_perturb", 3)
+        if restart_chrom is not None:
+            run_kwargs["initial_chrom"] = restart_chrom
+        # relinking (pool sudah berisi) memakai bagian dari budget run ini,
+        # supaya satu run tetap time_limit_sec (fairness vs GA & OR-Tools)
+        ts_limit = time_limit_sec
+        if time_limit_sec is not None and elite_size > 0 and elite_pool:
+            ts_limit = time_limit_sec - min(relink_time_sec, 0.5 * time_limit_sec)
+        best = tabu_search(
+            time_limit_sec=ts_limit,
+            resume_state=run_state,
+            on_checkpoint=(lambda s, r=r: write_checkpoint(r, s)) if checkpoint_file else None,
+            checkpoint_every_sec=checkpoint_every_sec,
+            **run_kwargs,
+        )
+
+        if elite_size > 0:
+            update_elite_pool(elite_pool, best["chrom"], best["fitness"], elite_size)
+            restart_chrom = None
+            relink_budget = relink_time_sec
+            if time_limit_sec is not None:
+                # best["elapsed"] termasuk waktu sebelum checkpoint kalau di-resume
+                relink_budget = min(relink_budget, time_limit_sec - best["elapsed"])
+            if len(elite_pool) >= 2 and relink_budget > 0:
+                relink_start = time.perf_counter()
+                relink_evals = FITNESS_EVALS
+                relinked = relink_elite(elite_pool, best, relink_budget)
+                if relinked is not None:
+                    print(f"[Tabu] Path relinking: best = {relinked['fitness']:.2f} (pool {len(elite_pool)})")
+                    if relinked["fitness"] < best["fitness"]:
+                        best["chrom"] = relinked["chrom"]
+                        best["fitness"] = relinked["fitness"]
+                        # titik trace relatif terhadap awal run (fase relinking = bagian run ini)
+                        best["trace"].append((
+                            best["elapsed"] + time.perf_counter() - relink_start,
+                            best["evals"] + FITNESS_EVALS - relink_evals,
+                            best["fitness"],
+                        ))
+                    if relink_restart:
+                        restart_chrom = relinked["chrom"]
+
         fitnesses.append(best["fitness"])
+        run_traces.append({"run": r + 1, "seed": seed, "trace": best["trace"]})
+        total_iters += best["iters"]
 
         if best_overall is None or best["fitness"] < best_overall["fitness"]:
             best_overall = {
@@ -296,6 +830,17 @@ def multi_run_tabu(num_runs: int = 5, time_limit_sec: Optional[float] = None, **
                 "run": r + 1,
             }
 
+        if checkpoint_file:
+            write_checkpoint(r + 1, None)
+
+    if checkpoint_file:
+        checkpoint.remove(checkpoint_file)
+
+    # convergence trace semua run (untuk <basename>_tabu_trace.csv)
+    best_overall["traces"] = run_traces
+    best_overall["iterations"] = total_iters
+    best_overall["resumed_sec"] = resumed_sec
+
     print("\n=== TABU SUMMARY (PER RUN) ===")
     print("Instance:", INSTANCE_FILE)
     print("Best fitness per run:", fitnesses)
@@ -307,39 +852,282 @@ def multi_run_tabu(num_runs: int = 5, time_limit_sec: Optional[float] = None, **
     return best_overall, fitnesses
 
 
+# --------------------------------------------------------------------
+# Cooperative multi-start (paralel, elite pool di shared memory)
+# --------------------------------------------------------------------
+# tenure per worker = tabu_tenure × faktor (round-robin) → worker beragam
+COOP_TENURE_FACTORS = (1.0, 1.5, 0.7, 2.0)
+
+
+def make_shared_pool(size: int, num_customers: int):
+    """Elite pool di shared memory: size slot (cost, kromosom) + lock."""
+    return {
+        "lock": mp.Lock(),
+        "size": size,
+        "costs": mp.Array("d", [float("inf")] * size, lock=False),
+        "chroms": mp.Array("i", size * num_customers, lock=False),
+        "version": mp.Value("i", 0, lock=False),
+    }
+
+
+def pool_publish(pool, chrom: List[int], cost: float) -> bool:
+    """Masukkan solusi ke slot terburuk kalau lebih baik dan bukan duplikat."""
+    n = len(chrom)
+    costs = pool["costs"]
+    if cost >= max(costs[:]):  # cek cepat tanpa lock
+        return False
+    with pool["lock"]:
+        worst = max(range(pool["size"]), key=lambda k: costs[k])
+        if cost >= costs[worst]:
+            return False
+        for k in range(pool["size"]):
+            if costs[k] == cost and pool["chroms"][k * n:(k + 1) * n] == chrom:
+                return False
+        pool["chroms"][worst * n:(worst + 1) * n] = chrom
+        costs[worst] = cost
+        pool["version"].value += 1
+    return True
+
+
+def pool_snapshot(pool, num_customers: int) -> List[Dict[str, Any]]:
+    """Anggota pool yang terisi, terurut fitness."""
+    with pool["lock"]:
+        members = [
+            {"chrom": list(pool["chroms"][k * num_customers:(k + 1) * num_customers]),
+             "fitness": pool["costs"][k]}
+            for k in range(pool["size"]) if pool["costs"][k] < float("inf")
+        ]
+    return sorted(members, key=lambda e: e["fitness"])
+
+
+def _coop_worker(worker_idx: int, pool, results, deadline: float, seed: int,
+                 perturb_strength: int, ts_kwargs: Dict[str, Any]):
+    timing.pin_cpus(worker_idx)
+    random.seed(seed)
+    start = time.time()
+    evals_start = FITNESS_EVALS
+    best = None
+    trace = []
+    total_iters = 0
+    restarts = 0
+
+    def on_improve(chrom, cost):
+        nonlocal best
+        pool_publish(pool, chrom, cost)
+        if best is None or cost < best["fitness"]:
+            best = {"chrom": chrom[:], "fitness": cost}
+            trace.append((time.time() - start, FITNESS_EVALS - evals_start, cost))
+
+    def should_stop():
+        return time.time() >= deadline
+
+    chrom = None  # run pertama: titik awal random / konstruktif
+    while not should_stop():
+        res = tabu_search(
+            time_limit_sec=deadline - time.time(),
+            initial_chrom=chrom,
+            log_every=0,
+            on_improve=on_improve,
+            should_stop=should_stop,
+            **ts_kwargs,
+        )
+        total_iters += res["iters"]
+        if should_stop():
+            break
+        # stagnan (max_no_improve / max_iters): restart dari elite terperturbasi,
+        # elite dipilih acak dengan bias ke yang terbaik
+        elites = pool_snapshot(pool, len(CUSTOMERS))
+        elite = elites[int(len(elites) * random.random() ** 2)] if elites else res
+        chrom = perturb_chromosome(elite["chrom"], perturb_strength)
+        restarts += 1
+
+    # deadline sudah lewat sebelum search pertama melaporkan solusi:
+    # chrom None, dilewati oleh cooperative_tabu
+    results.put({
+        "worker": worker_idx,
+        "seed": seed,
+        "tabu_tenure": ts_kwargs.get("tabu_tenure"),
+        "chrom": best["chrom"] if best else None,
+        "fitness": best["fitness"] if best else float("inf"),
+        "trace": trace,
+        "iters": total_iters,
+        "evals": FITNESS_EVALS - evals_start,
+        "restarts": restarts,
+    })
+
+
+def cooperative_tabu(
+    num_workers: int = 4,
+    time_limit_sec: float = 10.0,
+    elite_size: int = 5,
+    tabu_tenure: int = 10,
+    perturb_strength: int = 5,
+    base_seed: int = 200,
+    grace_sec: float = 5.0,
+    **ts_kwargs,
+):
+    """
+    Cooperative multi-start Tabu: num_workers proses jalan bersamaan selama
+    time_limit_sec (wall), masing-masing dengan seed dan tenure berbeda
+    (tabu_tenure × COOP_TENURE_FACTORS). Setiap best baru worker langsung
+    dipublikasikan ke elite pool bersama (shared memory); worker yang
+    stagnan (tabu_search berhenti karena max_no_improve / max_iters) restart
+    dari anggota pool yang diperturbasi perturb_strength swap.
+
+    Return (best_overall, fitnesses) dengan bentuk sama seperti
+    multi_run_tabu; satu "run" = satu worker. Worker yang tidak sempat
+    menemukan solusi sebelum deadline tidak ikut di fitnesses.
+    """
+    global FITNESS_EVALS
+    pool = make_shared_pool(elite_size, len(CUSTOMERS))
+    results = mp.Queue()
+    deadline = time.time() + time_limit_sec
+
+    workers = []
+    for idx in range(num_workers):
+        kwargs = dict(ts_kwargs)
+        kwargs["tabu_tenure"] = max(1, round(tabu_tenure * COOP_TENURE_FACTORS[idx % len(COOP_TENURE_FACTORS)]))
+        if kwargs.get("seed_with") and idx > 0:
+            kwargs.setdefault("seed_perturb", 3)
+        p = mp.Process(
+            target=_coop_worker,
+            args=(idx, pool, results, deadline, base_seed + idx, perturb_strength, kwargs),
+            daemon=True,
+        )
+        p.start()
+        workers.append(p)
+
+    # hasil diambil sebelum join (queue besar bisa memblokir proses anak)
+    outputs = []
+    while len(outputs) < num_workers:
+        try:
+            outputs.append(results.get(timeout=max(0.1, deadline + grace_sec - time.time())))
+        except queue.Empty:
+            break
+    for p in workers:
+        p.join(timeout=grace_sec)
+        if p.is_alive():
+            p.terminate()
+            p.join()
+    FITNESS_EVALS += sum(o["evals"] for o in outputs)
+    for o in outputs:
+        if o["chrom"] is None:
+            print(f"[Tabu] Worker {o['worker'] + 1}: tidak ada solusi sebelum deadline, dilewati")
+    outputs = sorted((o for o in outputs if o["chrom"] is not None), key=lambda o: o["worker"])
+    if not outputs:
+        raise RuntimeError("Tidak ada worker Tabu yang mengembalikan hasil")
+
+    for o in outputs:
+        print(
+            f"[Tabu] Worker {o['worker'] + 1}: best = {o['fitness']:.2f}, tenure = {o['tabu_tenure']}, "
+            f"iters = {o['iters']}, restarts = {o['restarts']}"
+        )
+
+    winner = min(outputs, key=lambda o: o["fitness"])
+    best_overall = {
+        "chrom": winner["chrom"],
+        "fitness": winner["fitness"],
+        "seed": winner["seed"],
+        "run": winner["worker"] + 1,
+        "traces": [{"run": o["worker"] + 1, "seed": o["seed"], "trace": o["trace"]} for o in outputs],
+        "iterations": sum(o["iters"] for o in outputs),
+        "resumed_sec": 0.0,
+    }
+    return best_overall, [o["fitness"] for o in outputs]
+
+
 # --------------------------------------------------------------------
 # Entry point
 # --------------------------------------------------------------------
 if __name__ == "__main__":
+    profiling.maybe_start(INSTANCE_FILE, "tabu")
+    timing.pin_cpus()
     print(f"Using instance file: {INSTANCE_FILE}")
 
     # --- berapa kali mau di-run (num_runs) dari CLI ---
     # Contoh: python tabu_vrp.py 1_FaridFajar.vrp 5
-    NUM_RUNS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    NUM_RUNS = int(ARGS[2]) if len(ARGS) > 2 else 5
     print(f"Number of Tabu Search runs: {NUM_RUNS}")
 
+    # --- warm-start opsional: python tabu_vrp.py <file> <runs> greedy,savings ---
+    SEED_WITH = parse_seed_with(ARGS[3] if len(ARGS) > 3 else None)
+    print(f"Warm-start seeds: {SEED_WITH or 'none (random)'}")
+
     # --- batas waktu per run (fairness vs GA & OR-Tools) ---
     TIME_LIMIT_PER_RUN = 10.0  # detik; samakan dengan GA & OR-Tools
     print(f"Time limit per Tabu run: {TIME_LIMIT_PER_RUN} seconds")
 
-    # --- ukur waktu eksekusi multi_run_tabu ---
+    # --- mode kooperatif paralel opsional: --workers[=N] (default N = jumlah CPU) ---
+    WORKERS = 1
+    for arg in sys.argv[1:]:
+        name, _, value = arg.partition("=")
+        if name == "--workers":
+            WORKERS = int(value) if value else (os.cpu_count() or 1)
+    if WORKERS > 1:
+        NUM_RUNS = WORKERS  # satu "run" = satu worker, semua jalan bersamaan
+        print(f"Cooperative mode: {WORKERS} workers, {TIME_LIMIT_PER_RUN} s wall time total")
+
+    # --- checkpoint / resume opsional: --checkpoint[=path], --resume[=path] ---
+    CHECKPOINT = checkpoint.checkpoint_options(INSTANCE_FILE, "tabu")
+    if CHECKPOINT["path"] and WORKERS > 1:
+        print("Checkpoint tidak didukung di mode --workers, diabaikan")
+    elif CHECKPOINT["path"]:
+        checkpoint.install_stop_handler()
+        print(f"Checkpoint: {CHECKPOINT['path']} (setiap {CHECKPOINT['every_sec']:g} s)")
+
+    # --- ukur waktu eksekusi multi_run_tabu / cooperative_tabu ---
+    STARTED_AT = datetime.now().isoformat(timespec="seconds")
+    evals_before = FITNESS_EVALS
     start_time = time.perf_counter()
 
-    best_overall, fitnesses = multi_run_tabu(
-        num_runs=NUM_RUNS,
-        max_iters=500,
-        tabu_tenure=10,
-        max_no_improve=150,
-        log_every=50,
-        time_limit_sec=TIME_LIMIT_PER_RUN,
-    )
+    # parameter Tabu (juga disimpan di results store sebagai params)
+    TABU_PARAMS = {
+        "max_iters": 500,
+        "tabu_tenure": 10,
+        "max_no_improve": 150,
+        "time_limit_sec": TIME_LIMIT_PER_RUN,
+        "seed_with": SEED_WITH,
+        "elite_size": 5,
+        "relink_time_sec": 2.0,
+        "relink_restart": True,
+    }
 
-    end_time = time.perf_counter()
-    total_time_sec = end_time - start_time
-    avg_time_per_run_sec = total_time_sec / NUM_RUNS
+    with timing.phase("solve"):
+        if WORKERS > 1:
+            TABU_PARAMS["workers"] = WORKERS
+            best_overall, fitnesses = cooperative_tabu(
+                num_workers=WORKERS,
+                **{k: v for k, v in TABU_PARAMS.items()
+                   if k not in ("workers", "relink_time_sec", "relink_restart")},
+            )
+        else:
+            best_overall, fitnesses = multi_run_tabu(
+                num_runs=NUM_RUNS,
+                log_every=50,
+                checkpoint_file=CHECKPOINT["path"],
+                resume=CHECKPOINT["resume"],
+                checkpoint_every_sec=CHECKPOINT["every_sec"],
+                **TABU_PARAMS,
+            )
 
-    print(f"\nTotal execution time (multi_run_tabu): {total_time_sec:.4f} s")
-    print(f"Average time per run                 : {avg_time_per_run_sec:.4f} s")
+    end_time = time.perf_counter()
+    timing.start("report")
+    # termasuk waktu proses sebelumnya kalau di-resume dari checkpoint
+    total_time_sec = end_time - start_time + best_overall["resumed_sec"]
+    if WORKERS > 1:
+        # semua worker jalan bersamaan: rata-rata per run tidak bermakna
+        avg_time_str = "-"
+        print(f"\nTotal wall time (cooperative_tabu, {WORKERS} workers): {total_time_sec:.4f} s")
+    else:
+        avg_time_str = f"{total_time_sec / NUM_RUNS:.4f}"
+        print(f"\nTotal execution time (multi_run_tabu): {total_time_sec:.4f} s")
+        print(f"Average time per run                 : {avg_time_str} s")
+
+    # --- instrumentasi: evals, throughput, iterasi, time split ---
+    instr_fields = instrument.summary_fields(
+        FITNESS_EVALS - evals_before, best_overall["iterations"], total_time_sec
+    )
+    print(f"Fitness evals: {instr_fields[0]} ({instr_fields[1]} evals/s), iterations: {instr_fields[2]}")
 
     print("\n=== TABU BEST OVERALL SOLUTION ===")
     print("Instance:", INSTANCE_FILE)
@@ -351,7 +1139,7 @@ if __name__ == "__main__":
 
     # ---------- RINGKASAN SATU BARIS (TABU_SUMMARY) ----------
     best_cost = best_overall["fitness"]
-    avg_cost = sum(fitnesses) / NUM_RUNS
+    avg_cost = sum(fitnesses) / len(fitnesses)
     worst_cost = max(fitnesses)
     best_run = best_overall["run"]
     best_seed = best_overall["seed"]
@@ -385,7 +1173,8 @@ if __name__ == "__main__":
         f"{best_route_str}|"
         f"{chrom_str}|"
         f"{total_time_sec:.4f}|"
-        f"{avg_time_per_run_sec:.4f}"
+        f"{avg_time_str}|"
+        + "|".join(instr_fields)
     )
 
     print("\n" + line_text)
@@ -393,7 +1182,6 @@ if __name__ == "__main__":
     # ---------- SIMPAN KE FILE <basename>_tabu_summary.csv ----------
     base_name = os.path.splitext(os.path.basename(INSTANCE_FILE))[0]
     summary_file = f"{base_name}_tabu_summary.csv"
-    file_exists = os.path.exists(summary_file)
 
     header = [
         "instance_file",
@@ -412,7 +1200,7 @@ if __name__ == "__main__":
         "chromosome",
         "total_time_sec",
         "avg_time_per_run_sec",
-    ]
+    ] + instrument.SUMMARY_HEADER
 
     row = [
         INSTANCE_FILE,
@@ -430,15 +1218,22 @@ if __name__ == "__main__":
         best_route_str,
         chrom_str,
         f"{total_time_sec:.4f}",
-        f"{avg_time_per_run_sec:.4f}",
-    ]
+        avg_time_str,
+    ] + instr_fields
+
+    results_store.save_result(
+        INSTANCE_FILE, "tabu", dict(TABU_PARAMS, num_runs=NUM_RUNS), header, row,
+        best_overall["traces"], STARTED_AT, summary_file,
+    )
 
-    with open(summary_file, "a", newline="") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(header)
-        writer.writerow(row)
+    # ---------- CONVERGENCE TRACE <basename>_tabu_trace.csv ----------
+    append_trace_csv(
+        f"{base_name}_tabu_trace.csv", INSTANCE_FILE, "Tabu", STARTED_AT, best_overall["traces"]
+    )
 
     # ---------- PLOT RUTE TERBAIK ----------
     plot_filename = f"{base_name}_tabu_route.png"
     plot_routes(routes, f"Tabu Search Best Route - {INSTANCE_FILE}", plot_filename)
+
+    timing.stop("report")
+    print(timing.timing_line("Tabu", INSTANCE_FILE))
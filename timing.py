@@ -0,0 +1,137 @@
+"""
+timing.py
+
+Timing harness per fase untuk setiap entry point solver:
+
+- setup  : parse instance (+ build model OR-Tools)
+- solve  : hanya pemanggilan solver (multi-run)
+- report : ringkasan, CSV, trace, dan plot
+
+Setiap fase mencatat wall time (perf_counter) dan CPU time proses
+(process_time + CPU child process yang sudah di-join, mis. worker
+portfolio/race). Di akhir, solver mencetak:
+
+    TIMING|<solver>|<instance>|setup_wall|setup_cpu|solve_wall|solve_cpu|report_wall|report_cpu|solve_repeats
+
+Solver yang sangat singkat (Greedy) diulang lewat repeat_solve() sampai
+minimal MIN_SOLVE_SEC; angka solve dilaporkan per eksekusi.
+
+CPU pinning opsional lewat environment variable CVRP_PIN_CPUS (mis. "0" atau
+"2,3"); worker paralel di-pin round-robin ke CPU di daftar itu.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PHASES = ("setup", "solve", "report")
+TIMING_HEADER = [
+    "setup_wall_sec",
+    "setup_cpu_sec",
+    "solve_wall_sec",
+    "solve_cpu_sec",
+    "report_wall_sec",
+    "report_cpu_sec",
+    "solve_repeats",
+]
+
+MIN_SOLVE_SEC = 0.2     # total minimal untuk solver singkat (repeat_solve)
+MAX_SOLVE_REPEATS = 100000
+
+WALL: Dict[str, float] = {}
+CPU: Dict[str, float] = {}
+SOLVE_REPEATS = 1
+
+_started: Dict[str, Tuple[float, float]] = {}
+
+
+def cpu_time() -> float:
+    """CPU time proses ini + child process yang sudah selesai."""
+    if resource is not None:
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return time.process_time() + children.ru_utime + children.ru_stime
+    t = os.times()  # Windows: tanpa resource, CPU child tidak tersedia
+    return time.process_time() + t.children_user + t.children_system
+
+
+def start(name: str):
+    _started[name] = (time.perf_counter(), cpu_time())
+
+
+def stop(name: str):
+    w0, c0 = _started.pop(name)
+    WALL[name] = WALL.get(name, 0.0) + (time.perf_counter() - w0)
+    CPU[name] = CPU.get(name, 0.0) + (cpu_time() - c0)
+
+
+@contextmanager
+def phase(name: str):
+    start(name)
+    try:
+        yield
+    finally:
+        stop(name)
+
+
+def repeat_solve(fn: Callable[[], object], min_total_sec: float = MIN_SOLVE_SEC):
+    """
+    Jalankan fn berulang sampai total wall >= min_total_sec (minimal sekali).
+    Fase solve dicatat per eksekusi (total / jumlah ulangan).
+    Return hasil eksekusi pertama.
+    """
+    global SOLVE_REPEATS
+    w0, c0 = time.perf_counter(), cpu_time()
+    result = fn()
+    reps = 1
+    while time.perf_counter() - w0 < min_total_sec and reps < MAX_SOLVE_REPEATS:
+        fn()
+        reps += 1
+    WALL["solve"] = WALL.get("solve", 0.0) + (time.perf_counter() - w0) / reps
+    CPU["solve"] = CPU.get("solve", 0.0) + (cpu_time() - c0) / reps
+    SOLVE_REPEATS = reps
+    return result
+
+
+def timing_fields() -> List[str]:
+    fields = []
+    for name in PHASES:
+        if name in WALL:
+            fields += [f"{WALL[name]:.6f}", f"{CPU[name]:.6f}"]
+        else:
+            fields += ["-", "-"]
+    return fields + [str(SOLVE_REPEATS)]
+
+
+def timing_line(solver: str, instance_file: str) -> str:
+    return "TIMING|" + f"{solver}|{instance_file}|" + "|".join(timing_fields())
+
+
+# --------------------------------------------------------------------
+# CPU pinning
+# --------------------------------------------------------------------
+def pinned_cpus() -> Optional[List[int]]:
+    value = os.environ.get("CVRP_PIN_CPUS", "").strip()
+    if not value:
+        return None
+    return [int(c) for c in value.split(",") if c.strip()]
+
+
+def pin_cpus(worker_idx: Optional[int] = None) -> Optional[List[int]]:
+    """
+    Pin proses ini ke CPU di CVRP_PIN_CPUS (semua, atau satu CPU round-robin
+    untuk worker_idx). Tidak melakukan apa-apa jika env tidak di-set atau OS
+    tidak mendukung sched_setaffinity. Return CPU yang dipakai.
+    """
+    cpus = pinned_cpus()
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return None
+    if worker_idx is not None:
+        cpus = [cpus[worker_idx % len(cpus)]]
+    os.sched_setaffinity(0, cpus)
+    return cpus